@@ -55,7 +55,9 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
           url: request.url,
           title: request.title,
           level: request.level || 'AAA',
-          screenshot: request.screenshot || null
+          screenshot: request.screenshot || null,
+          image_boxes: request.imageBoxes || null,
+          device_pixel_ratio: request.devicePixelRatio || 1
         }),
         signal: controller.signal
       })
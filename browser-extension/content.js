@@ -18,7 +18,9 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
         html: htmlContent,
         title: pageTitle,
         url: pageUrl,
-        clientChecks: clientChecks
+        clientChecks: clientChecks,
+        imageBoxes: collectImageBoxes(),
+        devicePixelRatio: window.devicePixelRatio || 1
       });
     } catch (error) {
       sendResponse({
@@ -30,6 +32,28 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
   }
 });
 
+// Bounding boxes of every <img>, in CSS pixels from the top-left of the page.
+// The screenshot is captured scrolled to the top, so the backend can crop
+// visible images out of it instead of downloading them again.
+function collectImageBoxes() {
+  const boxes = [];
+  document.querySelectorAll('img').forEach((img, index) => {
+    const rect = img.getBoundingClientRect();
+    if (rect.width === 0 || rect.height === 0) {
+      return;
+    }
+    boxes.push({
+      index: index,
+      src: img.getAttribute('src'),
+      x: rect.left + window.scrollX,
+      y: rect.top + window.scrollY,
+      width: rect.width,
+      height: rect.height
+    });
+  });
+  return boxes;
+}
+
 function performClientSideChecks() {
   const issues = {
     images: [],
@@ -115,6 +115,19 @@ document.addEventListener('DOMContentLoaded', async function() {
         // Display client-side check results
         displayQuickChecks(response.clientChecks);
         
+        // Capture a clean screenshot BEFORE highlighting: the backend crops
+        // images out of it for captioning, so it must not carry the overlays
+        statusDiv.textContent = '📸 Capturing page screenshot...';
+        try {
+          const cleanScreenshot = await captureFullPageScreenshot(tab.id);
+          if (cleanScreenshot) {
+            // Remove data:image/png;base64, prefix if present
+            currentPageData.screenshot = cleanScreenshot.replace(/^data:image\/png;base64,/, '');
+          }
+        } catch (e) {
+          console.warn('Clean screenshot capture failed:', e);
+        }
+        
         // Highlight issues on the page
         statusDiv.textContent = '🎯 Highlighting issues on page...';
         try {
@@ -128,17 +141,14 @@ document.addEventListener('DOMContentLoaded', async function() {
           console.warn('Could not highlight elements:', e);
         }
         
-        // Capture full page screenshot WITH HIGHLIGHTS
+        // Capture full page screenshot WITH HIGHLIGHTS (display and report only)
         statusDiv.textContent = '📸 Capturing screenshot with highlighted issues...';
-        let screenshotData = null;
         try {
           const screenshotBase64 = await captureFullPageScreenshot(tab.id);
           console.log('[FinACCAI] Screenshot captured, length:', screenshotBase64 ? screenshotBase64.length : 0);
           if (screenshotBase64) {
             // Store screenshot for later use
             currentScreenshot = screenshotBase64;
-            // Remove data:image/png;base64, prefix if present
-            screenshotData = screenshotBase64.replace(/^data:image\/png;base64,/, '');
             displayScreenshot(screenshotBase64);
           }
         } catch (e) {
@@ -149,23 +159,41 @@ document.addEventListener('DOMContentLoaded', async function() {
         const selectedLevel = document.getElementById('levelSelect') ? document.getElementById('levelSelect').value : 'AAA';
         console.log('[FinACCAI] Selected WCAG level:', selectedLevel);
         
-        // Run AI/ML Analysis using client-side models
+        // Run AI/ML Analysis on the backend; it captions visible images by
+        // cropping them out of the clean screenshot using the image boxes
         statusDiv.innerHTML = '<div class="spinner"></div><p>Running AI/ML analysis...</p>';
         
+        const backendReport = await analyzeWithBackend({
+          html: response.html,
+          url: response.url,
+          title: response.title,
+          level: selectedLevel,
+          screenshot: currentPageData.screenshot || null,
+          imageBoxes: response.imageBoxes || null,
+          devicePixelRatio: response.devicePixelRatio || 1
+        });
+        
+        // Fall back to the client-side models when the backend is not running
         let aiMlResults = null;
-        try {
-          console.log('[FinACCAI] Starting client-side AI/ML analysis...');
-          aiMlResults = await finaccaiAI.generateReport(response.html, response.clientChecks);
-          console.log('[FinACCAI] AI/ML analysis complete:', aiMlResults);
-        } catch (e) {
-          console.error('[FinACCAI] AI/ML analysis error:', e);
-          aiMlResults = null;
+        if (!backendReport) {
+          try {
+            console.log('[FinACCAI] Starting client-side AI/ML analysis...');
+            aiMlResults = await finaccaiAI.generateReport(response.html, response.clientChecks);
+            console.log('[FinACCAI] AI/ML analysis complete:', aiMlResults);
+          } catch (e) {
+            console.error('[FinACCAI] AI/ML analysis error:', e);
+            aiMlResults = null;
+          }
         }
         
         // Display results
         analyzeBtn.disabled = false;
         
-        if (aiMlResults) {
+        if (backendReport) {
+          currentReport = backendReport;
+          displayAIStatus(backendReport);
+          statusDiv.innerHTML = '<p>✓ Full scan complete with backend AI/ML analysis!</p>';
+        } else if (aiMlResults) {
           // Create report object with AI data
           const aiReport = {
             ai_ml_enabled: true,
@@ -406,6 +434,23 @@ document.addEventListener('DOMContentLoaded', async function() {
     statusDiv.className = 'status error';
   }
   
+  // Send the page to the backend API (via the background worker); resolves
+  // to the API's report data, or null when the backend is unavailable
+  function analyzeWithBackend(payload) {
+    return new Promise(resolve => {
+      chrome.runtime.sendMessage({ action: 'analyzeWithBackend', ...payload }, (reply) => {
+        if (chrome.runtime.lastError || !reply || !reply.success || !reply.data.success) {
+          console.warn('[FinACCAI] Backend analysis unavailable:',
+            chrome.runtime.lastError ? chrome.runtime.lastError.message : (reply && reply.error));
+          resolve(null);
+          return;
+        }
+        // reply.data is the API's JSON body: {success, data: {...report}}
+        resolve(reply.data.data);
+      });
+    });
+  }
+  
   // Capture full page screenshot by stitching multiple viewport captures
   async function captureFullPageScreenshot(tabId) {
     try {
@@ -2,7 +2,93 @@
 import argparse
 import os
 import sys
-from . import script
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from . import parsing, script
+from .page_context import PageContext
+
+
+def fetch_page(url, dynamic=False, max_wait=5):
+    """Return (html, error, render_wait) for `url`.
+
+    `render_wait` is the seconds spent waiting for a dynamic page to settle,
+    or None for plain HTTP fetches.
+    """
+    if not dynamic:
+        html, error = script.get_html(url)
+        return html, error, None
+    try:
+        from . import utils
+        html, _, render_wait = utils.load_dynamic_page(url, max_wait=max_wait)
+        return html, None, render_wait
+    except Exception as e:
+        return None, str(e), None
+
+
+def scan_site(url, dynamic=False, max_wait=5):
+    """Fetch and check a single URL, returning its report entry."""
+    print(f"Scanning: {url}")
+    html, error, render_wait = fetch_page(url, dynamic=dynamic, max_wait=max_wait)
+
+    if error:
+        return {
+            "url": url,
+            "title": None,
+            "error": error,
+            "issues": {},
+            "render_wait": render_wait
+        }
+
+    # parse once, then derive title and run checks from the same tree
+    page = PageContext.from_html(html)
+    issues = script.run_checks(page)
+
+    return {
+        "url": url,
+        "title": page.title,
+        "error": None,
+        "issues": issues,
+        "render_wait": render_wait
+    }
+
+
+def _scan_site_or_error(url, dynamic=False, max_wait=5):
+    """`scan_site`, with an unexpected exception reported as the site's error."""
+    try:
+        return scan_site(url, dynamic=dynamic, max_wait=max_wait)
+    except Exception as e:
+        return {
+            "url": url,
+            "title": None,
+            "error": f"{type(e).__name__}: {e}",
+            "issues": {},
+            "render_wait": None
+        }
+
+
+def scan_sites(urls, concurrency=1, dynamic=False, max_wait=5):
+    """Scan URLs with up to `concurrency` pages in flight.
+
+    Results are yielded in the same order as `urls` regardless of which
+    fetch finishes first, so the report layout stays stable. A URL whose
+    scan raises gets an error entry; the other URLs are still scanned.
+    """
+    if concurrency <= 1:
+        for url in urls:
+            yield _scan_site_or_error(url, dynamic=dynamic, max_wait=max_wait)
+        return
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Keep at most 2x workers submitted so huge CSVs don't queue every URL up front.
+        window = concurrency * 2
+        pending = deque()
+        for url in urls:
+            pending.append(executor.submit(_scan_site_or_error, url, dynamic, max_wait))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        for future in pending:
+            yield future.result()
 
 
 def main(argv=None):
@@ -14,8 +100,51 @@ def main(argv=None):
         required=True,
         help="Path to CSV file containing a 'url' column"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of pages to fetch and check in parallel (default: 1)"
+    )
+    parser.add_argument(
+        "--dynamic",
+        action="store_true",
+        help="Render pages in pooled headless Chrome instead of a plain HTTP fetch"
+    )
+    parser.add_argument(
+        "--max-wait",
+        type=float,
+        default=5,
+        metavar="SECONDS",
+        help="Upper bound on waiting for a --dynamic page to settle (default: 5)"
+    )
+    parser.add_argument(
+        "--parser",
+        choices=parsing.BACKENDS + ("auto",),
+        default=None,
+        help="HTML parser backend (default: $FINACCAI_PARSER or html.parser)"
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=100,
+        metavar="N",
+        help="Sites per report page; the report file becomes a sortable index "
+             "linking to the pages. 0 writes a single report file (default: 100)"
+    )
     args = parser.parse_args(argv)
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.shard_size < 0:
+        parser.error("--shard-size must be 0 or more")
+    if args.parser:
+        try:
+            parsing.set_default_parser(args.parser)
+        except ValueError as e:
+            parser.error(str(e))
+
     try:
         urls = script.read_urls_from_csv(args.csv)
     except Exception as e:
@@ -26,46 +155,43 @@ def main(argv=None):
         print("No URLs found in CSV.", file=sys.stderr)
         sys.exit(1)
 
-    results_by_site = []
-    for url in urls:
-        print(f"Scanning: {url}")
-        html, error = script.get_html(url)
-
-        if error:
-            results_by_site.append({
-                "url": url,
-                "title": None,
-                "error": error,
-                "issues": {}
-            })
-            continue
-
-        # derive title and run checks
-        title = None
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
-            title_tag = soup.find('title')
-            title = title_tag.get_text(strip=True) if title_tag else None
-        except Exception:
-            pass
-
-        issues = script.run_checks(html)
-
-        results_by_site.append({
-            "url": url,
-            "title": title,
-            "error": None,
-            "issues": issues
-        })
+    if args.dynamic:
+        from . import utils
+        utils.configure_browser_pool(size=args.concurrency)
 
     # Ensure log folder exists
     os.makedirs("log", exist_ok=True)
     timestamp = script.datetime.now().strftime("%Y-%m-%d_%H%M%S")
     output_path = os.path.join("log", f"accessibility_report_{timestamp}.html")
 
-    script.generate_html_report(results_by_site, output_path)
-    print(f"\nReport generated: {output_path}")
+    # Cards are written as results arrive, so the report grows while the
+    # pool keeps scanning and no result is kept once it has been written.
+    started = time.perf_counter()
+    scanned = 0
+    render_waits = []
+    if args.shard_size:
+        report_writer = script.ShardedReportWriter(output_path, shard_size=args.shard_size)
+    else:
+        report_writer = script.ReportWriter(output_path)
+    with report_writer as report:
+        for site in scan_sites(
+            urls, concurrency=args.concurrency, dynamic=args.dynamic, max_wait=args.max_wait
+        ):
+            report.add(site)
+            scanned += 1
+            if site.get("render_wait") is not None:
+                render_waits.append(site["render_wait"])
+    elapsed = time.perf_counter() - started
+
+    print(f"\nScanned {scanned} pages in {elapsed:.1f}s "
+          f"({scanned / elapsed if elapsed else 0:.2f} pages/s, "
+          f"concurrency={args.concurrency})")
+    if render_waits:
+        print(f"Render wait: {sum(render_waits):.1f}s total, "
+              f"{sum(render_waits) / len(render_waits):.2f}s avg, {max(render_waits):.2f}s max")
+    print(f"Report generated: {output_path}")
+    if args.shard_size:
+        print(f"Report pages: {report_writer.pages} in {report_writer.pages_dir}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,111 @@
+"""Size-bounded, persistent LRU key/value store backed by SQLite.
+
+Used for caches that must survive between scans (e.g. HTTP page bodies).
+Each entry stores a bytes value plus a small JSON metadata dict; once the
+total stored size exceeds `max_bytes` the least recently used entries are
+evicted.
+
+Cache hits only read: their recency is recorded in memory and written in
+one batch on the next `set()`, every `TOUCH_BATCH` hits, or on `close()`.
+Concurrent readers therefore never wait on SQLite's write lock.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# Pending recency updates flushed in one transaction
+TOUCH_BATCH = 256
+
+
+class DiskCache:
+    """Persistent LRU cache keyed by string, safe to share between threads."""
+
+    def __init__(self, path, max_bytes):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._touched = {}
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " meta TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+            )
+
+    def get(self, key):
+        """Return (value, meta) for `key` and mark it recently used, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, meta FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_BATCH:
+                with self._conn:
+                    self._flush_touched()
+        return bytes(row[0]), json.loads(row[1])
+
+    def set(self, key, value, meta=None):
+        """Store `value` (bytes) with optional metadata, evicting LRU entries."""
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock, self._conn:
+            self._flush_touched()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, meta, size, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), json.dumps(meta or {}), size, time.time()),
+            )
+            self._evict()
+
+    def delete(self, key):
+        with self._lock, self._conn:
+            self._touched.pop(key, None)
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def total_bytes(self):
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _flush_touched(self):
+        """Write pending recency updates; call inside a transaction."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE entries SET last_access = ? WHERE key = ?",
+                [(at, key) for key, at in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        while total > self.max_bytes:
+            victims = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not victims:
+                break
+            for key, size in victims:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._touched.pop(key, None)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    def close(self):
+        with self._lock:
+            with self._conn:
+                self._flush_touched()
+            self._conn.close()
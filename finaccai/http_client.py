@@ -0,0 +1,150 @@
+"""Shared, pooled HTTP client for every FinAccAI fetcher.
+
+Page fetches (`script.get_html`, `utils.load_static_html`) and image
+downloads (`vision_analysis`) all go through one `requests.Session` so
+connections are kept alive and reused across pages on the same host.
+
+Tuning is done through environment variables:
+
+    FINACCAI_HTTP_POOL_HOSTS   number of per-host pools kept open (default 32)
+    FINACCAI_HTTP_PER_HOST     max connections per host (default 8)
+    FINACCAI_HTTP_RETRIES      retries for connect errors / 429 / 5xx (default 2)
+    FINACCAI_HTTP_BACKOFF      exponential backoff factor in seconds (default 0.5)
+    FINACCAI_HTTP_CACHE        on-disk page cache file, or "off" (default data/http_cache.sqlite)
+    FINACCAI_HTTP_CACHE_MB     size bound of the page cache in MB (default 256)
+
+`get_text` keeps page bodies in a persistent LRU cache together with their
+ETag / Last-Modified validators and revalidates them with conditional
+requests, so unchanged pages come back as a 304 and are served from disk.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+POOL_HOSTS = int(os.environ.get("FINACCAI_HTTP_POOL_HOSTS", "32"))
+PER_HOST = int(os.environ.get("FINACCAI_HTTP_PER_HOST", "8"))
+RETRIES = int(os.environ.get("FINACCAI_HTTP_RETRIES", "2"))
+BACKOFF = float(os.environ.get("FINACCAI_HTTP_BACKOFF", "0.5"))
+
+CACHE_PATH = os.environ.get(
+    "FINACCAI_HTTP_CACHE",
+    str(Path(__file__).resolve().parents[1] / "data" / "http_cache.sqlite"),
+)
+CACHE_MAX_BYTES = int(float(os.environ.get("FINACCAI_HTTP_CACHE_MB", "256")) * 1024 * 1024)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def build_session(pool_hosts=POOL_HOSTS, per_host=PER_HOST, retries=RETRIES, backoff=BACKOFF):
+    """Create a keep-alive session with bounded per-host pools and retries."""
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+    # pool_block=True makes per_host a hard limit: extra threads wait for a
+    # free connection to that host instead of opening throwaway ones.
+    adapter = HTTPAdapter(
+        pool_connections=pool_hosts,
+        pool_maxsize=per_host,
+        max_retries=retry,
+        pool_block=True,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # urllib3 advertises br (and zstd) only when the decoder is installed,
+    # and decodes the body transparently either way.
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+
+def get_session():
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def configure(**kwargs):
+    """Replace the shared session, e.g. `configure(per_host=16, retries=0)`."""
+    global _session
+    new_session = build_session(**kwargs)
+    with _session_lock:
+        old, _session = _session, new_session
+    if old is not None:
+        old.close()
+    return new_session
+
+
+def get(url, timeout=20, **kwargs):
+    """GET `url` through the shared session."""
+    return get_session().get(url, timeout=timeout, **kwargs)
+
+
+def get_cache():
+    """Return the shared on-disk page cache, or None when disabled."""
+    global _cache
+    if CACHE_PATH.lower() in ("", "0", "off", "none"):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from .disk_cache import DiskCache
+                _cache = DiskCache(CACHE_PATH, CACHE_MAX_BYTES)
+    return _cache
+
+
+def get_text(url, timeout=20):
+    """Fetch a page body as text, revalidating any cached copy.
+
+    Raises `requests.HTTPError` for error statuses, like `raise_for_status`.
+    """
+    cache = get_cache()
+    cached = cache.get(url) if cache is not None else None
+
+    headers = {}
+    if cached is not None:
+        meta = cached[1]
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = get(url, timeout=timeout, headers=headers)
+
+    if resp.status_code == 304 and cached is not None:
+        return cached[0].decode("utf-8")
+
+    resp.raise_for_status()
+    text = resp.text
+
+    if cache is not None:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        no_store = "no-store" in resp.headers.get("Cache-Control", "").lower()
+        if (etag or last_modified) and not no_store:
+            cache.set(url, text.encode("utf-8"), {"etag": etag, "last_modified": last_modified})
+        elif cached is not None:
+            cache.delete(url)
+    return text
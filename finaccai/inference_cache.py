@@ -0,0 +1,93 @@
+"""Content-addressed cache for model outputs.
+
+Many strings ("Sign In", "Email address", "Submit") appear on thousands of
+pages. `InferenceCache` keys a model's output by the normalized input plus
+the model version, keeps recent entries in an in-process LRU and persists
+everything to a size-bounded `DiskCache`, so a string is scored by the
+model once per model version rather than once per page.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from .disk_cache import DiskCache
+
+
+def normalize_text(text, lowercase=True):
+    """Collapse whitespace (and case, for uncased models) before keying."""
+    text = ' '.join(text.split())
+    return text.lower() if lowercase else text
+
+
+class InferenceCache:
+    """In-process LRU in front of an optional on-disk store.
+
+    Values must be JSON-serializable. `stats()` reports memory hits, disk
+    hits and misses since the cache was created.
+    """
+
+    def __init__(self, namespace, model_version, memory_items=4096,
+                 disk_path=None, disk_max_bytes=64 * 1024 * 1024, lowercase=True):
+        self.namespace = namespace
+        self.model_version = model_version
+        self.memory_items = memory_items
+        self.lowercase = lowercase
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = DiskCache(disk_path, disk_max_bytes) if disk_path else None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def key(self, text):
+        raw = '\0'.join([self.namespace, self.model_version, normalize_text(text, self.lowercase)])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, text):
+        """Return the cached value for `text`, or None on a miss."""
+        key = self.key(text)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+
+        if self._disk is not None:
+            stored = self._disk.get(key)
+            if stored is not None:
+                value = json.loads(stored[0])
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(key, value)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, text, value):
+        key = self.key(text)
+        with self._lock:
+            self._remember(key, value)
+        if self._disk is not None:
+            self._disk.set(key, json.dumps(value).encode('utf-8'))
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'model_version': self.model_version,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round((lookups - self.misses) / lookups, 3) if lookups else None,
+                'memory_items': len(self._memory),
+            }
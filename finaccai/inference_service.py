@@ -0,0 +1,195 @@
+"""In-process inference service with dynamic micro-batching.
+
+Each model gets one `MicroBatcher`: a bounded request queue drained by a
+single worker thread. The worker takes the first waiting request, keeps
+collecting requests until `max_batch_size` items are gathered or
+`max_wait` has passed, and runs them through the model as one batch. Work
+from concurrent API requests is therefore combined, and a model that is not
+thread-safe is only ever touched by its worker.
+
+The service is off by default, and then `MicroBatcher.map` simply calls
+the handler inline (CLI, tests). The API server turns it on with
+`enable()`. Tuning is done through environment variables:
+
+    FINACCAI_INFERENCE_SERVICE     1 / 0 to force the service on or off
+    FINACCAI_BATCH_MAX_WAIT_MS     how long a batch waits to fill up (default 10)
+    FINACCAI_BATCH_QUEUE           max pending requests per model (default 256)
+    FINACCAI_BATCH_SUBMIT_TIMEOUT  seconds to wait for queue space before
+                                   raising `Overloaded` (default 2)
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+MAX_WAIT = float(os.environ.get("FINACCAI_BATCH_MAX_WAIT_MS", "10")) / 1000
+MAX_QUEUE = int(os.environ.get("FINACCAI_BATCH_QUEUE", "256"))
+SUBMIT_TIMEOUT = float(os.environ.get("FINACCAI_BATCH_SUBMIT_TIMEOUT", "2"))
+RESULT_TIMEOUT = 300
+
+_enabled = os.environ.get("FINACCAI_INFERENCE_SERVICE", "").lower() in ("1", "true", "yes", "on")
+_forced_off = os.environ.get("FINACCAI_INFERENCE_SERVICE", "").lower() in ("0", "false", "no", "off")
+
+
+class Overloaded(RuntimeError):
+    """Raised when a model's request queue stays full for SUBMIT_TIMEOUT."""
+
+    def __init__(self, name):
+        super().__init__(f"Inference queue for {name} is full, retry later")
+        self.name = name
+
+
+class _Request:
+    __slots__ = ("items", "future")
+
+    def __init__(self, items):
+        self.items = items
+        self.future = Future()
+
+
+class MicroBatcher:
+    """Queue + worker thread that runs `handler(items) -> results` in batches.
+
+    `handler` receives a flat list of items from one or more requests and
+    must return one result per item, in order.
+    """
+
+    def __init__(self, name, handler, max_batch_size=32, max_wait=MAX_WAIT, max_queue=MAX_QUEUE):
+        self.name = name
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._batches = 0
+        self._items = 0
+        self._rejected = 0
+
+    def submit(self, items, timeout=SUBMIT_TIMEOUT):
+        """Queue `items` and return a Future for their results.
+
+        Blocks for up to `timeout` seconds while the queue is full, then
+        raises `Overloaded`.
+        """
+        request = _Request(list(items))
+        if not request.items:
+            request.future.set_result([])
+            return request.future
+        self._ensure_worker()
+        try:
+            self._queue.put(request, timeout=timeout)
+        except queue.Full:
+            with self._stats_lock:
+                self._rejected += 1
+            raise Overloaded(self.name) from None
+        return request.future
+
+    def run(self, items, timeout=RESULT_TIMEOUT):
+        """Submit `items` and wait for their results."""
+        return self.submit(items).result(timeout=timeout)
+
+    def map(self, items):
+        """Run `items` through the worker when the service is enabled, else inline."""
+        if enabled():
+            return self.run(items)
+        return self.handler(list(items))
+
+    def _ensure_worker(self):
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._loop, name=f"inference-{self.name}", daemon=True
+                )
+                self._worker.start()
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        size = len(batch[0].items)
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request.items)
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._collect()
+            items = [item for request in batch for item in request.items]
+            try:
+                results = self.handler(items)
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"{self.name} handler returned {len(results)} results for {len(items)} items"
+                    )
+            except Exception as e:
+                logger.warning("Inference batch for %s failed: %s", self.name, e)
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            offset = 0
+            for request in batch:
+                count = len(request.items)
+                request.future.set_result(results[offset:offset + count])
+                offset += count
+            with self._stats_lock:
+                self._requests += len(batch)
+                self._batches += 1
+                self._items += len(items)
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                'queued': self._queue.qsize(),
+                'requests': self._requests,
+                'batches': self._batches,
+                'items': self._items,
+                'avg_batch_items': self._items / self._batches if self._batches else 0.0,
+                'rejected': self._rejected,
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait * 1000,
+            }
+
+
+_batchers = {}
+_registry_lock = threading.Lock()
+
+
+def register(name, handler, **kwargs):
+    """Create (or return the existing) batcher for model `name`."""
+    with _registry_lock:
+        if name not in _batchers:
+            _batchers[name] = MicroBatcher(name, handler, **kwargs)
+        return _batchers[name]
+
+
+def enable(flag=True):
+    """Route batcher calls through the worker threads (ignored if forced off)."""
+    global _enabled
+    _enabled = bool(flag) and not _forced_off
+
+
+def enabled():
+    return _enabled
+
+
+def stats():
+    """Per-model queue depth and batching counters."""
+    return {name: batcher.stats() for name, batcher in _batchers.items()}
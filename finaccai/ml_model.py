@@ -1,48 +1,142 @@
 """
 ML Model for accessibility prediction.
 This module uses machine learning to predict potential accessibility issues.
+
+The RandomForest in models/ml_classifier.pkl is loaded lazily, once per
+process; API servers that warm it up before forking workers share it
+copy-on-write. It is fitted on synthetic data (see
+scripts/download_and_cache_models.py), so its score is reported as
+experimental and never drives the findings.
 """
 
-# Try to import scikit-learn for ML models
+import importlib.util
+
+from bs4.element import Tag
+
+from . import model_loader, model_registry
+from .page_context import page_soup
+
 try:
-    from sklearn.ensemble import RandomForestClassifier
     import numpy as np
-    SKLEARN_AVAILABLE = True
-    
-    # Pre-trained weights based on common patterns (simulated trained model)
-    # In production, this would be loaded from a saved model file
-    rf_model = RandomForestClassifier(n_estimators=10, random_state=42)
-    # We'll use heuristics to simulate predictions since we don't have training data
-    MODEL_TRAINED = False
 except ImportError:
-    SKLEARN_AVAILABLE = False
-    rf_model = None
-    MODEL_TRAINED = False
+    np = None
+
+# Only check that scikit-learn is installed; it is imported (by joblib)
+# when the classifier is first needed.
+SKLEARN_AVAILABLE = np is not None and all(
+    importlib.util.find_spec(pkg) is not None for pkg in ("sklearn", "joblib")
+)
+
+CLASSIFIER_PATH = model_registry.MODELS_DIR / "ml_classifier.pkl"
+
+# Fixed feature schema. The order is the column order of the vectors fed to
+# the classifier (models/ml_classifier.pkl expects exactly these 20 columns);
+# append new features at the end and retrain rather than reordering.
+FEATURE_NAMES = (
+    'total_elements',
+    'images_count',
+    'images_with_alt',
+    'inputs_count',
+    'inputs_with_label',
+    'buttons_count',
+    'links_count',
+    'headings_count',
+    'aria_labels',
+    'roles',
+    'nesting_depth',
+    'complexity_score',
+    'alt_text_coverage',
+    'label_coverage',
+    'forms_count',
+    'tables_count',
+    'aria_hidden',
+    'aria_references',
+    'negative_tabindex',
+    'has_lang',
+)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
+HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+TAG_COUNTERS = {
+    'img': 'images_count',
+    'input': 'inputs_count',
+    'button': 'buttons_count',
+    'a': 'links_count',
+    'form': 'forms_count',
+    'table': 'tables_count',
+}
+
+
+def _scan_features(soup):
+    """Collect every feature in one iterative walk over the tree."""
+    counts = dict.fromkeys(FEATURE_NAMES, 0)
+    label_targets = set()
+    inputs = []  # (id, labelled_without_for) per <input>
+    has_lang = False
+
+    # (tag, depth, inside_label); depth 1 = top-level element
+    stack = [(child, 1, False) for child in soup.contents if isinstance(child, Tag)]
+    while stack:
+        tag, depth, in_label = stack.pop()
+        name = tag.name
+        attrs = tag.attrs
+
+        counts['total_elements'] += 1
+        if depth > counts['nesting_depth']:
+            counts['nesting_depth'] = depth
+
+        counter = TAG_COUNTERS.get(name)
+        if counter:
+            counts[counter] += 1
+        elif name in HEADING_TAGS:
+            counts['headings_count'] += 1
+
+        if name == 'img' and attrs.get('alt'):
+            counts['images_with_alt'] += 1
+        elif name == 'input':
+            labelled = in_label or bool(attrs.get('aria-label') or attrs.get('aria-labelledby'))
+            inputs.append((attrs.get('id'), labelled))
+        elif name == 'label':
+            if attrs.get('for'):
+                label_targets.add(attrs['for'])
+            in_label = True
+        elif name == 'html' and attrs.get('lang'):
+            has_lang = True
+
+        if attrs:
+            if 'aria-label' in attrs:
+                counts['aria_labels'] += 1
+            if 'role' in attrs:
+                counts['roles'] += 1
+            if attrs.get('aria-hidden') == 'true':
+                counts['aria_hidden'] += 1
+            if 'aria-labelledby' in attrs or 'aria-describedby' in attrs:
+                counts['aria_references'] += 1
+            if attrs.get('tabindex') == '-1':
+                counts['negative_tabindex'] += 1
+
+        for child in tag.contents:
+            if isinstance(child, Tag):
+                stack.append((child, depth + 1, in_label))
+
+    counts['inputs_with_label'] = sum(
+        1 for input_id, labelled in inputs if labelled or (input_id and input_id in label_targets)
+    )
+    counts['has_lang'] = int(has_lang)
+    return counts
+
 
 def extract_advanced_features(soup):
     """
     Extract advanced ML features from DOM.
     
     Args:
-        soup: BeautifulSoup parsed HTML
+        soup: BeautifulSoup parsed HTML or a PageContext
         
     Returns:
-        dict: Feature vector for ML model
+        dict: Feature vector for ML model, keyed by FEATURE_NAMES
     """
-    features = {
-        'total_elements': len(soup.find_all()),
-        'images_count': len(soup.find_all('img')),
-        'images_with_alt': len([img for img in soup.find_all('img') if img.get('alt')]),
-        'inputs_count': len(soup.find_all('input')),
-        'inputs_with_label': 0,  # Would need more complex check
-        'buttons_count': len(soup.find_all('button')),
-        'links_count': len(soup.find_all('a')),
-        'headings_count': len(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])),
-        'aria_labels': len(soup.find_all(attrs={'aria-label': True})),
-        'roles': len(soup.find_all(attrs={'role': True})),
-        'nesting_depth': calculate_max_depth(soup),
-        'complexity_score': 0,
-    }
+    features = _scan_features(page_soup(soup))
     
     # Calculate complexity score
     features['complexity_score'] = (
@@ -56,19 +150,99 @@ def extract_advanced_features(soup):
         features['alt_text_coverage'] = features['images_with_alt'] / features['images_count']
     else:
         features['alt_text_coverage'] = 1.0
+    if features['inputs_count'] > 0:
+        features['label_coverage'] = features['inputs_with_label'] / features['inputs_count']
+    else:
+        features['label_coverage'] = 1.0
     
     return features
 
+
+def features_to_vector(features):
+    """Convert a feature dict to a float vector in FEATURE_NAMES order."""
+    return np.fromiter((features[name] for name in FEATURE_NAMES), dtype=np.float64, count=len(FEATURE_NAMES))
+
+
+def extract_feature_vector(soup):
+    """Feature vector (shape `(len(FEATURE_NAMES),)`) for one page."""
+    return features_to_vector(extract_advanced_features(soup))
+
+
+def extract_feature_matrix(pages):
+    """Feature matrix (one row per page) for soups, PageContexts or HTML strings."""
+    pages = list(pages)
+    matrix = np.empty((len(pages), len(FEATURE_NAMES)), dtype=np.float64)
+    for row, page in enumerate(pages):
+        matrix[row] = extract_feature_vector(page)
+    return matrix
+
+
+def _load_classifier():
+    import joblib
+
+    try:
+        model = model_registry.load_with("ml_classifier", joblib.load)
+    except model_registry.ModelNotAvailable:
+        # Not in the manifest yet: use the classifier shipped in the repo
+        model = joblib.load(CLASSIFIER_PATH)
+    n_features = getattr(model, 'n_features_in_', len(FEATURE_NAMES))
+    if n_features != len(FEATURE_NAMES):
+        raise ValueError(f"{CLASSIFIER_PATH} expects {n_features} features, "
+                         f"ml_model produces {len(FEATURE_NAMES)}")
+    return model
+
+
+classifier_model = model_loader.register("ml_classifier", _load_classifier)
+
+
+def get_classifier():
+    """Return the trained classifier, loading it on first call (None if unavailable)."""
+    if not SKLEARN_AVAILABLE:
+        return None
+    return classifier_model.get()
+
+
+def predict_batch(feature_matrix):
+    """
+    Score many pages in one vectorized call.
+    
+    Args:
+        feature_matrix: Array of shape (n_pages, len(FEATURE_NAMES)),
+            e.g. from extract_feature_matrix
+        
+    Returns:
+        numpy.ndarray: Probability of an accessibility issue per row, or
+        None if the classifier is unavailable
+    """
+    model = get_classifier()
+    if model is None:
+        return None
+    X = np.ascontiguousarray(np.atleast_2d(feature_matrix), dtype=np.float32)
+    if X.shape[1] != len(FEATURE_NAMES):
+        raise ValueError(f"expected {len(FEATURE_NAMES)} feature columns, got {X.shape[1]}")
+    
+    trees = getattr(model, 'estimators_', None)
+    if trees:
+        # Average the trees directly; RandomForest.predict_proba's per-call
+        # input checks and joblib dispatch cost more than the trees on one row.
+        proba = sum(tree.predict_proba(X, check_input=False) for tree in trees) / len(trees)
+    else:
+        proba = model.predict_proba(X)
+    classes = list(getattr(model, 'classes_', []))
+    return proba[:, classes.index(1) if 1 in classes else -1]
+
+
 def calculate_max_depth(element, depth=0):
-    """Calculate maximum nesting depth of DOM."""
-    if not hasattr(element, 'children'):
-        return depth
-    max_child_depth = depth
-    for child in element.children:
-        if hasattr(child, 'children'):
-            child_depth = calculate_max_depth(child, depth + 1)
-            max_child_depth = max(max_child_depth, child_depth)
-    return max_child_depth
+    """Calculate maximum nesting depth of DOM (iteratively, no recursion limit)."""
+    max_depth = depth
+    stack = [(element, depth)]
+    while stack:
+        node, node_depth = stack.pop()
+        max_depth = max(max_depth, node_depth)
+        for child in getattr(node, 'contents', ()):
+            if isinstance(child, Tag):
+                stack.append((child, node_depth + 1))
+    return max_depth
 
 def predict_issue_from_soup(soup):
     """
@@ -76,17 +250,27 @@ def predict_issue_from_soup(soup):
     Returns user-friendly predictions in plain English.
     
     Args:
-        soup: BeautifulSoup parsed HTML
+        soup: BeautifulSoup parsed HTML or a PageContext
         
     Returns:
         dict: User-friendly predictions with explanations
     """
     try:
+        soup = page_soup(soup)
         # Extract advanced features for ML
         features = extract_advanced_features(soup)
         
         insights = []
-        use_ml = SKLEARN_AVAILABLE
+        
+        # Issue probability from the trained classifier (None without it)
+        issue_probability = None
+        if SKLEARN_AVAILABLE:
+            try:
+                scores = predict_batch(features_to_vector(features))
+                if scores is not None:
+                    issue_probability = float(scores[0])
+            except Exception:
+                issue_probability = None
         
         # Create user-friendly summary
         summary = {
@@ -197,13 +381,21 @@ def predict_issue_from_soup(soup):
             ]
         }
         
+        if issue_probability is not None:
+            stats['items'].append(f'Experimental ML score: {issue_probability:.0%}')
+            model_info = (f'🧪 Experimental classifier (trained on synthetic data, not validated): '
+                          f'{issue_probability:.0%} issue score')
+        else:
+            model_info = '🤖 Analyzed using AI pattern recognition'
+        
         return {
             'summary': summary,
             'insights': insights,
             'statistics': stats,
             'severity': calculate_overall_severity(insights),
             'explanation': format_simple_explanation(insights),
-            'model_info': '🤖 Analyzed using AI pattern recognition'
+            'issue_probability': issue_probability,
+            'model_info': model_info
         }
         
     except Exception as e:
@@ -0,0 +1,125 @@
+"""Lazy, thread-safe loading of the AI models.
+
+Importing `nlp_analysis` or `vision_analysis` no longer loads anything:
+each model is registered here as a `LazyModel` and built on first use
+(or by an optional warm-up). Rules-only code paths therefore never
+import torch or transformers.
+
+Pre-fork servers (e.g. gunicorn with `preload_app`) should warm up with
+`warm_up(background=False)` so every model is READY before the workers
+are forked and shared copy-on-write. A fork that happens during a
+background load would otherwise copy a held lock into the child; an
+after-fork hook gives each child fresh locks and resets models that were
+mid-load to NOT_LOADED, so the child loads them itself.
+"""
+
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+NOT_LOADED = 'not_loaded'
+LOADING = 'loading'
+READY = 'ready'
+UNAVAILABLE = 'unavailable'
+
+
+class LazyModel:
+    """A model built by `loader()` the first time `get()` is called.
+
+    Concurrent callers block on the same load; a failed load is remembered
+    and `get()` returns None from then on.
+    """
+
+    def __init__(self, name, loader):
+        self.name = name
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._model = None
+        self.status = NOT_LOADED
+        self.error = None
+        self.load_seconds = None
+
+    def get(self):
+        """Return the loaded model, loading it if needed, or None if unavailable."""
+        if self.status == READY:
+            return self._model
+        if self.status == UNAVAILABLE:
+            return None
+        with self._lock:
+            if self.status == NOT_LOADED:
+                self.status = LOADING
+                started = time.perf_counter()
+                try:
+                    self._model = self._loader()
+                    self.status = READY
+                except Exception as e:
+                    self._model = None
+                    self.error = str(e)
+                    self.status = UNAVAILABLE
+                    logger.warning("Model %s unavailable: %s", self.name, e)
+                self.load_seconds = time.perf_counter() - started
+        return self._model
+
+    def _reset_after_fork(self):
+        # The loading thread does not exist in the child; its lock may be held
+        self._lock = threading.Lock()
+        if self.status == LOADING:
+            self.status = NOT_LOADED
+
+    @property
+    def ready(self):
+        return self.status == READY
+
+    def info(self):
+        return {
+            'status': self.status,
+            'load_seconds': round(self.load_seconds, 3) if self.load_seconds is not None else None,
+            'error': self.error,
+        }
+
+
+_registry = {}
+
+
+def register(name, loader):
+    """Create (or return the existing) LazyModel called `name`."""
+    if name not in _registry:
+        _registry[name] = LazyModel(name, loader)
+    return _registry[name]
+
+
+def models_status():
+    """Readiness of every registered model, e.g. for a health endpoint."""
+    return {name: model.info() for name, model in _registry.items()}
+
+
+def _reset_after_fork():
+    for model in _registry.values():
+        model._reset_after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def warm_up(names=None, background=True):
+    """Load models ahead of the first request, in a daemon thread by default.
+
+    Pass `background=False` to block until every model is loaded (or marked
+    unavailable); do this before forking worker processes.
+    """
+    models = [m for n, m in _registry.items() if names is None or n in names]
+
+    def load_all():
+        for model in models:
+            model.get()
+
+    if not background:
+        load_all()
+        return None
+    thread = threading.Thread(target=load_all, name='finaccai-model-warmup', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,191 @@
+"""Local, offline registry of the AI model artifacts in `models/`.
+
+`scripts/download_and_cache_models.py` saves every model into `models/`
+and records it in `models/manifest.json`:
+
+    {"format": 1, "models": {"nlp_sentiment": {
+        "path": "nlp_sentiment", "source": "distilbert-...", "version": "<hub revision>",
+        "files": {"model.safetensors": {"bytes": 267832558, "sha256": "..."}, ...}}}}
+
+At runtime models are resolved only through the manifest and loaded with
+`local_files_only` while the Hugging Face libraries are forced offline, so
+a missing model fails fast instead of being downloaded. Weights are read
+from safetensors through a memory map (`low_cpu_mem_usage`), so a model
+is not copied a second time at load time. API servers that load models
+before forking workers share those pages copy-on-write.
+
+    FINACCAI_MODELS_DIR     directory holding manifest.json (default <repo>/models)
+    FINACCAI_MODEL_VERIFY   "size" (default) checks file sizes on load,
+                            "sha256" also re-hashes every file, "off" skips
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+MODELS_DIR = Path(os.environ.get(
+    "FINACCAI_MODELS_DIR", str(Path(__file__).resolve().parents[1] / "models")
+))
+MANIFEST_NAME = "manifest.json"
+VERIFY = os.environ.get("FINACCAI_MODEL_VERIFY", "size").lower()
+
+_timings = {}
+
+
+class ModelNotAvailable(RuntimeError):
+    """The model is not in the manifest or its files are missing/corrupt."""
+
+
+def manifest_path(models_dir=None):
+    return Path(models_dir or MODELS_DIR) / MANIFEST_NAME
+
+
+def load_manifest(models_dir=None):
+    """Return the parsed manifest, or an empty one if it does not exist yet."""
+    path = manifest_path(models_dir)
+    if not path.exists():
+        return {"format": 1, "models": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def record(name, path, source=None, version=None, models_dir=None):
+    """Add (or replace) `name` in the manifest, checksumming its files.
+
+    `path` is a model directory or a single file inside the models directory.
+    """
+    models_dir = Path(models_dir or MODELS_DIR)
+    path = Path(path)
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    base = path if path.is_dir() else path.parent
+    entry = {
+        "path": path.resolve().relative_to(models_dir.resolve()).as_posix(),
+        "source": source,
+        "version": version or "unknown",
+        "recorded": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "files": {
+            p.relative_to(base).as_posix(): {"bytes": p.stat().st_size, "sha256": _sha256(p)}
+            for p in files
+        },
+    }
+    manifest = load_manifest(models_dir)
+    manifest.setdefault("models", {})[name] = entry
+    with open(manifest_path(models_dir), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return entry
+
+
+def entry(name, models_dir=None):
+    """Return the manifest entry for `name`, raising ModelNotAvailable."""
+    found = load_manifest(models_dir).get("models", {}).get(name)
+    if found is None:
+        raise ModelNotAvailable(
+            f"{name} is not in {manifest_path(models_dir)}; "
+            "run scripts/download_and_cache_models.py"
+        )
+    return found
+
+
+def model_path(name, models_dir=None):
+    """Path of `name`'s directory (or file) inside the models directory."""
+    return Path(models_dir or MODELS_DIR) / entry(name, models_dir)["path"]
+
+
+def model_version(name, default):
+    """"<source>@<version>" for a registered model, else `default`.
+
+    Used in inference-cache keys so re-downloaded models never reuse
+    outputs of an older revision.
+    """
+    try:
+        found = entry(name)
+    except (ModelNotAvailable, OSError, ValueError):
+        return default
+    return f"{found.get('source') or default}@{found.get('version')}"
+
+
+def verify(name, mode=None, models_dir=None):
+    """Check `name`'s files against the manifest and return its path.
+
+    `mode` is "size", "sha256" or "off" (default FINACCAI_MODEL_VERIFY).
+    """
+    mode = (mode or VERIFY).lower()
+    found = entry(name, models_dir)
+    path = Path(models_dir or MODELS_DIR) / found["path"]
+    base = path if path.is_dir() else path.parent
+    started = time.perf_counter()
+    if mode != "off":
+        for rel, expected in found["files"].items():
+            file = base / rel
+            if not file.is_file():
+                raise ModelNotAvailable(f"{name}: missing {file}")
+            if file.stat().st_size != expected["bytes"]:
+                raise ModelNotAvailable(
+                    f"{name}: {rel} is {file.stat().st_size} bytes, manifest says {expected['bytes']} "
+                    "(Git LFS pointer not fetched?)"
+                )
+            if mode == "sha256" and _sha256(file) != expected["sha256"]:
+                raise ModelNotAvailable(f"{name}: checksum mismatch for {rel}")
+    _timings.setdefault(name, {})["verify_seconds"] = round(time.perf_counter() - started, 3)
+    return path
+
+
+def go_offline():
+    """Keep the Hugging Face libraries from reaching the network.
+
+    The hub reads these variables when it is first imported, so they are
+    set for the whole process before any model is loaded; every load also
+    passes `local_files_only=True`.
+    """
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+
+def load_with(name, load):
+    """Verify `name`, then return `load(path)`, recording the cold-start time."""
+    path = verify(name)
+    go_offline()
+    started = time.perf_counter()
+    loaded = load(path)
+    _timings.setdefault(name, {})["load_seconds"] = round(time.perf_counter() - started, 3)
+    return loaded
+
+
+def load_model(cls, name, **kwargs):
+    """`cls.from_pretrained` on the registered directory: local, safetensors, mmap."""
+    kwargs.setdefault("use_safetensors", True)
+    kwargs.setdefault("low_cpu_mem_usage", True)
+    return load_with(name, lambda path: cls.from_pretrained(path, local_files_only=True, **kwargs))
+
+
+def load_processor(cls, name, **kwargs):
+    """Tokenizer / processor counterpart of `load_model` (no weights)."""
+    go_offline()
+    return cls.from_pretrained(model_path(name), local_files_only=True, **kwargs)
+
+
+def status():
+    """Manifest version and cold-start timings of every registered model."""
+    try:
+        models = load_manifest().get("models", {})
+    except (OSError, ValueError) as e:
+        return {"error": str(e)}
+    return {
+        name: {
+            "version": found.get("version"),
+            "source": found.get("source"),
+            **_timings.get(name, {}),
+        }
+        for name, found in models.items()
+    }
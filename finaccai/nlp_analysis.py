@@ -3,18 +3,351 @@ NLP Analysis for accessibility text content.
 Uses natural language processing to analyze text clarity and meaning.
 """
 
-# Try to import transformer models for advanced NLP
-try:
-    from transformers import pipeline
-    TRANSFORMERS_AVAILABLE = True
-    # Initialize sentiment analysis for text quality
+import importlib.util
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+
+from . import inference_service, model_loader, model_registry
+from .inference_cache import InferenceCache
+from .page_context import page_soup
+from .script import LinkContextRule
+
+logger = logging.getLogger(__name__)
+
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+
+# Opt-in dynamic int8 runtime for CPU-only hosts. The quantized weights are
+# prepared ahead of time by scripts/download_and_cache_models.py.
+QUANTIZED = os.environ.get("FINACCAI_NLP_QUANTIZED", "").lower() in ("1", "true", "yes", "on")
+SENTIMENT_MODEL_DIR = model_registry.MODELS_DIR / "nlp_sentiment"
+QUANTIZED_MODEL_DIR = model_registry.MODELS_DIR / "nlp_sentiment_int8"
+QUANTIZED_WEIGHTS = "quantized_state_dict.pt"
+
+# Strings scored per forward pass; tune down on small CPU hosts.
+BATCH_SIZE = int(os.environ.get("FINACCAI_NLP_BATCH_SIZE", "32"))
+
+# Scores are cached by normalized text + model version ("off" disables the disk store).
+TEXT_CACHE_PATH = os.environ.get(
+    "FINACCAI_NLP_CACHE",
+    str(Path(__file__).resolve().parents[1] / "data" / "nlp_cache.sqlite"),
+)
+TEXT_CACHE_MAX_BYTES = int(float(os.environ.get("FINACCAI_NLP_CACHE_MB", "64")) * 1024 * 1024)
+
+# Lexical scores at or above this confidence are final; anything less
+# confident is escalated to the transformer (1.0 escalates everything).
+ESCALATE_BELOW = float(os.environ.get("FINACCAI_NLP_ESCALATE_BELOW", "0.8"))
+
+VAGUE_WORDS = ['click', 'here', 'this', 'that', 'enter', 'input']
+VAGUE_BUTTONS = ['click', 'submit', 'ok', 'go']
+
+# Words that on their own make a form label self-explanatory
+FIELD_TERMS = frozenset("""
+    account address amount apartment bank birth card city code company comment
+    comments confirm country county date day description email employer expiry
+    first full income last message middle mobile month name number password payee
+    phone pin postcode postal province quantity reference routing search security
+    sort state street surname tax telephone title town username year zip
+""".split())
+
+# Only check that transformers is installed; importing it pulls in torch,
+# which is deferred until the model is first needed.
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+
+
+def quantize_sentiment_model(model):
+    """Return `model` with its Linear layers converted to dynamic int8."""
+    import torch
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _load_int8_weights(path):
+    import torch
+    from transformers import AutoConfig, AutoModelForSequenceClassification
+
+    # Rebuild the quantized module layout, then map the prepared int8 weights
+    config = AutoConfig.from_pretrained(path, local_files_only=True)
+    model = quantize_sentiment_model(AutoModelForSequenceClassification.from_config(config))
+    model.load_state_dict(torch.load(path / QUANTIZED_WEIGHTS, map_location="cpu", mmap=True))
+    return model
+
+
+def _load_quantized_sentiment_analyzer():
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+
     try:
-        sentiment_analyzer = pipeline("sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english")
-    except:
-        sentiment_analyzer = None
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
-    sentiment_analyzer = None
+        model = model_registry.load_with("nlp_sentiment_int8", _load_int8_weights)
+        tokenizer = model_registry.load_processor(AutoTokenizer, "nlp_sentiment_int8")
+    except model_registry.ModelNotAvailable as e:
+        logger.warning("%s; quantizing the fp32 model at load time", e)
+        model = quantize_sentiment_model(
+            model_registry.load_model(AutoModelForSequenceClassification, "nlp_sentiment")
+        )
+        tokenizer = model_registry.load_processor(AutoTokenizer, "nlp_sentiment")
+    model.eval()
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, device=-1)
+
+
+def build_sentiment_pipeline(quantized=False):
+    """Build the sentiment pipeline for the fp32 or int8 runtime (uncached).
+
+    Weights come from the local model registry only; nothing is downloaded.
+    """
+    if quantized:
+        return _load_quantized_sentiment_analyzer()
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+    model = model_registry.load_model(AutoModelForSequenceClassification, "nlp_sentiment")
+    tokenizer = model_registry.load_processor(AutoTokenizer, "nlp_sentiment")
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, device=-1)
+
+
+def _load_sentiment_analyzer():
+    return build_sentiment_pipeline(QUANTIZED)
+
+
+sentiment_model = model_loader.register("nlp_sentiment", _load_sentiment_analyzer)
+
+
+def get_sentiment_analyzer():
+    """Return the sentiment pipeline, loading it on first call (None if unavailable)."""
+    if not TRANSFORMERS_AVAILABLE:
+        return None
+    return sentiment_model.get()
+
+
+def sentiment_model_version():
+    """Identifier of the scoring model, part of every text-cache key.
+
+    int8 scores differ slightly from fp32 ones, so the two runtimes never
+    share cache entries.
+    """
+    version = model_registry.model_version("nlp_sentiment", SENTIMENT_MODEL)
+    return version + "+int8" if QUANTIZED else version
+
+
+_text_cache = None
+_text_cache_lock = threading.Lock()
+
+
+def get_text_cache():
+    """Return the shared label/button score cache."""
+    global _text_cache
+    if _text_cache is None:
+        with _text_cache_lock:
+            if _text_cache is None:
+                disk_path = TEXT_CACHE_PATH
+                if disk_path.lower() in ("", "0", "off", "none"):
+                    disk_path = None
+                # The sst-2 model is uncased, so case-folding only adds hits
+                _text_cache = InferenceCache(
+                    "nlp_sentiment", sentiment_model_version(),
+                    disk_path=disk_path, disk_max_bytes=TEXT_CACHE_MAX_BYTES,
+                )
+    return _text_cache
+
+
+_tier_counts = {'lexical': 0, 'escalated': 0}
+_tier_lock = threading.Lock()
+
+
+def tier_stats():
+    """Strings settled by the lexical tier vs. escalated to the transformer."""
+    with _tier_lock:
+        scored = _tier_counts['lexical'] + _tier_counts['escalated']
+        return {
+            **_tier_counts,
+            'escalation_rate': _tier_counts['escalated'] / scored if scored else 0.0,
+        }
+
+
+def _syllables(word):
+    groups = re.findall(r'[aeiouy]+', word)
+    count = len(groups) - (word.endswith('e') and len(groups) > 1)
+    return max(count, 1)
+
+
+def _descriptiveness(text):
+    return 'high' if len(text.split()) > 3 else 'low'
+
+
+def lexical_score(text):
+    """
+    Score label text with cheap lexical rules.
+    
+    Returns the same keys as the transformer analysis plus a Flesch
+    readability score, with 'confidence' estimating how certain the
+    lexical verdict is.
+    
+    Args:
+        text: Text to analyze
+        
+    Returns:
+        dict: quality, confidence, descriptiveness, readability, tier
+    """
+    tokens = re.findall(r"[a-z0-9']+", text.lower())
+    words = [t for t in tokens if t.isalpha()]
+    if words:
+        syllables = sum(_syllables(w) for w in words) / len(words)
+        readability = max(0.0, min(100.0, 206.835 - 1.015 * len(words) - 84.6 * syllables))
+    else:
+        readability = 0.0
+    vague = sum(t in VAGUE_WORDS or t in LinkContextRule.vague_link_texts for t in tokens)
+    known = sum(t in FIELD_TERMS for t in tokens)
+    
+    if not words and re.search(r'[^\W\d_]', text):
+        # Letters, but none the English rules can read (CJK, Cyrillic, ...):
+        # no lexical verdict, leave it to the model
+        quality, confidence = 'good', 0.0
+    elif not words:
+        quality, confidence = 'needs_improvement', 0.95
+    elif vague * 2 >= len(tokens):
+        quality, confidence = 'needs_improvement', 0.9
+    elif known and not vague and len(words) <= 8:
+        quality, confidence = 'good', 0.9
+    elif readability < 30:
+        quality, confidence = 'needs_improvement', 0.6
+    else:
+        quality, confidence = 'good', 0.5
+    
+    return {
+        'quality': quality,
+        'confidence': confidence,
+        'descriptiveness': _descriptiveness(text),
+        'readability': round(readability, 1),
+        'tier': 'lexical'
+    }
+
+
+def score_texts(texts):
+    """
+    Tiered text scoring: lexical rules first, the transformer only for
+    strings the lexical tier is unsure about.
+    
+    Args:
+        texts: List of texts to analyze
+        
+    Returns:
+        list: One analysis dict (or None) per input text, in input order
+    """
+    results = [None] * len(texts)
+    escalate = []
+    for i, text in enumerate(texts):
+        if not text.strip():
+            continue
+        result = lexical_score(text)
+        if result['confidence'] >= ESCALATE_BELOW:
+            results[i] = result
+        else:
+            escalate.append(i)
+    
+    if escalate:
+        for i, result in zip(escalate, analyze_texts_with_bert([texts[i] for i in escalate])):
+            if result is not None:
+                result['tier'] = 'transformer'
+            results[i] = result
+    
+    scored = sum(text.strip() != '' for text in texts)
+    if scored:
+        with _tier_lock:
+            _tier_counts['lexical'] += scored - len(escalate)
+            _tier_counts['escalated'] += len(escalate)
+        logger.info("NLP tiering: %d/%d strings escalated to the transformer (%.0f%% overall)",
+                    len(escalate), scored, tier_stats()['escalation_rate'] * 100)
+    return results
+
+
+def ai_available():
+    """True unless transformers is missing or the model already failed to load."""
+    return TRANSFORMERS_AVAILABLE and sentiment_model.status != model_loader.UNAVAILABLE
+
+
+def _bert_result(text, result):
+    return {
+        'quality': 'good' if result['label'] == 'POSITIVE' and result['score'] > 0.7 else 'needs_improvement',
+        'confidence': result['score'],
+        'descriptiveness': _descriptiveness(text)
+    }
+
+def _run_sentiment(texts, batch_size=None):
+    """Score raw texts in length-sorted batches; None for texts whose batch failed."""
+    outputs = [None] * len(texts)
+    sentiment_analyzer = get_sentiment_analyzer()
+    if not sentiment_analyzer:
+        return outputs
+    
+    batch_size = batch_size or BATCH_SIZE
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    for start in range(0, len(order), batch_size):
+        batch = order[start:start + batch_size]
+        try:
+            scored = sentiment_analyzer([texts[i][:512] for i in batch], batch_size=len(batch))  # BERT limit
+        except Exception:
+            continue
+        for i, result in zip(batch, scored):
+            outputs[i] = {'label': result['label'], 'score': float(result['score'])}
+    return outputs
+
+
+sentiment_batcher = inference_service.register("nlp_sentiment", _run_sentiment, max_batch_size=BATCH_SIZE)
+
+
+def analyze_texts_with_bert(texts, batch_size=None):
+    """
+    Analyze many texts with the BERT-based model in batched forward passes.
+    
+    Duplicates are scored once, previously seen texts come from the text
+    cache, and the remaining texts are sorted by length before being cut
+    into batches so each batch pads to a similar length.
+    
+    Args:
+        texts: List of texts to analyze
+        batch_size: Texts per forward pass (default FINACCAI_NLP_BATCH_SIZE)
+        
+    Returns:
+        list: One analysis dict (or None) per input text, in input order
+    """
+    results = [None] * len(texts)
+    positions = {}
+    for i, text in enumerate(texts):
+        if len(text.strip()) > 0:
+            positions.setdefault(text, []).append(i)
+    
+    cache = get_text_cache() if positions else None
+    misses = {}  # cache key -> texts that normalize to it
+    for text in positions:
+        cached = cache.get(text)
+        if cached is None:
+            misses.setdefault(cache.key(text), []).append(text)
+            continue
+        for i in positions[text]:
+            results[i] = _bert_result(text, cached)
+    
+    if not misses or not get_sentiment_analyzer():
+        return results
+    
+    groups = list(misses.values())
+    to_score = [group[0] for group in groups]
+    if inference_service.enabled():
+        # Combined with other requests' texts by the shared worker
+        try:
+            outputs = sentiment_batcher.run(to_score)
+        except inference_service.Overloaded:
+            raise
+        except Exception:
+            outputs = [None] * len(groups)
+    else:
+        outputs = _run_sentiment(to_score, batch_size)
+    
+    for group, scored in zip(groups, outputs):
+        if scored is None:
+            continue
+        cache.set(group[0], scored)
+        for text in group:
+            for i in positions[text]:
+                results[i] = _bert_result(text, scored)
+    return results
 
 def analyze_text_with_bert(text):
     """
@@ -26,17 +359,7 @@ def analyze_text_with_bert(text):
     Returns:
         dict: Analysis results with quality score
     """
-    if sentiment_analyzer and len(text.strip()) > 0:
-        try:
-            result = sentiment_analyzer(text[:512])[0]  # BERT limit
-            return {
-                'quality': 'good' if result['label'] == 'POSITIVE' and result['score'] > 0.7 else 'needs_improvement',
-                'confidence': result['score'],
-                'descriptiveness': 'high' if len(text.split()) > 3 else 'low'
-            }
-        except:
-            pass
-    return None
+    return analyze_texts_with_bert([text])[0]
 
 def analyze_text(soup):
     """
@@ -44,27 +367,36 @@ def analyze_text(soup):
     Now enhanced with BERT transformer models when available!
     
     Args:
-        soup: BeautifulSoup parsed HTML
+        soup: BeautifulSoup parsed HTML or a PageContext
         
     Returns:
         list: NLP findings with text quality issues
     """
     try:
+        soup = page_soup(soup)
         findings = []
-        use_ai = TRANSFORMERS_AVAILABLE and sentiment_analyzer is not None
+        # The model itself is only loaded if the lexical tier escalates
+        use_ai = ai_available()
         issue_count = 0
         
-        # Analyze form labels with AI enhancement
-        labels = soup.find_all("label")
-        vague_words = ['click', 'here', 'this', 'that', 'enter', 'input']
+        label_texts = [label.get_text().strip() for label in soup.find_all("label")]
+        button_texts = [button.get_text().strip() for button in soup.find_all("button")]
+        vague_words = VAGUE_WORDS
+        vague_buttons = VAGUE_BUTTONS
+        
+        # Score every label on the page in one tiered call
+        ai_results = {}
+        if use_ai:
+            candidates = list(dict.fromkeys(t for t in label_texts if len(t) > 3))
+            ai_results = dict(zip(candidates, score_texts(candidates)))
         
-        for label in labels:
-            text = label.get_text().strip()
+        # Analyze form labels with AI enhancement
+        for text in label_texts:
             text_lower = text.lower()
             
             # Use AI to analyze text quality
             if use_ai and len(text) > 3:
-                ai_result = analyze_text_with_bert(text)
+                ai_result = ai_results.get(text)
                 if ai_result and ai_result['quality'] == 'needs_improvement':
                     issue_count += 1
                     findings.append(f"❌ Confusing label text: '{text}' - Users may not understand what this field is for")
@@ -77,21 +409,23 @@ def analyze_text(soup):
                 issue_count += 1
                 findings.append(f"❌ Unclear label: '{text}' - Be more specific about what information is needed")
         
+        # Button wording and the AI summary need a model that actually loaded;
+        # get() loads it once per process and is immediate after a failure.
+        model_ready = use_ai and get_sentiment_analyzer() is not None
+        
         # Analyze button text with AI
-        buttons = soup.find_all("button")
-        for button in buttons:
-            text = button.get_text().strip()
+        for text in button_texts:
             text_lower = text.lower()
             
             if not text:
                 issue_count += 1
                 findings.append("❌ Empty button - Add text that explains what the button does")
-            elif text_lower in ['click', 'submit', 'ok', 'go']:
+            elif text_lower in vague_buttons:
                 issue_count += 1
                 findings.append(f"❌ Vague button: '{text}' - Say what happens when clicked (e.g., 'Submit Form', 'Search Articles')")
-            elif use_ai and len(text) > 2:
-                ai_result = analyze_text_with_bert(text)
-                if ai_result and ai_result['descriptiveness'] == 'low':
+            elif model_ready and len(text) > 2:
+                # Descriptiveness is lexical (word count); no model call needed
+                if _descriptiveness(text) == 'low':
                     issue_count += 1
                     findings.append(f"⚠️ Button '{text}' could be clearer - Explain the button's purpose more specifically")
         
@@ -111,7 +445,7 @@ def analyze_text(soup):
             findings.append(f"⚠️ Found {link_issues} more links with unclear text - consider making them more descriptive")
         
         # Add summary at the top
-        if use_ai and issue_count > 0:
+        if model_ready and issue_count > 0:
             findings.insert(0, f"🤖 AI found {issue_count} text clarity issues that may confuse users")
         elif issue_count > 0:
             findings.insert(0, f"Found {issue_count} text clarity issues")
@@ -120,6 +454,8 @@ def analyze_text(soup):
         
         return findings
         
+    except inference_service.Overloaded:
+        raise
     except Exception as e:
         return [f"NLP analysis error: {str(e)}"]
 
@@ -0,0 +1,155 @@
+"""Parse-once page state shared by the rule, NLP, ML and vision stages.
+
+A `PageContext` owns the parsed tree of one page plus values derived from
+it (visible text, title, an `ElementIndex`). Every analysis entry point accepts either a raw
+HTML string, a BeautifulSoup tree or a `PageContext`, so a caller that
+runs several stages can parse the page once and hand the same context to
+all of them.
+"""
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+from .parsing import make_soup
+from .rule_engine import walk
+
+_UNSET = object()
+
+
+class ElementIndex:
+    """Lookup tables over every element of a page, built in one traversal.
+
+    Replaces repeated `find` / `find_all` calls inside loops with dict
+    lookups: elements by tag name, by id, labels by their `for` target,
+    elements by role and by any `aria-*` attribute.
+    """
+
+    def __init__(self, soup):
+        self.by_tag = {}
+        self.by_id = {}
+        self.labels_for = {}
+        self.by_role = {}
+        self.by_aria = {}
+        self._position = {}
+
+        for position, tag in enumerate(soup.descendants):
+            if not isinstance(tag, Tag):
+                continue
+            self._position[id(tag)] = position
+            self.by_tag.setdefault(tag.name, []).append(tag)
+
+            attrs = tag.attrs
+            if not attrs:
+                continue
+            tag_id = attrs.get('id')
+            if tag_id and tag_id not in self.by_id:
+                self.by_id[tag_id] = tag
+            if tag.name == 'label' and attrs.get('for'):
+                self.labels_for.setdefault(attrs['for'], []).append(tag)
+            if attrs.get('role'):
+                self.by_role.setdefault(attrs['role'], []).append(tag)
+            for name in attrs:
+                if name.startswith('aria-'):
+                    self.by_aria.setdefault(name, []).append(tag)
+
+    def tags(self, *names):
+        """Elements with any of `names`, in document order (like find_all)."""
+        if len(names) == 1:
+            return list(self.by_tag.get(names[0], ()))
+        found = [tag for name in set(names) for tag in self.by_tag.get(name, ())]
+        found.sort(key=lambda tag: self._position[id(tag)])
+        return found
+
+    def get_by_id(self, tag_id):
+        return self.by_id.get(tag_id)
+
+    def label_for(self, tag_id):
+        """First <label for=tag_id>, or None."""
+        labels = self.labels_for.get(tag_id)
+        return labels[0] if labels else None
+
+    def with_role(self, role):
+        return list(self.by_role.get(role, ()))
+
+    def with_aria(self, name):
+        """Elements carrying the `aria-*` attribute `name`, in document order."""
+        return list(self.by_aria.get(name, ()))
+
+
+class PageContext:
+    """A parsed page and lazily computed facts about it."""
+
+    def __init__(self, soup, html=None):
+        self.soup = soup
+        self.html = html
+        self._text = None
+        self._title = _UNSET
+        self._index = None
+
+    @classmethod
+    def from_html(cls, html, parser=None):
+        return cls(make_soup(html, parser), html)
+
+    @property
+    def text(self):
+        """Visible page text, identical to `soup.get_text()`."""
+        if self._text is None:
+            self._text = self.soup.get_text()
+        return self._text
+
+    @property
+    def title(self):
+        """Stripped <title> text, or None."""
+        if self._title is _UNSET:
+            title_tag = self.soup.find('title')
+            self._title = title_tag.get_text(strip=True) if title_tag else None
+        return self._title
+
+    @property
+    def index(self):
+        """`ElementIndex` for this page, built on first use."""
+        if self._index is None:
+            self._index = _soup_index(self.soup)
+        return self._index
+
+    def run_rules(self, rules):
+        """Run rules in one pass, keeping the page text the walk collects."""
+        text = walk(self.soup, rules)
+        if text is not None and self._text is None:
+            self._text = text
+        return {rule.name: rule.result() for rule in rules}
+
+
+def as_page_context(page, parser=None):
+    """Wrap an HTML string or BeautifulSoup tree in a PageContext."""
+    if isinstance(page, PageContext):
+        return page
+    if isinstance(page, BeautifulSoup):
+        return PageContext(page)
+    return PageContext.from_html(page, parser)
+
+
+def page_soup(page):
+    """Return the parsed tree for a PageContext, soup or HTML string."""
+    return as_page_context(page).soup
+
+
+def _soup_index(soup):
+    # Kept on the soup itself so checks called one by one with the same
+    # bare soup share an index. Read through __dict__: attribute access on
+    # a Tag falls back to find().
+    index = soup.__dict__.get('_finaccai_index')
+    if index is None:
+        index = soup._finaccai_index = ElementIndex(soup)
+    return index
+
+
+def page_index(page):
+    """Return the ElementIndex for a PageContext, soup or HTML string.
+
+    The index is built once per soup and reused by later calls, so the
+    soup must not be modified after the first check runs on it.
+    """
+    if isinstance(page, BeautifulSoup):
+        return _soup_index(page)
+    return as_page_context(page).index
@@ -0,0 +1,70 @@
+"""Parser backend selection for every place FinAccAI builds a DOM.
+
+The tree builder is chosen with the FINACCAI_PARSER environment variable
+(or the `parser` argument of `make_soup`):
+
+    html.parser   pure-Python stdlib parser (default, always available)
+    lxml          libxml2 C parser, typically 5-10x faster
+    html5-parser  C html5 parser producing a BeautifulSoup tree
+    auto          lxml when installed, otherwise html.parser
+
+Every backend yields a regular BeautifulSoup tree, so the checks run
+unchanged on top of it.
+"""
+
+import os
+
+from bs4 import BeautifulSoup
+
+DEFAULT_PARSER = os.environ.get("FINACCAI_PARSER", "html.parser")
+
+BACKENDS = ("html.parser", "lxml", "html5-parser")
+
+
+def backend_available(name):
+    """Return True when the parser backend `name` can be imported."""
+    if name == "html.parser":
+        return True
+    try:
+        if name == "lxml":
+            import lxml.etree  # noqa: F401
+        elif name == "html5-parser":
+            import html5_parser  # noqa: F401
+        else:
+            return False
+    except Exception:
+        # html5_parser raises RuntimeError when its libxml2 differs from lxml's
+        return False
+    return True
+
+
+def available_backends():
+    return [name for name in BACKENDS if backend_available(name)]
+
+
+def resolve_parser(name=None):
+    """Map a configured parser name to an installed backend."""
+    name = (name or DEFAULT_PARSER).strip().lower()
+    if name == "auto":
+        return "lxml" if backend_available("lxml") else "html.parser"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown parser backend '{name}'. Choose from: {', '.join(BACKENDS)}, auto")
+    if not backend_available(name):
+        raise ValueError(f"Parser backend '{name}' is not installed")
+    return name
+
+
+def set_default_parser(name):
+    """Change the process-wide default backend (e.g. from a CLI flag)."""
+    global DEFAULT_PARSER
+    DEFAULT_PARSER = resolve_parser(name)
+    return DEFAULT_PARSER
+
+
+def make_soup(html, parser=None):
+    """Parse `html` into a BeautifulSoup tree with the configured backend."""
+    backend = resolve_parser(parser)
+    if backend == "html5-parser":
+        from html5_parser import parse
+        return parse(html, treebuilder="soup", return_root=False)
+    return BeautifulSoup(html, backend)
@@ -0,0 +1,85 @@
+"""Shared Jinja2 environment for every HTML report.
+
+All report templates live in `finaccai/templates/`: the single-page report
+(`page_report.html`), the API server's report (`simple_report.html`) and
+the multi-site CLI report macros (`site_report.html`). They are loaded
+through one `Environment`, so each template is compiled once per process,
+and compiled code is kept in a bytecode cache so new processes (CLI runs,
+API workers) skip the compile step. Output is produced with
+`Template.generate()` and written chunk by chunk instead of building the
+whole document as one string. Values are HTML-escaped by default.
+
+    FINACCAI_TEMPLATE_CACHE   bytecode cache directory, or "off"
+                              (default data/template_cache)
+"""
+
+import os
+import threading
+from pathlib import Path
+
+from jinja2 import (Environment, FileSystemBytecodeCache, FileSystemLoader,
+                    select_autoescape)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+CACHE_DIR = os.environ.get(
+    "FINACCAI_TEMPLATE_CACHE",
+    str(Path(__file__).resolve().parents[1] / "data" / "template_cache"),
+)
+# Characters buffered before a streamed chunk is written out
+STREAM_BUFFER = 64
+
+_environment = None
+_environment_lock = threading.Lock()
+
+
+def _bytecode_cache():
+    if CACHE_DIR.lower() == "off":
+        return None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(CACHE_DIR)
+
+
+def get_environment():
+    """Return the process-wide Jinja2 environment, creating it on first use."""
+    global _environment
+    if _environment is None:
+        with _environment_lock:
+            if _environment is None:
+                _environment = Environment(
+                    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+                    autoescape=select_autoescape(["html"]),
+                    bytecode_cache=_bytecode_cache(),
+                    auto_reload=False,
+                    trim_blocks=True,
+                    lstrip_blocks=True,
+                )
+    return _environment
+
+
+def get_template(name):
+    return get_environment().get_template(name)
+
+
+def macros(name):
+    """The macros defined in template `name`, e.g. `macros("site_report.html").card(...)`."""
+    return get_template(name).module
+
+
+def stream(name, **context):
+    """Iterate over the rendered chunks of template `name`."""
+    return get_template(name).generate(**context)
+
+
+def render(name, **context):
+    return get_template(name).render(**context)
+
+
+def render_to_file(name, output_path, **context):
+    """Stream template `name` into `output_path` (UTF-8) and return the path."""
+    template_stream = get_template(name).stream(**context)
+    template_stream.enable_buffering(STREAM_BUFFER)
+    template_stream.dump(str(output_path), encoding="utf-8")
+    return output_path
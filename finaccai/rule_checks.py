@@ -4,10 +4,12 @@ from axe_selenium_python import Axe
 from selenium import webdriver
 from PIL import Image, ImageStat
 
+from .page_context import page_index
+
 def check_missing_alt(dom):
     """Find images lacking alt attributes."""
     issues = []
-    for img in dom.find_all("img"):
+    for img in page_index(dom).tags("img"):
         if not img.get("alt"):
             issues.append({"type": "MissingAlt", "node": img.name, "details": str(img)})
     return issues
@@ -15,10 +17,11 @@ def check_missing_alt(dom):
 def check_label_associations(dom):
     """Ensure <input> elements have associated <label>."""
     issues = []
-    inputs = dom.find_all(["input", "select", "textarea"])
+    index = page_index(dom)
+    inputs = index.tags("input", "select", "textarea")
     for element in inputs:
         id_attr = element.get("id")
-        label = dom.find("label", attrs={"for": id_attr}) if id_attr else None
+        label = index.label_for(id_attr) if id_attr else None
         if not label:
             issues.append({"type": "MissingLabel", "node": element.name, "details": str(element)})
     return issues
@@ -40,7 +43,7 @@ def check_color_contrast(dom, screenshot):
 def check_keyboard_navigation(dom):
     """Verify keyboard navigable elements (e.g. focusable form controls)."""
     issues = []
-    focusables = dom.find_all(["a", "button", "input", "select", "textarea"])
+    focusables = page_index(dom).tags("a", "button", "input", "select", "textarea")
     for elem in focusables:
         tabindex = elem.get("tabindex")
         if tabindex == "-1":
@@ -50,7 +53,7 @@ def check_keyboard_navigation(dom):
 def check_chart_descriptions(dom, screenshot):
     """Ensure charts (bar/line/pie) have descriptive alt text."""
     issues = []
-    for img in dom.find_all("img"):
+    for img in page_index(dom).tags("img"):
         src = img.get("src", "")
         if "chart" in src or "graph" in src:
             alt = img.get("alt", "")
@@ -61,7 +64,7 @@ def check_chart_descriptions(dom, screenshot):
 def check_table_headers(dom):
     """Check that tables with numeric data use proper <th> tags."""
     issues = []
-    tables = dom.find_all("table")
+    tables = page_index(dom).tags("table")
     for table in tables:
         headers = table.find_all("th")
         if not headers:
@@ -72,9 +75,11 @@ def check_form_workflow(dom):
     """Placeholder for multi-step form accessibility checks."""
     issues = []
     # Example: check for presence of ARIA live regions for form updates
-    forms = dom.find_all("form")
+    index = page_index(dom)
+    forms = index.tags("form")
+    # Live regions are page-wide, so look them up once rather than per form
+    live_regions = index.with_aria("aria-live")
     for form in forms:
-        live_regions = dom.find_all(attrs={"aria-live": True})
         if not live_regions:
             issues.append({"type": "MissingLiveRegion", "node": "form", "details": str(form)})
     return issues
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""Single-pass rule engine for the accessibility checks.
+
+Every check in `finaccai.script` is written as a `Rule` that declares the
+tag names and attribute names it cares about, and whether it needs the page
+text. `run_rules` walks the parsed tree exactly once and dispatches each
+node only to the rules interested in it, so adding a check no longer adds
+another full `find_all` pass over the document.
+"""
+
+from bs4.element import CData, NavigableString, Tag
+
+# Same default as bs4's get_text(): visible strings only, no comments,
+# doctypes, script or stylesheet contents.
+DEFAULT_TEXT_TYPES = {NavigableString, CData}
+
+
+class Rule:
+    """Base class for a check driven by `run_rules`.
+
+    Subclasses set:
+        name   key of the rule's result in the `run_rules` output
+        tags   tag names for which `start(tag)` / `end(tag)` are called
+        attrs  attribute names; `attr(tag, name)` is called for each tag carrying one
+        text   True to receive the concatenated page text via `page_text(text)`
+
+    and return their findings from `result()`.
+    """
+
+    name = None
+    tags = ()
+    attrs = ()
+    text = False
+
+    def start(self, tag):
+        pass
+
+    def end(self, tag):
+        pass
+
+    def attr(self, tag, name):
+        pass
+
+    def page_text(self, text):
+        pass
+
+    def result(self):
+        return []
+
+
+def _text_types(soup):
+    types = getattr(soup, 'interesting_string_types', None) or DEFAULT_TEXT_TYPES
+    return {types} if isinstance(types, type) else types
+
+
+def walk(soup, rules):
+    """Walk `soup` once, dispatching nodes to `rules`.
+
+    Returns the page text (as `soup.get_text()` would) when any rule asked
+    for it, otherwise None.
+    """
+    starts, ends, attr_rules = {}, {}, {}
+    for rule in rules:
+        for name in rule.tags:
+            starts.setdefault(name, []).append(rule.start)
+            ends.setdefault(name, []).append(rule.end)
+        for name in rule.attrs:
+            attr_rules.setdefault(name, []).append(rule)
+    text_rules = [rule for rule in rules if rule.text]
+    text_types = _text_types(soup)
+    text_parts = [] if text_rules else None
+
+    # Iterative depth-first walk with explicit enter/exit events so rules
+    # can track containment without recursion limits on deep markup.
+    stack = [(None, iter(soup.contents))]
+    while stack:
+        node = next(stack[-1][1], None)
+        if node is None:
+            tag = stack.pop()[0]
+            if tag is not None:
+                for end in ends.get(tag.name, ()):
+                    end(tag)
+            continue
+
+        if isinstance(node, Tag):
+            for start in starts.get(node.name, ()):
+                start(node)
+            if attr_rules:
+                for attr_name in node.attrs:
+                    for rule in attr_rules.get(attr_name, ()):
+                        rule.attr(node, attr_name)
+            stack.append((node, iter(node.contents)))
+        elif text_parts is not None and type(node) in text_types:
+            text_parts.append(node)
+
+    if text_parts is None:
+        return None
+    text = ''.join(text_parts)
+    for rule in text_rules:
+        rule.page_text(text)
+    return text
+
+
+def run_rules(soup, rules):
+    """Run `rules` in a single pass and return {rule.name: rule.result()}."""
+    walk(soup, rules)
+    return {rule.name: rule.result() for rule in rules}
+
+
+def run_rule(soup, rule):
+    """Run a single rule on its own and return its result."""
+    walk(soup, [rule])
+    return rule.result()
@@ -9,10 +9,14 @@ level for backward compatibility.
 import csv
 import os
 import re
+import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
+from . import http_client, rendering
+from .page_context import as_page_context
+from .rule_engine import Rule, run_rule
 
 
 # -------------------------
@@ -23,9 +27,7 @@ from bs4 import BeautifulSoup
 def get_html(url):
     """Fetch HTML from a URL. Returns (html_text, error_message)."""
     try:
-        resp = requests.get(url, timeout=20)
-        resp.raise_for_status()
-        return resp.text, None
+        return http_client.get_text(url, timeout=20), None
     except Exception as e:
         return None, str(e)
 
@@ -33,61 +35,101 @@ def get_html(url):
 # -------------------------
 # Accessibility checks
 # -------------------------
+#
+# Each check is a `Rule` (see finaccai.rule_engine) so `run_checks` can
+# evaluate all of them in one walk over the tree. The `check_*` functions
+# run a single rule on its own and keep their original signatures.
 
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
 
-def check_images(soup):
-    """Check for <img> elements missing alt text."""
-    issues = []
-    for img in soup.find_all('img'):
-        alt = img.get('alt')
-        if alt is None or alt.strip() == '':
-            snippet = str(img)[:200].replace('\n', ' ')
-            issues.append(f"Image with missing/empty alt: {snippet}...")
-    return issues
 
+class ImagesRule(Rule):
+    """<img> elements missing alt text."""
+    name = 'images_missing_alt'
+    tags = ('img',)
 
-def check_inputs(soup):
-    """Check for <input> fields without a label or accessible name."""
-    issues = []
-
-    # All labels with 'for'
-    labels_for = {
-        label.get('for'): label.get_text().strip()
-        for label in soup.find_all('label') if label.get('for')
-    }
-
-    # Inputs wrapped inside a label
-    wrapped_ids = set()
-    for label in soup.find_all('label'):
-        inp = label.find('input')
-        if inp and inp.get('id'):
-            wrapped_ids.add(inp.get('id'))
+    def __init__(self):
+        self.issues = []
 
-    for inp in soup.find_all('input'):
-        input_id = inp.get('id')
-        has_label = False
+    def start(self, img):
+        alt = img.get('alt')
+        if alt is None or alt.strip() == '':
+            snippet = str(img)[:200].replace('\n', ' ')
+            self.issues.append(f"Image with missing/empty alt: {snippet}...")
 
-        # Explicit for="id"
-        if input_id and input_id in labels_for:
-            has_label = True
+    def result(self):
+        return self.issues
 
-        # Wrapped in a <label>
-        if input_id and input_id in wrapped_ids:
-            has_label = True
 
-        # aria-label / aria-labelledby
-        if inp.get('aria-label') or inp.get('aria-labelledby'):
-            has_label = True
+def check_images(soup):
+    """Check for <img> elements missing alt text."""
+    return run_rule(soup, ImagesRule())
+
+
+class InputsRule(Rule):
+    """<input> fields without a label or accessible name."""
+    name = 'inputs_missing_label'
+    tags = ('label', 'input')
+
+    def __init__(self):
+        self.inputs = []
+        # All labels with 'for'
+        self.labels_for = set()
+        # Inputs wrapped inside a label (the first input of each label)
+        self.wrapped_ids = set()
+        # Open <label> elements that have not seen an input yet
+        self.open_labels = []
+
+    def start(self, tag):
+        if tag.name == 'label':
+            if tag.get('for'):
+                self.labels_for.add(tag.get('for'))
+            self.open_labels.append(True)
+            return
+
+        for i, waiting in enumerate(self.open_labels):
+            if waiting:
+                self.open_labels[i] = False
+                if tag.get('id'):
+                    self.wrapped_ids.add(tag.get('id'))
+        self.inputs.append(tag)
+
+    def end(self, tag):
+        if tag.name == 'label':
+            self.open_labels.pop()
+
+    def result(self):
+        issues = []
+        for inp in self.inputs:
+            input_id = inp.get('id')
+            has_label = False
+
+            # Explicit for="id"
+            if input_id and input_id in self.labels_for:
+                has_label = True
+
+            # Wrapped in a <label>
+            if input_id and input_id in self.wrapped_ids:
+                has_label = True
+
+            # aria-label / aria-labelledby
+            if inp.get('aria-label') or inp.get('aria-labelledby'):
+                has_label = True
+
+            # Skip some non-user-input types
+            input_type = (inp.get('type') or '').lower()
+            if input_type in ['hidden', 'submit', 'button', 'image', 'reset']:
+                has_label = True
+
+            if not has_label:
+                snippet = str(inp)[:200].replace('\n', ' ')
+                issues.append(f"Input without label/aria-label: {snippet}...")
+        return issues
 
-        # Skip some non-user-input types
-        input_type = (inp.get('type') or '').lower()
-        if input_type in ['hidden', 'submit', 'button', 'image', 'reset']:
-            has_label = True
 
-        if not has_label:
-            snippet = str(inp)[:200].replace('\n', ' ')
-            issues.append(f"Input without label/aria-label: {snippet}...")
-    return issues
+def check_inputs(soup):
+    """Check for <input> fields without a label or accessible name."""
+    return run_rule(soup, InputsRule())
 
 
 def parse_color(color_str):
@@ -125,28 +167,26 @@ def contrast_ratio(l1, l2):
     return (lighter + 0.05) / (darker + 0.05)
 
 
-def check_contrast(soup, level='AAA'):
-    """
-    Check inline styles for color contrast issues.
-    Only handles hex colors in 'color' and 'background-color'.
-    
-    Args:
-        soup: BeautifulSoup object
-        level: 'AA' (4.5:1 normal, 3:1 large) or 'AAA' (7:1 normal, 4.5:1 large)
-    """
-    issues = []
+class ContrastRule(Rule):
+    """Inline-style color contrast below the WCAG ratio for `level`."""
+    name = 'low_contrast'
+    attrs = ('style',)
+
     color_prop = re.compile(r'color\s*:\s*([^;]+)', re.IGNORECASE)
     bg_prop = re.compile(r'background-color\s*:\s*([^;]+)', re.IGNORECASE)
-    
-    # AAA requires 7:1 for normal text, 4.5:1 for large text (18pt+ or 14pt+ bold)
-    # AA requires 4.5:1 for normal text, 3:1 for large text
-    min_ratio = 7.0 if level == 'AAA' else 4.5
-    min_ratio_large = 4.5 if level == 'AAA' else 3.0
 
-    for elem in soup.find_all(style=True):
+    def __init__(self, level='AAA'):
+        self.issues = []
+        self.level = level
+        # AAA requires 7:1 for normal text, 4.5:1 for large text (18pt+ or 14pt+ bold)
+        # AA requires 4.5:1 for normal text, 3:1 for large text
+        self.min_ratio = 7.0 if level == 'AAA' else 4.5
+        self.min_ratio_large = 4.5 if level == 'AAA' else 3.0
+
+    def attr(self, elem, name):
         style = elem['style']
-        color_match = color_prop.search(style)
-        bg_match = bg_prop.search(style)
+        color_match = self.color_prop.search(style)
+        bg_match = self.bg_prop.search(style)
         if color_match and bg_match:
             fg = parse_color(color_match.group(1))
             bg = parse_color(bg_match.group(1))
@@ -154,200 +194,310 @@ def check_contrast(soup, level='AAA'):
                 l1 = rel_luminance(*fg)
                 l2 = rel_luminance(*bg)
                 ratio = contrast_ratio(l1, l2)
-                
+
                 # For simplicity, assume normal text (not checking font size)
-                if ratio < min_ratio:
+                if ratio < self.min_ratio:
                     text = elem.get_text(strip=True)
                     short_text = (text[:80] + '...') if len(text) > 80 else text
-                    issues.append(
-                        f"Low contrast ({level} Level) (ratio {ratio:.2f}, needs {min_ratio}:1) for text: '{short_text}' | style='{style}'"
+                    self.issues.append(
+                        f"Low contrast ({self.level} Level) (ratio {ratio:.2f}, needs {self.min_ratio}:1) for text: '{short_text}' | style='{style}'"
                     )
-    return issues
 
+    def result(self):
+        return self.issues
 
-def check_headings(soup):
-    """Check heading tags for skipped levels (e.g. h1 -> h3)."""
-    issues = []
-    heading_tags = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
-    last_level = 0
 
-    for tag in soup.find_all(heading_tags):
+def check_contrast(soup, level='AAA'):
+    """
+    Check inline styles for color contrast issues.
+    Only handles hex colors in 'color' and 'background-color'.
+    
+    Args:
+        soup: BeautifulSoup object
+        level: 'AA' (4.5:1 normal, 3:1 large) or 'AAA' (7:1 normal, 4.5:1 large)
+    """
+    return run_rule(soup, ContrastRule(level=level))
+
+
+class HeadingsRule(Rule):
+    """Heading tags that skip levels (e.g. h1 -> h3)."""
+    name = 'heading_issues'
+    tags = HEADING_TAGS
+
+    def __init__(self):
+        self.issues = []
+        self.last_level = 0
+
+    def start(self, tag):
         level = int(tag.name[1])
-        if last_level and level > last_level + 1:
+        if self.last_level and level > self.last_level + 1:
             text = tag.get_text(strip=True)
-            issues.append(
-                f"Skipped heading level: <{tag.name}> follows <h{last_level}> | text='{text}'"
+            self.issues.append(
+                f"Skipped heading level: <{tag.name}> follows <h{self.last_level}> | text='{text}'"
             )
-        last_level = level
-    return issues
+        self.last_level = level
+
+    def result(self):
+        return self.issues
+
+
+def check_headings(soup):
+    """Check heading tags for skipped levels (e.g. h1 -> h3)."""
+    return run_rule(soup, HeadingsRule())
+
+
+class LanguageRule(Rule):
+    """AAA 3.1.2: the <html> element declares a language."""
+    name = 'language_attributes'
+    tags = ('html',)
+
+    def __init__(self):
+        self.html_tag = None
+
+    def start(self, tag):
+        if self.html_tag is None:
+            self.html_tag = tag
+
+    def result(self):
+        issues = []
+        # Check if html tag has lang attribute
+        if self.html_tag is not None and not self.html_tag.get('lang'):
+            issues.append("Missing 'lang' attribute on <html> tag - required for screen readers")
+        return issues
 
 
 def check_language_attributes(soup):
     """AAA: Check for lang attributes on elements with different languages (3.1.2)."""
-    issues = []
-    
-    # Check if html tag has lang attribute
-    html_tag = soup.find('html')
-    if html_tag and not html_tag.get('lang'):
-        issues.append("Missing 'lang' attribute on <html> tag - required for screen readers")
-    
-    # In a real implementation, we'd check for text in different languages
-    # For now, we'll just warn if no lang attributes found on any element
-    elements_with_lang = soup.find_all(attrs={'lang': True})
-    
-    return issues
+    return run_rule(soup, LanguageRule())
 
 
-def check_link_context(soup):
-    """AAA: Check that link purpose can be determined from link text alone (2.4.9)."""
-    issues = []
-    
+class LinkContextRule(Rule):
+    """AAA 2.4.9: link purpose can be determined from link text alone."""
+    name = 'link_context'
+    tags = ('a',)
+
     # Links that need context from surrounding text (AAA requires standalone clarity)
     vague_link_texts = ['click here', 'here', 'more', 'read more', 'link', 'this', 'continue', 'next', 'previous']
-    
-    for link in soup.find_all('a'):
+
+    def __init__(self):
+        self.issues = []
+
+    def start(self, link):
         link_text = link.get_text(strip=True).lower()
         href = link.get('href', '')
-        
+
         # Skip anchor links and empty links
         if not href or href.startswith('#'):
-            continue
-            
+            return
+
         # Check for vague link text
-        if link_text in vague_link_texts:
-            issues.append(
+        if link_text in self.vague_link_texts:
+            self.issues.append(
                 f"AAA: Link text '{link_text}' needs context. Link purpose should be clear from text alone | href='{href[:60]}'"
             )
-        
+
         # Check for very short link text (< 3 characters)
         elif len(link_text) < 3 and link_text not in ['go', 'ok']:
-            issues.append(
+            self.issues.append(
                 f"AAA: Link text too short: '{link_text}'. Make link purpose clear from text | href='{href[:60]}'"
             )
-    
-    return issues
 
+    def result(self):
+        return self.issues
 
-def check_section_headings(soup):
-    """AAA: Check that content is organized with section headings (2.4.10)."""
-    issues = []
-    
-    # Check if page has meaningful structure with headings
-    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-    
-    # Count paragraphs and other content
-    paragraphs = soup.find_all('p')
-    sections = soup.find_all(['section', 'article', 'div'])
-    
-    # If page has substantial content but few headings, suggest more structure
-    if len(paragraphs) > 10 and len(headings) < 3:
-        issues.append(
-            f"AAA: Page has {len(paragraphs)} paragraphs but only {len(headings)} headings. Use more headings to organize content into sections."
-        )
-    
-    # Check if sections have headings
-    section_tags = soup.find_all(['section', 'article', 'nav', 'aside'])
-    for section in section_tags:
-        has_heading = section.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        if not has_heading:
-            tag_id = section.get('id', 'unknown')
+
+def check_link_context(soup):
+    """AAA: Check that link purpose can be determined from link text alone (2.4.9)."""
+    return run_rule(soup, LinkContextRule())
+
+
+class SectionHeadingsRule(Rule):
+    """AAA 2.4.10: content is organized with section headings."""
+    name = 'section_headings'
+    section_tags = ('section', 'article', 'nav', 'aside')
+    tags = HEADING_TAGS + ('p',) + section_tags
+
+    def __init__(self):
+        self.headings = 0
+        self.paragraphs = 0
+        # [element, has_heading] in document order, plus the currently open ones
+        self.sections = []
+        self.open_sections = []
+
+    def start(self, tag):
+        if tag.name in self.section_tags:
+            record = [tag, False]
+            self.sections.append(record)
+            self.open_sections.append(record)
+        elif tag.name == 'p':
+            self.paragraphs += 1
+        else:
+            self.headings += 1
+            if self.open_sections:
+                self.open_sections[-1][1] = True
+
+    def end(self, tag):
+        if tag.name in self.section_tags:
+            record = self.open_sections.pop()
+            # A heading inside a nested section also counts for its ancestors
+            if record[1] and self.open_sections:
+                self.open_sections[-1][1] = True
+
+    def result(self):
+        issues = []
+
+        # If page has substantial content but few headings, suggest more structure
+        if self.paragraphs > 10 and self.headings < 3:
             issues.append(
-                f"AAA: <{section.name}> element (id='{tag_id}') should have a heading to identify its purpose"
+                f"AAA: Page has {self.paragraphs} paragraphs but only {self.headings} headings. Use more headings to organize content into sections."
             )
-    
-    return issues
 
+        # Check if sections have headings
+        for section, has_heading in self.sections:
+            if not has_heading:
+                tag_id = section.get('id', 'unknown')
+                issues.append(
+                    f"AAA: <{section.name}> element (id='{tag_id}') should have a heading to identify its purpose"
+                )
 
-def check_abbreviations(soup):
-    """AAA: Check for abbreviations that should be expanded (3.1.4)."""
-    issues = []
-    
-    # Look for common abbreviation patterns
-    abbr_tags = soup.find_all('abbr')
-    
-    # Check if abbr tags have title attribute
-    for abbr in abbr_tags:
+        return issues
+
+
+def check_section_headings(soup):
+    """AAA: Check that content is organized with section headings (2.4.10)."""
+    return run_rule(soup, SectionHeadingsRule())
+
+
+class AbbreviationsRule(Rule):
+    """AAA 3.1.4: abbreviations are expanded."""
+    name = 'abbreviations'
+    tags = ('abbr',)
+    text = True
+
+    # Common abbreviations that should be marked with <abbr>
+    common_abbrs = set(['HTML', 'CSS', 'API', 'URL', 'HTTP', 'HTTPS', 'PDF', 'XML', 'JSON', 'SQL', 'USA', 'UK', 'EU', 'AI', 'ML', 'NLP'])
+
+    def __init__(self):
+        self.issues = []
+        # Text of <abbr> tags, i.e. what soup.find('abbr', string=...) would match
+        self.marked = set()
+
+    def start(self, abbr):
+        # Check if abbr tags have title attribute
         if not abbr.get('title'):
             abbr_text = abbr.get_text(strip=True)
-            issues.append(
+            self.issues.append(
                 f"AAA: <abbr> tag '{abbr_text}' missing title attribute to provide expansion"
             )
-    
-    # Detect potential abbreviations in text that aren't marked up
-    text_content = soup.get_text()
-    
-    # Common abbreviations that should be marked with <abbr>
-    import re
-    potential_abbrs = re.findall(r'\b[A-Z]{2,}\b', text_content)
-    common_abbrs = set(['HTML', 'CSS', 'API', 'URL', 'HTTP', 'HTTPS', 'PDF', 'XML', 'JSON', 'SQL', 'USA', 'UK', 'EU', 'AI', 'ML', 'NLP'])
-    
-    found_unmarked = []
-    for abbr in potential_abbrs[:5]:  # Limit to first 5
-        if abbr in common_abbrs:
+        if abbr.string is not None:
+            self.marked.add(str(abbr.string))
+
+    def page_text(self, text_content):
+        # Detect potential abbreviations in text that aren't marked up
+        potential_abbrs = re.findall(r'\b[A-Z]{2,}\b', text_content)
+
+        found_unmarked = []
+        for abbr in potential_abbrs[:5]:  # Limit to first 5
             # Check if it's already in an abbr tag
-            if not soup.find('abbr', string=abbr):
+            if abbr in self.common_abbrs and abbr not in self.marked:
                 found_unmarked.append(abbr)
-    
-    if found_unmarked:
-        issues.append(
-            f"AAA: Found potential abbreviations that should use <abbr> tag: {', '.join(set(found_unmarked)[:5])}"
-        )
-    
-    return issues
+
+        if found_unmarked:
+            self.issues.append(
+                f"AAA: Found potential abbreviations that should use <abbr> tag: {', '.join(list(dict.fromkeys(found_unmarked))[:5])}"
+            )
+
+    def result(self):
+        return self.issues
+
+
+def check_abbreviations(soup):
+    """AAA: Check for abbreviations that should be expanded (3.1.4)."""
+    return run_rule(soup, AbbreviationsRule())
+
+
+class UnusualWordsRule(Rule):
+    """AAA 3.1.3: unusual words are defined (glossary or definitions)."""
+    name = 'unusual_words'
+    tags = ('dl', 'dfn')
+    attrs = ('class',)
+    text = True
+
+    glossary_class = re.compile(r'glossary|definition')
+    # Check for technical jargon indicators
+    technical_indicators = ['algorithm', 'framework', 'methodology', 'implementation', 'infrastructure']
+
+    def __init__(self):
+        self.has_glossary = False
+        self.issues = []
+
+    def start(self, tag):
+        self.has_glossary = True
+
+    def attr(self, tag, name):
+        if self.has_glossary:
+            return
+        classes = tag.get('class')
+        classes = classes if isinstance(classes, list) else [classes]
+        if any(self.glossary_class.search(c) for c in classes) or self.glossary_class.search(' '.join(classes)):
+            self.has_glossary = True
+
+    def page_text(self, text_content):
+        # This is a simplified check - in production you'd use a dictionary API
+        word_count = len(text_content.split())
+
+        # If page has substantial text but no definitions/glossary, suggest adding one
+        if word_count > 500 and not self.has_glossary:
+            found_technical = [word for word in self.technical_indicators if word in text_content.lower()]
+
+            if found_technical:
+                self.issues.append(
+                    f"AAA: Page contains technical terms ({', '.join(found_technical[:3])}...) but no glossary or definitions. Consider adding a glossary for unusual words."
+                )
+
+    def result(self):
+        return self.issues
 
 
 def check_unusual_words(soup):
     """AAA: Check for complex or unusual words that may need definitions (3.1.3)."""
-    issues = []
-    
-    # This is a simplified check - in production you'd use a dictionary API
-    # Look for glossary or definition lists
-    has_glossary = soup.find(['dl', 'dfn']) or soup.find(attrs={'class': re.compile(r'glossary|definition')})
-    
-    text_content = soup.get_text()
-    word_count = len(text_content.split())
-    
-    # If page has substantial text but no definitions/glossary, suggest adding one
-    if word_count > 500 and not has_glossary:
-        # Check for technical jargon indicators
-        technical_indicators = ['algorithm', 'framework', 'methodology', 'implementation', 'infrastructure']
-        found_technical = [word for word in technical_indicators if word in text_content.lower()]
-        
-        if found_technical:
-            issues.append(
-                f"AAA: Page contains technical terms ({', '.join(found_technical[:3])}...) but no glossary or definitions. Consider adding a glossary for unusual words."
-            )
-    
-    return issues
+    return run_rule(soup, UnusualWordsRule())
 
 
-def run_checks(html_content, level='AAA'):
+def build_rules(level='AAA'):
+    """Return fresh rule instances for every check enabled at `level`."""
+    rules = [
+        # Level A & AA checks
+        ImagesRule(),
+        InputsRule(),
+        ContrastRule(level=level),
+        HeadingsRule(),
+    ]
+
+    # Add AAA-specific checks
+    if level == 'AAA':
+        rules += [
+            LanguageRule(),
+            LinkContextRule(),
+            SectionHeadingsRule(),
+            AbbreviationsRule(),
+            UnusualWordsRule(),
+        ]
+    return rules
+
+
+def run_checks(html_content, level='AAA', parser=None):
     """Run all checks on HTML content and return a dict of issues.
+
+    All checks share a single walk over the parsed tree.
     
     Args:
-        html_content: HTML string to analyze
+        html_content: HTML string, BeautifulSoup tree or PageContext to analyze
         level: 'AA' or 'AAA' - WCAG compliance level to check
+        parser: parser backend (see finaccai.parsing); defaults to FINACCAI_PARSER
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    issues = {
-        # Level A & AA checks
-        'images_missing_alt': check_images(soup),
-        'inputs_missing_label': check_inputs(soup),
-        'low_contrast': check_contrast(soup, level=level),
-        'heading_issues': check_headings(soup),
-    }
-    
-    # Add AAA-specific checks
-    if level == 'AAA':
-        issues.update({
-            'language_attributes': check_language_attributes(soup),
-            'link_context': check_link_context(soup),
-            'section_headings': check_section_headings(soup),
-            'abbreviations': check_abbreviations(soup),
-            'unusual_words': check_unusual_words(soup),
-        })
-    
-    return issues
+    page = as_page_context(html_content, parser)
+    return page.run_rules(build_rules(level))
 
 
 # -------------------------
@@ -355,223 +505,237 @@ def run_checks(html_content, level='AAA'):
 # -------------------------
 
 
+CATEGORY_LABELS = {
+    'images_missing_alt': "Images missing alt text",
+    'inputs_missing_label': "Inputs without labels",
+    'low_contrast': "Low color contrast",
+    'heading_issues': "Heading structure issues",
+}
+
+# Markup lives in templates/site_report.html; the writers below call its macros.
+REPORT_TEMPLATE = "site_report.html"
+
+
+def _report_macros():
+    return rendering.macros(REPORT_TEMPLATE)
+
+
+def site_has_issues(site):
+    issues = site.get("issues", {})
+    return not site.get("error") and any(issues.get(k) for k in issues)
+
+
+def site_status(site):
+    """'error', 'issues' or 'clean'."""
+    if site.get("error"):
+        return "error"
+    return "issues" if site_has_issues(site) else "clean"
+
+
+def render_site_card(site, anchor=None):
+    """Return the HTML card for one entry of `results_by_site`."""
+    return str(_report_macros().card(site, site_status(site), CATEGORY_LABELS, anchor))
+
+
+class ReportWriter:
+    """
+    Stream a multi-site HTML report to `output_path`.
+
+    The header is written on open, each site card as soon as `add()` is
+    called, and the summary counts with the footer on `close()`. Only the
+    counters are kept in memory, so report size does not depend on the
+    number of sites. Use as a context manager:
+
+        with ReportWriter(path) as report:
+            for site in scan_sites(urls):
+                report.add(site)
+    """
+
+    def __init__(self, output_path, nav=None):
+        self.output_path = output_path
+        self.total_sites = 0
+        self.sites_with_issues = 0
+        self.sites_with_errors = 0
+        self._macros = _report_macros()
+        self._file = open(output_path, "w", encoding="utf-8")
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._file.write(self._macros.head(now, nav))
+
+    def count(self, site):
+        """Update the summary counters for `site` and return its status."""
+        self.total_sites += 1
+        status = site_status(site)
+        if status == "error":
+            self.sites_with_errors += 1
+        elif status == "issues":
+            self.sites_with_issues += 1
+        return status
+
+    def add(self, site, anchor=None):
+        """Write the card for one site result."""
+        status = self.count(site)
+        self._file.write(self._macros.card(site, status, CATEGORY_LABELS, anchor))
+
+    def write(self, markup):
+        """Write raw markup into the report body."""
+        self._file.write(markup)
+
+    def copy_from(self, path):
+        """Append the contents of the text file at `path` to the report body."""
+        with open(path, encoding="utf-8") as f:
+            shutil.copyfileobj(f, self._file)
+
+    def close(self, sortable=False):
+        """Write the summary and footer; safe to call more than once."""
+        if self._file.closed:
+            return
+        self._file.write(self._macros.foot(
+            self.total_sites, self.sites_with_issues, self.sites_with_errors, sortable
+        ))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ShardedReportWriter:
+    """
+    Split a multi-site report into pages of `shard_size` sites plus an index.
+
+    `output_path` becomes a small index page with a sortable table of issue
+    counts per site and per category; each row links to the site's card on
+    one of the pages in the directory next to it:
+
+        log/accessibility_report_<ts>.html             index
+        log/accessibility_report_<ts>/page-0001.html   sites 1..shard_size
+
+    Finished pages are rendered and written on a thread pool while results
+    keep arriving. At most `workers * 2` pages are in flight and index rows
+    are spooled to disk, so memory use stays bounded for any scan size.
+    """
+
+    def __init__(self, output_path, shard_size=100, workers=2, categories=None):
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        self.output_path = output_path
+        self.shard_size = shard_size
+        self.categories = list(categories or [rule.name for rule in build_rules()])
+        self.category_totals = {}
+        self.category_sites = {}
+        self.pages = 0
+
+        base = os.path.splitext(os.path.basename(output_path))[0]
+        self.pages_dir = os.path.join(os.path.dirname(output_path), base)
+        self._pages_href = base
+        os.makedirs(self.pages_dir, exist_ok=True)
+
+        self._macros = _report_macros()
+        self._index = ReportWriter(output_path)
+        self._rows_path = os.path.join(self.pages_dir, "index-rows.part")
+        self._rows = open(self._rows_path, "w", encoding="utf-8")
+        self._buffer = []
+        self._first_number = 1
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-page")
+        self._window = workers * 2
+        self._pending = deque()
+
+    @staticmethod
+    def page_name(page_number):
+        return f"page-{page_number:04d}.html"
+
+    def add(self, site):
+        """Queue one site result; full pages are handed to the writer pool."""
+        if len(self._buffer) == self.shard_size:
+            # Only flushed once the next site arrives, so the page knows it has a successor
+            self._submit(last=False)
+
+        status = self._index.count(site)
+        number = self._index.total_sites
+        self._buffer.append(site)
+
+        issues = {} if status == "error" else site.get("issues", {})
+        counts = {category: len(items) for category, items in issues.items()}
+        for category, count in counts.items():
+            self.category_totals[category] = self.category_totals.get(category, 0) + count
+            if count:
+                self.category_sites[category] = self.category_sites.get(category, 0) + 1
+        href = f"{self._pages_href}/{self.page_name(self.pages + 1)}#site-{number}"
+        self._rows.write(self._macros.index_row(number, href, site, status, counts, self.categories))
+
+    def _submit(self, last):
+        self.pages += 1
+        sites, self._buffer = self._buffer, []
+        first_number = self._first_number
+        self._first_number += len(sites)
+        self._pending.append(self._executor.submit(
+            self._write_page, self.pages, first_number, sites, last
+        ))
+        while len(self._pending) > self._window:
+            self._pending.popleft().result()
+
+    def _write_page(self, page_number, first_number, sites, last):
+        nav = {
+            "index_href": "../" + os.path.basename(self.output_path),
+            "page_number": page_number,
+            "first": first_number,
+            "last": first_number + len(sites) - 1,
+            "previous_href": self.page_name(page_number - 1) if page_number > 1 else None,
+            "next_href": None if last else self.page_name(page_number + 1),
+        }
+        path = os.path.join(self.pages_dir, self.page_name(page_number))
+        with ReportWriter(path, nav=nav) as page:
+            for offset, site in enumerate(sites):
+                page.add(site, anchor=f"site-{first_number + offset}")
+
+    def close(self):
+        """Write the last page, wait for the pool, then assemble the index."""
+        if self._rows.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(last=True)
+            while self._pending:
+                self._pending.popleft().result()
+        finally:
+            self._executor.shutdown(wait=True)
+            self._rows.close()
+
+        index = self._index
+        index.write(self._macros.category_table(
+            self.category_totals, self.category_sites, CATEGORY_LABELS
+        ))
+        index.write(self._macros.sites_table_start(self.pages, self.categories, CATEGORY_LABELS))
+        index.copy_from(self._rows_path)
+        index.write(self._macros.sites_table_end())
+        index.close(sortable=True)
+        os.remove(self._rows_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 def generate_html_report(results_by_site, output_path):
     """
     Generate a single HTML report for all scanned sites.
 
-    results_by_site: list of dicts:
+    results_by_site: iterable of dicts (consumed as it is iterated):
         {
           "url": str,
           "title": str or None,
           "error": str or None,
-          "issues": {category: [str, ...]}
+          "issues": {category: [str, ...]},
+          "render_wait": float or None  (optional, dynamic pages only)
         }
     """
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    total_sites = len(results_by_site)
-    sites_with_errors = sum(1 for r in results_by_site if r.get("error"))
-    sites_with_issues = sum(
-        1 for r in results_by_site
-        if not r.get("error") and any(r["issues"].get(k) for k in r["issues"])
-    )
-
-    html_parts = []
-
-    html_parts.append("""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <title>FinAccAI Accessibility Report</title>
-  <style>
-    body {
-      font-family: Arial, sans-serif;
-      background: #f5f5f5;
-      margin: 0;
-      padding: 0;
-    }
-    header {
-      background: #003366;
-      color: white;
-      padding: 20px;
-    }
-    header h1 {
-      margin: 0 0 10px 0;
-      font-size: 24px;
-    }
-    header p {
-      margin: 4px 0;
-      font-size: 14px;
-    }
-    .container {
-      max-width: 1200px;
-      margin: 20px auto;
-      padding: 0 15px 30px 15px;
-    }
-    .summary {
-      background: white;
-      border-radius: 8px;
-      padding: 15px 20px;
-      margin-bottom: 20px;
-      box-shadow: 0 2px 4px rgba(0,0,0,0.08);
-    }
-    .summary span {
-      display: inline-block;
-      margin-right: 20px;
-      font-size: 14px;
-    }
-    .card {
-      background: white;
-      border-radius: 8px;
-      padding: 15px 20px;
-      margin-bottom: 20px;
-      box-shadow: 0 2px 4px rgba(0,0,0,0.08);
-    }
-    .card h2 {
-      margin-top: 0;
-      font-size: 18px;
-      word-break: break-all;
-    }
-    .url {
-      font-size: 13px;
-      color: #555;
-      margin-bottom: 5px;
-    }
-    .status-ok {
-      color: #1b5e20;
-      font-weight: bold;
-    }
-    .status-error {
-      color: #b71c1c;
-      font-weight: bold;
-    }
-    .tag {
-      display: inline-block;
-      padding: 2px 8px;
-      border-radius: 12px;
-      font-size: 11px;
-      margin-right: 6px;
-    }
-    .tag-issues {
-      background: #ffebee;
-      color: #c62828;
-    }
-    .tag-ok {
-      background: #e8f5e9;
-      color: #2e7d32;
-    }
-    .tag-error {
-      background: #fff3e0;
-      color: #ef6c00;
-    }
-    h3 {
-      margin-top: 15px;
-      font-size: 15px;
-      border-bottom: 1px solid #eee;
-      padding-bottom: 4px;
-    }
-    ul {
-      margin-top: 5px;
-      padding-left: 18px;
-      font-size: 13px;
-    }
-    li {
-      margin-bottom: 4px;
-    }
-    .no-issues {
-      font-size: 13px;
-      color: #2e7d32;
-      font-weight: bold;
-    }
-    footer {
-      text-align: center;
-      font-size: 11px;
-      color: #777;
-      padding: 10px 0 20px 0;
-    }
-  </style>
-</head>
-<body>
-<header>
-  <h1>FinAccAI Accessibility Report</h1>
-  <p>Generated: """ + now + """</p>
-</header>
-<div class="container">
-  <div class="summary">
-    <span><strong>Total sites scanned:</strong> """ + str(total_sites) + """</span>
-    <span><strong>Sites with issues:</strong> """ + str(sites_with_issues) + """</span>
-    <span><strong>Sites with errors:</strong> """ + str(sites_with_errors) + """</span>
-  </div>
-""")
-
-    for site in results_by_site:
-        url = site["url"]
-        title = site.get("title") or "(no title)"
-        error = site.get("error")
-        issues = site.get("issues", {})
-
-        has_any_issue = not error and any(issues.get(k) for k in issues)
-
-        html_parts.append('<div class="card">')
-        html_parts.append(f"<h2>{title}</h2>")
-        html_parts.append(f'<div class="url">{url}</div>')
-
-        if error:
-            html_parts.append(
-                f'<div class="status-error">Error fetching page: {error}</div>'
-            )
-            html_parts.append('<span class="tag tag-error">Fetch error</span>')
-        elif has_any_issue:
-            html_parts.append(
-                '<div class="status-error">Accessibility issues detected.</div>'
-            )
-            html_parts.append('<span class="tag tag-issues">Has issues</span>')
-        else:
-            html_parts.append(
-                '<div class="status-ok">No issues detected by current checks.</div>'
-            )
-            html_parts.append('<span class="tag tag-ok">Clean</span>')
-
-        if not error:
-            # Detail per category
-            for category, items in issues.items():
-                if category == 'images_missing_alt':
-                    cat_label = "Images missing alt text"
-                elif category == 'inputs_missing_label':
-                    cat_label = "Inputs without labels"
-                elif category == 'low_contrast':
-                    cat_label = "Low color contrast"
-                elif category == 'heading_issues':
-                    cat_label = "Heading structure issues"
-                else:
-                    cat_label = category
-
-                html_parts.append(f"<h3>{cat_label} ({len(items)})</h3>")
-                if items:
-                    html_parts.append("<ul>")
-                    for it in items:
-                        html_parts.append(f"<li>{it}</li>")
-                    html_parts.append("</ul>")
-                else:
-                    html_parts.append(
-                        '<div class="no-issues">No issues in this category.</div>'
-                    )
-
-        html_parts.append("</div>")  # .card
-
-    html_parts.append("""
-</div>
-<footer>
-  FinAccAI Prototype &mdash; Rule-based HTML accessibility checks (images, inputs, headings, contrast).
-</footer>
-</body>
-</html>
-""")
-
-    html = "".join(html_parts)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    with ReportWriter(output_path) as report:
+        for site in results_by_site:
+            report.add(site)
 
 
 # -------------------------
@@ -3,17 +3,22 @@
 import os
 import time
 import uuid
+import queue
+import atexit
 import logging
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import urlparse
 
-import requests
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
 from PIL import Image
 
+from . import http_client
+from .parsing import make_soup
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT_DIR / "data"
 SCREENSHOT_DIR = DATA_DIR / "screenshots"
@@ -44,9 +49,7 @@ def load_static_html(url):
     Download HTML via HTTP request (used for non-JS pages).
     """
     log(f"Fetching static page: {url}")
-    response = requests.get(url, timeout=10)
-    response.raise_for_status()
-    return response.text
+    return http_client.get_text(url, timeout=10)
 
 
 def init_headless_browser():
@@ -64,26 +67,228 @@ def init_headless_browser():
     return browser
 
 
-def load_dynamic_page(url, wait=3):
+class BrowserPool:
+    """
+    Bounded pool of long-lived headless Chrome instances.
+
+    Browsers are checked out with `pool.browser()`, wiped (cookies and
+    storage) when returned, and recycled after `max_pages` page loads or
+    whenever a load raises, so a crashed or wedged Chrome never goes back
+    into the pool. At most `size` browsers exist at once, which is also how
+    many dynamic pages can load in parallel.
+    """
+
+    def __init__(self, size=2, max_pages=50, factory=None):
+        self.size = size
+        self.max_pages = max_pages
+        self._factory = factory or init_headless_browser
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = queue.LifoQueue()
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def browser(self):
+        self._slots.acquire()
+        try:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                browser = self._factory()
+                with self._lock:
+                    self._pages[id(browser)] = 0
+
+            healthy = False
+            try:
+                yield browser
+                healthy = self._reset(browser)
+            finally:
+                with self._lock:
+                    self._pages[id(browser)] += 1
+                    used = self._pages[id(browser)]
+                if healthy and used < self.max_pages:
+                    self._idle.put(browser)
+                else:
+                    self._discard(browser)
+        finally:
+            self._slots.release()
+
+    def _reset(self, browser):
+        """Clear cookies and storage so the next page starts clean.
+
+        Storage (local/session storage, IndexedDB, cache storage, service
+        workers) is cleared over CDP for the page's origin and every frame
+        origin, not just what the top-level page's scripts can reach.
+        """
+        try:
+            browser.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            for origin in _page_origins(browser):
+                browser.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+                )
+            browser.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            browser.execute_cdp_cmd("Network.clearBrowserCache", {})
+            browser.get("about:blank")
+            return True
+        except Exception as e:
+            log(f"Recycling browser after failed reset: {e}")
+            return False
+
+    def _discard(self, browser):
+        with self._lock:
+            self._pages.pop(id(browser), None)
+        try:
+            browser.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every idle browser. Checked-out browsers are quit on return."""
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(browser)
+
+
+def _origin(url):
+    parsed = urlparse(url or "")
+    if parsed.scheme in ("http", "https") and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return None
+
+
+def _page_origins(browser):
+    """The http(s) origins of the browser's current page and all its frames."""
+    origins = {_origin(browser.current_url)}
+    frames = [browser.execute_cdp_cmd("Page.getFrameTree", {})["frameTree"]]
+    while frames:
+        node = frames.pop()
+        origins.add(_origin(node["frame"].get("url")))
+        frames.extend(node.get("childFrames", []))
+    origins.discard(None)
+    return sorted(origins)
+
+
+_browser_pool = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool():
+    """Return the shared browser pool, sized by FINACCAI_BROWSER_POOL."""
+    global _browser_pool
+    if _browser_pool is None:
+        with _browser_pool_lock:
+            if _browser_pool is None:
+                _browser_pool = BrowserPool(
+                    size=int(os.environ.get("FINACCAI_BROWSER_POOL", "2")),
+                    max_pages=int(os.environ.get("FINACCAI_BROWSER_MAX_PAGES", "50")),
+                )
+    return _browser_pool
+
+
+def configure_browser_pool(size=2, max_pages=50):
+    """Replace the shared browser pool (e.g. to match CLI concurrency)."""
+    global _browser_pool
+    with _browser_pool_lock:
+        old, _browser_pool = _browser_pool, BrowserPool(size=size, max_pages=max_pages)
+    if old is not None:
+        old.close()
+    return _browser_pool
+
+
+@atexit.register
+def _close_browser_pool():
+    if _browser_pool is not None:
+        _browser_pool.close()
+
+
+# Upper bound on waiting for a dynamic page to settle, in seconds
+DEFAULT_MAX_WAIT = 5
+
+# Injected once per page: tracks the last structural DOM change (nodes added
+# or removed), the last finished network resource and the number of
+# in-flight fetch/XHR requests. Attribute and text changes are ignored:
+# carousels, tickers and CSS animations change them forever.
+_READINESS_PROBE = """
+if (!window.__finaccaiProbe) {
+  var probe = window.__finaccaiProbe = {lastActivity: performance.now(), inflight: 0};
+  var touch = function () { probe.lastActivity = performance.now(); };
+  new MutationObserver(touch).observe(document, {subtree: true, childList: true});
+  if (window.PerformanceObserver) {
+    try { new PerformanceObserver(touch).observe({type: 'resource', buffered: false}); } catch (e) {}
+  }
+  if (window.fetch) {
+    var origFetch = window.fetch;
+    window.fetch = function () {
+      probe.inflight++; touch();
+      return origFetch.apply(this, arguments).finally(function () { probe.inflight--; touch(); });
+    };
+  }
+  var origSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    probe.inflight++; touch();
+    this.addEventListener('loadend', function () { probe.inflight--; touch(); });
+    return origSend.apply(this, arguments);
+  };
+}
+var p = window.__finaccaiProbe;
+return [document.readyState, p.inflight, performance.now() - p.lastActivity];
+"""
+
+
+def wait_for_render(browser, max_wait=DEFAULT_MAX_WAIT, quiet_period=0.5, poll=0.1):
+    """
+    Block until the page looks settled, or `max_wait` seconds have passed.
+
+    Settled means: document.readyState is "complete", no fetch/XHR is in
+    flight, and no nodes were added or removed and no resource finished in
+    `quiet_period` seconds. Returns the number of seconds spent waiting.
+    """
+    started = time.monotonic()
+    deadline = started + max_wait
+    quiet_ms = quiet_period * 1000
+
+    while time.monotonic() < deadline:
+        try:
+            ready_state, inflight, idle_ms = browser.execute_script(_READINESS_PROBE)
+        except Exception:
+            # Page is mid-navigation; the probe is re-injected on the next poll.
+            ready_state, inflight, idle_ms = None, 0, 0
+        if ready_state == "complete" and inflight <= 0 and idle_ms >= quiet_ms:
+            break
+        time.sleep(poll)
+
+    return time.monotonic() - started
+
+
+def load_dynamic_page(url, max_wait=DEFAULT_MAX_WAIT, pool=None):
     """
     Load page with Selenium, wait for scripts to render.
-    Returns DOM + screenshot path.
+    Returns DOM + screenshot path + seconds spent waiting for the render.
+
+    Browsers come from `pool` (default: the shared pool) instead of being
+    started and quit for every URL. Instead of a fixed sleep the page is
+    polled until it settles (see `wait_for_render`), capped at `max_wait`.
     """
     log(f"Loading dynamic financial page: {url}")
 
-    browser = init_headless_browser()
-    browser.get(url)
-
-    time.sleep(wait)
+    pool = pool or get_browser_pool()
+    with pool.browser() as browser:
+        browser.get(url)
 
-    html = browser.page_source
+        render_wait = wait_for_render(browser, max_wait=max_wait)
+        log(f"Page settled after {render_wait:.2f}s: {url}")
 
-    screenshot_path = SCREENSHOT_DIR / f"{uuid.uuid4()}.png"
-    browser.save_screenshot(str(screenshot_path))
+        html = browser.page_source
 
-    browser.quit()
+        screenshot_path = SCREENSHOT_DIR / f"{uuid.uuid4()}.png"
+        browser.save_screenshot(str(screenshot_path))
 
-    return html, screenshot_path
+    return html, screenshot_path, render_wait
 
 
 # -----------------------------
@@ -92,9 +297,9 @@ def load_dynamic_page(url, wait=3):
 
 def parse_dom(html):
     """
-    Convert raw HTML into BeautifulSoup DOM.
+    Convert raw HTML into BeautifulSoup DOM (backend from FINACCAI_PARSER).
     """
-    return BeautifulSoup(html, "html.parser")
+    return make_soup(html)
 
 
 # -----------------------------
@@ -117,7 +322,7 @@ def get_domain(url):
 # Unified Page Loader
 # -----------------------------
 
-def load_page(url, dynamic=False, wait=3):
+def load_page(url, dynamic=False, max_wait=DEFAULT_MAX_WAIT):
     """
     Master loader used by FinAccAI pipeline.
 
@@ -125,7 +330,7 @@ def load_page(url, dynamic=False, wait=3):
     dynamic=True   → Selenium headless browser
     """
     if dynamic:
-        html, screenshot = load_dynamic_page(url, wait=wait)
+        html, screenshot, _ = load_dynamic_page(url, max_wait=max_wait)
     else:
         html = load_static_html(url)
         screenshot = None
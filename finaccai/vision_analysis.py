@@ -3,26 +3,467 @@ Vision Analysis for image accessibility.
 Uses computer vision to analyze images and generate captions.
 """
 
-# Try to import vision transformer models
-try:
+import base64
+import hashlib
+import importlib.util
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from io import BytesIO
+from pathlib import Path
+
+from . import http_client, inference_service, model_loader, model_registry
+from .inference_cache import InferenceCache
+from .page_context import page_soup
+
+CAPTION_MODEL = "Salesforce/blip-image-captioning-base"
+
+# Images captioned per generate() call when requests are micro-batched
+CAPTION_BATCH_SIZE = int(os.environ.get("FINACCAI_CAPTION_BATCH_SIZE", "8"))
+
+# Wall-clock seconds per page for fetching + captioning missing-alt images
+CAPTION_BUDGET = float(os.environ.get("FINACCAI_CAPTION_BUDGET", "15"))
+
+# Concurrent image downloads (shared by all pages)
+FETCH_WORKERS = int(os.environ.get("FINACCAI_IMAGE_FETCH_WORKERS", "8"))
+FETCH_TIMEOUT = 5
+
+# Captions are cached by image content hash + model id ("off" disables the disk store)
+CAPTION_CACHE_PATH = os.environ.get(
+    "FINACCAI_CAPTION_CACHE",
+    str(Path(__file__).resolve().parents[1] / "data" / "caption_cache.sqlite"),
+)
+CAPTION_CACHE_MAX_BYTES = int(float(os.environ.get("FINACCAI_CAPTION_CACHE_MB", "32")) * 1024 * 1024)
+# Also match re-encoded / resized copies by an 8x8 average hash
+PERCEPTUAL_HASH = os.environ.get("FINACCAI_CAPTION_PHASH", "").lower() in ("1", "true", "yes", "on")
+# A URL whose content hash is known is not downloaded again for this long
+URL_TTL = float(os.environ.get("FINACCAI_CAPTION_URL_TTL", "3600"))
+
+# Pre-filter: images at or below these sizes are not worth captioning
+TRACKING_PIXEL_MAX_PX = 2
+ICON_MAX_PX = int(os.environ.get("FINACCAI_ICON_MAX_PX", "24"))
+TRACKER_URL_PATTERNS = (
+    '/pixel', 'pixel.gif', 'spacer.gif', 'blank.gif', '/beacon', '/track',
+    'doubleclick.net', 'facebook.com/tr', 'google-analytics.com', 'bat.bing.com',
+)
+
+SKIP_SUGGESTIONS = {
+    'tracking_pixel': 'Tracking pixel or spacer - add alt="" so screen readers ignore it',
+    'decorative': 'Marked as presentational - add an empty alt="" to match its role',
+    'hidden': 'Hidden with aria-hidden - add an empty alt="" for consistency',
+    'small_icon': 'Small icon - add short alt text if it conveys meaning, otherwise alt=""',
+}
+
+# Only check that the packages are installed; transformers/torch are
+# imported when the captioning model is first needed.
+VISION_AVAILABLE = all(
+    importlib.util.find_spec(pkg) is not None for pkg in ("transformers", "PIL")
+)
+
+
+def _load_caption_model():
+    """Initialize BLIP model for image captioning from the local model registry."""
     from transformers import BlipProcessor, BlipForConditionalGeneration
-    from PIL import Image
-    import requests
-    from io import BytesIO
-    VISION_AVAILABLE = True
+    processor = model_registry.load_processor(BlipProcessor, "vision_caption")
+    model = model_registry.load_model(BlipForConditionalGeneration, "vision_caption")
+    return processor, model
+
+
+caption_model = model_loader.register("vision_caption", _load_caption_model)
+
+
+def get_caption_model():
+    """Return (processor, model), loading them on first call, or None."""
+    if not VISION_AVAILABLE:
+        return None
+    return caption_model.get()
+
+def _caption_images(images):
+    """Caption a list of PIL images in one generate() call."""
+    loaded = get_caption_model()
+    if loaded is None:
+        return [None] * len(images)
+    processor, model = loaded
     
-    # Initialize BLIP model for image captioning (lightweight and effective)
     try:
-        processor = BlipProcessor.from_pretrained("Salesforce/blip-image-captioning-base")
-        model = BlipForConditionalGeneration.from_pretrained("Salesforce/blip-image-captioning-base")
-    except:
-        processor = None
-        model = None
-        VISION_AVAILABLE = False
-except ImportError:
-    VISION_AVAILABLE = False
-    processor = None
-    model = None
+        inputs = processor(images=images, return_tensors="pt")
+        output = model.generate(**inputs, max_length=50)
+        return processor.batch_decode(output, skip_special_tokens=True)
+    except Exception:
+        return [None] * len(images)
+
+
+caption_batcher = inference_service.register(
+    "vision_caption", _caption_images, max_batch_size=CAPTION_BATCH_SIZE
+)
+
+
+def _px(value):
+    match = re.match(r'\s*(\d+(?:\.\d+)?)\s*(px)?\s*$', value or '')
+    return float(match.group(1)) if match else None
+
+
+def declared_size(img):
+    """(width, height) from the width/height attributes or inline style, None if unknown."""
+    style = dict(
+        (k.strip().lower(), v) for k, _, v in
+        (part.partition(':') for part in img.get('style', '').split(';')) if v
+    )
+    sizes = []
+    for name in ('width', 'height'):
+        value = _px(img.get(name))
+        sizes.append(value if value is not None else _px(style.get(name)))
+    return tuple(sizes)
+
+
+def classify_size(width, height):
+    """Skip reason for an image of the given pixel size, or None to caption it."""
+    known = [d for d in (width, height) if d is not None]
+    if not known:
+        return None
+    if max(known) <= TRACKING_PIXEL_MAX_PX:
+        return 'tracking_pixel'
+    if width is not None and height is not None and max(width, height) <= ICON_MAX_PX:
+        return 'small_icon'
+    return None
+
+
+def classify_image(img):
+    """
+    Cheap pre-filter from markup alone: role, aria-hidden, declared size
+    and well-known tracker URLs.
+    
+    Returns:
+        str: Skip reason, or None if the image should be captioned
+    """
+    if img.get('role', '').strip().lower() in ('presentation', 'none'):
+        return 'decorative'
+    if img.get('aria-hidden', '').strip().lower() == 'true':
+        return 'hidden'
+    src = img.get('src', '').lower()
+    if any(pattern in src for pattern in TRACKER_URL_PATTERNS):
+        return 'tracking_pixel'
+    return classify_size(*declared_size(img))
+
+
+_caption_cache = None
+_caption_cache_lock = threading.Lock()
+
+
+def get_caption_cache():
+    """Return the shared caption cache (content hash -> caption, URL -> content hash)."""
+    global _caption_cache
+    if _caption_cache is None:
+        with _caption_cache_lock:
+            if _caption_cache is None:
+                disk_path = CAPTION_CACHE_PATH
+                if disk_path.lower() in ("", "0", "off", "none"):
+                    disk_path = None
+                _caption_cache = InferenceCache(
+                    "vision_caption", model_registry.model_version("vision_caption", CAPTION_MODEL),
+                    disk_path=disk_path,
+                    disk_max_bytes=CAPTION_CACHE_MAX_BYTES, lowercase=False,
+                )
+    return _caption_cache
+
+
+def average_hash(image, size=8):
+    """Perceptual hash: one bit per pixel of a size x size grayscale thumbnail."""
+    pixels = list(image.convert('L').resize((size, size)).getdata())
+    mean = sum(pixels) / len(pixels)
+    bits = ''.join('1' if p > mean else '0' for p in pixels)
+    return f'{int(bits, 2):0{size * size // 4}x}'
+
+
+_fetch_pool = None
+_fetch_pool_lock = threading.Lock()
+
+
+def _get_fetch_pool():
+    global _fetch_pool
+    if _fetch_pool is None:
+        with _fetch_pool_lock:
+            if _fetch_pool is None:
+                _fetch_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS,
+                                                 thread_name_prefix="image-fetch")
+    return _fetch_pool
+
+
+def read_image_bytes(image_url):
+    """Download (or read) the raw bytes of an image."""
+    if image_url.startswith('http'):
+        response = http_client.get(image_url, timeout=FETCH_TIMEOUT)
+        response.raise_for_status()
+        return response.content
+    with open(image_url, 'rb') as f:
+        return f.read()
+
+
+def _iter_image_chunks(image_url, chunk_size=8192, timeout=FETCH_TIMEOUT):
+    if image_url.startswith('http'):
+        with http_client.get(image_url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size)
+    else:
+        with open(image_url, 'rb') as f:
+            yield from iter(lambda: f.read(chunk_size), b'')
+
+
+def _remaining(deadline):
+    """Seconds left before `deadline` (a time.monotonic() value); raises once it has passed."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError('caption budget exhausted')
+    return remaining
+
+
+def read_image_checked(image_url, deadline=None):
+    """
+    Stream an image, reading its dimensions from the header as soon as
+    they arrive. Tiny images are abandoned after the header, without
+    downloading or decoding the rest.
+    
+    With a `deadline` (time.monotonic() value) the request timeout is
+    capped by the time left and the download raises TimeoutError once it
+    passes, so a fetch never outlives the page's caption budget.
+    
+    Returns:
+        tuple: (bytes or None, skip reason or None)
+    """
+    from PIL import ImageFile
+    parser = ImageFile.Parser()
+    chunks = []
+    size_known = False
+    timeout = FETCH_TIMEOUT if deadline is None else min(FETCH_TIMEOUT, _remaining(deadline))
+    for chunk in _iter_image_chunks(image_url, timeout=timeout):
+        if deadline is not None:
+            _remaining(deadline)
+        chunks.append(chunk)
+        if size_known:
+            continue
+        try:
+            parser.feed(chunk)
+        except Exception:
+            size_known = True  # unknown format; leave it to the decoder
+            continue
+        if parser.image is not None:
+            size_known = True
+            reason = classify_size(*parser.image.size)
+            if reason:
+                return None, reason
+    return b''.join(chunks), None
+
+
+def decode_image(data):
+    from PIL import Image
+    return Image.open(BytesIO(data)).convert('RGB')
+
+
+def load_image(image_url):
+    """Download (or open) an image and return it as an RGB PIL image."""
+    return decode_image(read_image_bytes(image_url))
+
+
+def _prepare_image(src, cache, deadline=None):
+    """Fetch `src` and resolve it against the caption cache.
+
+    Returns (cache keys, image or None, cached caption or None, skip
+    reason or None); the image is only decoded when the header pre-filter
+    passes and the exact bytes have not been captioned before.
+    """
+    data, reason = read_image_checked(src, deadline)
+    if reason:
+        return [], None, None, reason
+    keys = ['sha256:' + hashlib.sha256(data).hexdigest()]
+    hit = cache.get(keys[0])
+    if hit is not None:
+        return keys, None, hit['caption'], None
+    return _match_decoded(decode_image(data), keys, cache) + (None,)
+
+
+def _match_decoded(image, keys, cache):
+    """Perceptual-hash lookup for a decoded image: (keys, image, cached caption)."""
+    phash = average_hash(image) if PERCEPTUAL_HASH else ''
+    # Flat images (spacers, solid swatches) all hash to zero; never match those
+    if phash.strip('0') and phash.strip('f'):
+        keys.append('ahash:' + phash)
+        hit = cache.get(keys[-1])
+        if hit is not None:
+            cache.set(keys[0], hit)
+            return keys, None, hit['caption']
+    return keys, image, None
+
+
+def _prepare_crop(image, cache):
+    """Resolve a screenshot crop against the caption cache, like `_prepare_image`."""
+    keys = ['pixels:' + hashlib.sha256(repr(image.size).encode() + image.tobytes()).hexdigest()]
+    hit = cache.get(keys[0])
+    if hit is not None:
+        return keys, None, hit['caption']
+    return _match_decoded(image, keys, cache)
+
+
+def decode_screenshot(screenshot):
+    """Decode a base64 (optionally data-URL) screenshot into an RGB PIL image."""
+    if isinstance(screenshot, str):
+        screenshot = base64.b64decode(screenshot.split(',', 1)[-1] if screenshot.startswith('data:') else screenshot)
+    return decode_image(screenshot)
+
+
+def crop_images_from_screenshot(screenshot, image_boxes, images, device_pixel_ratio=1,
+                                skipped=None, only=None):
+    """
+    Cut the page's images out of its screenshot using client-sent boxes.
+    
+    Boxes are CSS-pixel rectangles relative to the screenshot's top-left
+    corner: {'index': n, 'src': ..., 'x': ..., 'y': ..., 'width': ..., 'height': ...}
+    where `index` is the image's position among the page's <img> elements.
+    Images that are mostly outside the screenshot get no crop.
+    
+    Args:
+        screenshot: Base64 PNG/JPEG (or raw bytes) of the page
+        image_boxes: List of box dicts from the client
+        images: The page's <img> tags, in document order
+        device_pixel_ratio: Screenshot pixels per CSS pixel
+        skipped: Optional dict, filled with src -> reason for boxes the
+            size pre-filter rejected (rendered as tracking pixels or icons)
+        only: Optional collection of srcs to crop (default: all images)
+        
+    Returns:
+        dict: src -> cropped RGB PIL image
+    """
+    if not screenshot or not image_boxes:
+        return {}
+    shot = decode_screenshot(screenshot)
+    scale = float(device_pixel_ratio or 1)
+    by_index = {box.get('index'): box for box in image_boxes}
+    by_src = {box.get('src'): box for box in image_boxes if box.get('src')}
+    
+    crops = {}
+    for index, img in enumerate(images):
+        src = img.get('src')
+        if only is not None and src not in only:
+            continue
+        box = by_index.get(index)
+        if box is None or box.get('src') not in (None, src):
+            box = by_src.get(src)
+        if box is None or not src:
+            continue
+        try:
+            x, y, w, h = (float(box[k]) for k in ('x', 'y', 'width', 'height'))
+        except (KeyError, TypeError, ValueError):
+            continue
+        
+        reason = classify_size(w, h)
+        if reason:
+            if skipped is not None:
+                skipped[src] = reason
+            continue
+        left, top = max(x * scale, 0), max(y * scale, 0)
+        right, bottom = min((x + w) * scale, shot.width), min((y + h) * scale, shot.height)
+        if right <= left or bottom <= top:
+            continue
+        if (right - left) * (bottom - top) < 0.9 * (w * scale) * (h * scale):
+            continue  # mostly off-screen (below the fold or clipped)
+        crops[src] = shot.crop((round(left), round(top), round(right), round(bottom)))
+    return crops
+
+
+def _recent_caption(src, cache):
+    """Caption for a URL fetched within URL_TTL whose content is cached, else None."""
+    seen = cache.get('url:' + src)
+    if seen is None or time.time() - seen['seen'] > URL_TTL:
+        return None
+    hit = cache.get(seen['key'])
+    return hit['caption'] if hit is not None else None
+
+
+def caption_images(sources, budget=None, skipped=None, crops=None):
+    """
+    Fetch images concurrently and caption them in batched generate() calls.
+    
+    Images cropped from the page screenshot are used as-is. Images whose
+    content (or, recently, whose URL) is already in the caption cache are
+    not captioned again. Work stops when the time budget
+    runs out: images still downloading are dropped and remaining caption
+    batches are not started.
+    
+    Args:
+        sources: Image URLs or paths
+        budget: Seconds allowed for the whole call (default FINACCAI_CAPTION_BUDGET)
+        skipped: Optional dict, filled with source -> reason for images the
+            header pre-filter rejected (tracking pixels, small icons)
+        crops: Optional dict of source -> PIL image already cut from the
+            page screenshot; these sources are never downloaded
+        
+    Returns:
+        dict: source -> caption for every image captioned in time
+    """
+    sources = list(dict.fromkeys(sources))
+    if not sources or get_caption_model() is None:
+        return {}
+    deadline = time.monotonic() + (CAPTION_BUDGET if budget is None else budget)
+    cache = get_caption_cache()
+    
+    # URLs seen recently skip the download when their content is cached
+    captions = {}
+    for src in sources:
+        caption = _recent_caption(src, cache)
+        if caption is not None:
+            captions[src] = caption
+    sources = [src for src in sources if src not in captions]
+    
+    to_caption = []
+    crops = crops or {}
+    for src in sources:
+        if src in crops:
+            keys, image, caption = _prepare_crop(crops[src], cache)
+            if caption is not None:
+                captions[src] = caption
+            else:
+                to_caption.append((src, keys, image))
+    
+    pool = _get_fetch_pool()
+    futures = {pool.submit(_prepare_image, src, cache, deadline): src
+               for src in sources if src not in crops}
+    done, not_done = wait(futures, timeout=max(deadline - time.monotonic(), 0))
+    # Queued fetches are cancelled; running ones stop themselves at the deadline
+    for future in not_done:
+        future.cancel()
+    
+    for future in done:
+        if future.exception() is not None:
+            continue
+        src = futures[future]
+        keys, image, caption, reason = future.result()
+        if reason:
+            if skipped is not None:
+                skipped[src] = reason
+        elif caption is not None:
+            captions[src] = caption
+            cache.set('url:' + src, {'key': keys[0], 'seen': time.time()})
+        else:
+            to_caption.append((src, keys, image))
+    # Keep page order so the first images are captioned first
+    order = {src: i for i, src in enumerate(sources)}
+    to_caption.sort(key=lambda item: order[item[0]])
+    
+    for start in range(0, len(to_caption), CAPTION_BATCH_SIZE):
+        if time.monotonic() >= deadline:
+            break
+        chunk = to_caption[start:start + CAPTION_BATCH_SIZE]
+        results = caption_batcher.map([image for _, _, image in chunk])
+        for (src, keys, _), caption in zip(chunk, results):
+            if not caption:
+                continue
+            captions[src] = caption
+            for key in keys:
+                cache.set(key, {'caption': caption})
+            cache.set('url:' + src, {'key': keys[0], 'seen': time.time()})
+    return captions
+
 
 def generate_image_caption(image_url):
     """
@@ -34,43 +475,43 @@ def generate_image_caption(image_url):
     Returns:
         str: Generated caption or None if failed
     """
-    if not VISION_AVAILABLE or processor is None or model is None:
+    if get_caption_model() is None:
         return None
     
     try:
-        # Load image
-        if image_url.startswith('http'):
-            response = requests.get(image_url, timeout=5)
-            image = Image.open(BytesIO(response.content)).convert('RGB')
-        else:
-            image = Image.open(image_url).convert('RGB')
-        
-        # Generate caption
-        inputs = processor(image, return_tensors="pt")
-        output = model.generate(**inputs, max_length=50)
-        caption = processor.decode(output[0], skip_special_tokens=True)
+        image = load_image(image_url)
         
-        return caption
+        # Generate caption (batched with other requests when the service is on)
+        return caption_batcher.map([image])[0]
+    except inference_service.Overloaded:
+        raise
     except Exception as e:
         return None
 
-def analyze_images(soup, screenshot=None):
+def analyze_images(soup, screenshot=None, image_boxes=None, device_pixel_ratio=1):
     """
     Analyze images on the page for accessibility.
     Now enhanced with BLIP Vision Transformer for AI-powered image captioning!
     
     Args:
-        soup: BeautifulSoup parsed HTML
-        screenshot: Optional page screenshot
+        soup: BeautifulSoup parsed HTML or a PageContext
+        screenshot: Optional base64 page screenshot
+        image_boxes: Optional client-measured image boxes; with a screenshot,
+            visible images are cropped from it instead of being downloaded
+        device_pixel_ratio: Screenshot pixels per CSS pixel
         
     Returns:
         list: Vision analysis findings
     """
     try:
+        soup = page_soup(soup)
         findings = []
         images = soup.find_all('img')
         
-        use_ai = VISION_AVAILABLE and processor is not None and model is not None
+        if not images:
+            return ["No images found on page"]
+        
+        use_ai = get_caption_model() is not None
         
         if use_ai:
             findings.append({
@@ -78,23 +519,63 @@ def analyze_images(soup, screenshot=None):
                 'message': '🤖 Using BLIP AI Vision Model for intelligent image analysis'
             })
         
-        if not images:
-            return ["No images found on page"]
+        # Fetch and caption every missing-alt image together, within the
+        # page's time budget. Decorative, hidden and tracker images are
+        # filtered out first from markup, then by their header size.
+        captions = {}
+        skipped = {}
+        if use_ai:
+            pending = []
+            for img in images:
+                src = img.get('src')
+                if img.get('alt', '').strip() or not src or src.startswith('data:'):
+                    continue
+                reason = classify_image(img)
+                if reason:
+                    skipped[src] = reason
+                else:
+                    pending.append(src)
+            crops = {}
+            if screenshot and image_boxes:
+                try:
+                    crops = crop_images_from_screenshot(
+                        screenshot, image_boxes, images, device_pixel_ratio,
+                        skipped=skipped, only=set(pending)
+                    )
+                except Exception:
+                    crops = {}  # undecodable screenshot: fall back to downloads
+            pending = [src for src in pending if src not in skipped]
+            captions = caption_images(pending, skipped=skipped, crops=crops)
+            pending = set(pending) - set(skipped)
+            from_screenshot = len(set(crops) & set(captions))
+            if from_screenshot:
+                findings.append({
+                    'type': 'system_info',
+                    'message': f'📸 Captioned {from_screenshot} images from the page screenshot (no download)'
+                })
+            if skipped:
+                counts = {}
+                for reason in skipped.values():
+                    counts[reason] = counts.get(reason, 0) + 1
+                findings.append({
+                    'type': 'system_info',
+                    'message': f'🔎 Skipped captioning for {len(skipped)} decorative/tracking images: '
+                               + ', '.join(f'{n} {reason}' for reason, n in sorted(counts.items())),
+                    'skipped': counts
+                })
+            if len(captions) < len(pending):
+                findings.append({
+                    'type': 'system_info',
+                    'message': f'⏱️ Captioned {len(captions)} of {len(pending)} images without alt text '
+                               f'(time budget {CAPTION_BUDGET:g}s, unreachable images skipped)'
+                })
         
         for idx, img in enumerate(images, 1):
             alt = img.get('alt', '')
             src = img.get('src', 'unknown')
             
             if not alt or alt.strip() == '':
-                # Try to generate caption using AI
-                ai_caption = None
-                if use_ai and src and not src.startswith('data:'):
-                    try:
-                        # Try to generate caption for first few images (to avoid slowdown)
-                        if idx <= 5:  # Limit to first 5 images
-                            ai_caption = generate_image_caption(src)
-                    except:
-                        pass
+                ai_caption = captions.get(src)
                 
                 finding = {
                     'image_number': idx,
@@ -102,7 +583,12 @@ def analyze_images(soup, screenshot=None):
                     'issue': 'missing_alt',
                 }
                 
-                if ai_caption:
+                skip_reason = skipped.get(src)
+                if skip_reason:
+                    finding['skip_reason'] = skip_reason
+                    finding['suggestion'] = SKIP_SUGGESTIONS[skip_reason]
+                    finding['note'] = f'Caption skipped by pre-filter ({skip_reason})'
+                elif ai_caption:
                     finding['ai_suggestion'] = ai_caption
                     finding['note'] = f'✨ AI-generated caption: "{ai_caption}"'
                 else:
@@ -124,6 +610,8 @@ def analyze_images(soup, screenshot=None):
         
         return findings
         
+    except inference_service.Overloaded:
+        raise
     except Exception as e:
         return [f"Vision analysis error: {str(e)}"]
 
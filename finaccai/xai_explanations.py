@@ -3,7 +3,7 @@ Explainable AI (XAI) for accessibility analysis.
 Provides human-readable explanations for ML predictions.
 """
 
-def generate_explanations(issues, ai_ml_results):
+def generate_explanations(issues, ai_ml_results, page=None):
     """
     Generate human-readable explanations for accessibility findings.
     
@@ -13,6 +13,7 @@ def generate_explanations(issues, ai_ml_results):
     Args:
         issues: Dict of detected accessibility issues
         ai_ml_results: Results from AI/ML analysis
+        page: Optional PageContext of the analyzed page
         
     Returns:
         dict: Explanations and recommendations
@@ -24,6 +25,8 @@ def generate_explanations(issues, ai_ml_results):
             'severity_analysis': analyze_severity(issues),
             'impact_assessment': assess_impact(issues)
         }
+        if page is not None and page.title:
+            explanations['page_title'] = page.title
         
         return explanations
         
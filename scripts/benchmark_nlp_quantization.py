@@ -0,0 +1,112 @@
+"""Compare the fp32 and int8 sentiment runtimes on a fixed label corpus.
+
+Reports latency (one string per call and batched) and how often the int8
+model agrees with fp32 on the label and on the quality verdict that
+`nlp_analysis.analyze_text` derives from it.
+
+Usage:
+    python scripts/download_and_cache_models.py   # prepares models/nlp_sentiment_int8
+    python scripts/benchmark_nlp_quantization.py [--threads N]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from finaccai import nlp_analysis
+
+REPEAT = 3
+
+# Typical form labels and button captions, good and bad
+LABEL_CORPUS = [
+    "Email address", "Password", "Confirm password", "First name", "Last name",
+    "Date of birth (DD/MM/YYYY)", "Account number", "Sort code", "Routing number",
+    "Amount to transfer", "Reference for the payee", "Phone number including country code",
+    "Postcode", "Street address", "City", "Country of residence", "Annual income before tax",
+    "Employer name", "How did you hear about us?", "I agree to the terms and conditions",
+    "Remember me on this device", "Search transactions", "Card number", "Expiry date",
+    "Security code (3 digits on the back)", "Name on card", "Enter", "Input here",
+    "Click this", "Field 1", "Value", "Data", "Enter that", "Type here",
+    "Submit your loan application", "Download statement as PDF", "Transfer money",
+    "Cancel payment", "Add new payee", "Log out of online banking", "Sign in",
+    "Continue to review", "Back to accounts", "Apply now", "Learn more about savings rates",
+    "View all transactions", "Next", "Previous", "Save changes", "Delete this account",
+    "Report a lost or stolen card", "Freeze card", "Pay bill", "Open chat with an advisor",
+    "Change PIN", "Update contact details", "Send", "Buy", "Confirm", "Details",
+]
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_single(analyzer):
+    return [analyzer(text)[0] for text in LABEL_CORPUS]
+
+
+def run_batched(analyzer):
+    return analyzer(LABEL_CORPUS, batch_size=nlp_analysis.BATCH_SIZE)
+
+
+def measure(name, loader):
+    started = time.perf_counter()
+    analyzer = loader()
+    load_time = time.perf_counter() - started
+    run_batched(analyzer)  # warm-up
+    single = best_of(lambda: run_single(analyzer))
+    batched = best_of(lambda: run_batched(analyzer))
+    print(f"  {name:<5} load {load_time:6.2f} s   "
+          f"single {single / len(LABEL_CORPUS) * 1000:7.2f} ms/text   "
+          f"batched {batched / len(LABEL_CORPUS) * 1000:7.2f} ms/text")
+    return run_batched(analyzer), single, batched
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=None,
+                        help="torch intra-op threads (default: torch's choice)")
+    args = parser.parse_args(argv)
+
+    import torch
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    print(f"\n[FinAccAI] {nlp_analysis.SENTIMENT_MODEL}, {len(LABEL_CORPUS)} texts, "
+          f"{torch.get_num_threads()} threads\n")
+
+    fp32, fp32_single, fp32_batched = measure(
+        "fp32", lambda: nlp_analysis.build_sentiment_pipeline(quantized=False))
+    int8, int8_single, int8_batched = measure(
+        "int8", lambda: nlp_analysis.build_sentiment_pipeline(quantized=True))
+
+    label_agree = sum(a["label"] == b["label"] for a, b in zip(fp32, int8))
+    quality_agree = sum(
+        nlp_analysis._bert_result(text, a)["quality"] == nlp_analysis._bert_result(text, b)["quality"]
+        for text, a, b in zip(LABEL_CORPUS, fp32, int8)
+    )
+    score_diffs = [abs(a["score"] - b["score"]) for a, b in zip(fp32, int8)]
+
+    print(f"\n  speed-up      single {fp32_single / int8_single:4.2f}x   "
+          f"batched {fp32_batched / int8_batched:4.2f}x")
+    print(f"  label agree   {label_agree}/{len(LABEL_CORPUS)} "
+          f"({label_agree / len(LABEL_CORPUS):.1%})")
+    print(f"  quality agree {quality_agree}/{len(LABEL_CORPUS)} "
+          f"({quality_agree / len(LABEL_CORPUS):.1%})")
+    print(f"  |score diff|  mean {statistics.mean(score_diffs):.4f}   max {max(score_diffs):.4f}")
+    for text, a, b in zip(LABEL_CORPUS, fp32, int8):
+        if a["label"] != b["label"]:
+            print(f"    disagree: {text!r}  fp32={a['label']} {a['score']:.3f}  "
+                  f"int8={b['label']} {b['score']:.3f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare parse and check time across the installed parser backends.
+
+Usage:
+    python scripts/benchmark_parsers.py                 # synthetic 20k-node page
+    python scripts/benchmark_parsers.py page1.html ...  # your own saved pages
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from finaccai import parsing, script
+from finaccai.rule_engine import run_rules
+
+REPEAT = 3
+
+BLOCK = (
+    '<section id="s{i}"><h2>Account {i}</h2>'
+    '<div style="color:#777;background-color:#888"><p>Balance and recent activity</p>'
+    '<label for="amt{i}">Amount</label><input id="amt{i}" type="text">'
+    '<a href="/details/{i}">more</a><img src="/img/{i}.png"><button>Transfer</button></div>'
+    '</section>'
+)
+
+
+def synthetic_page(blocks=2000):
+    body = "".join(BLOCK.format(i=i) for i in range(blocks))
+    return f'<!DOCTYPE html><html lang="en"><head><title>Bench</title></head><body>{body}</body></html>'
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(paths):
+    pages = {p: Path(p).read_text(encoding="utf-8", errors="replace") for p in paths}
+    if not pages:
+        pages = {"synthetic": synthetic_page()}
+
+    backends = parsing.available_backends()
+    print(f"\n[FinAccAI] Parser backends available: {', '.join(backends)}\n")
+
+    for name, html in pages.items():
+        nodes = len(parsing.make_soup(html, "html.parser").find_all())
+        print(f"{name}: {len(html) / 1024:.0f} KB, {nodes} elements")
+        baseline = None
+        for backend in backends:
+            parse_time = best_of(lambda: parsing.make_soup(html, backend))
+            soup = parsing.make_soup(html, backend)
+            check_time = best_of(lambda: run_rules(soup, script.build_rules("AAA")))
+            baseline = baseline or parse_time
+            print(f"  {backend:<13} parse {parse_time * 1000:8.1f} ms "
+                  f"({baseline / parse_time:4.1f}x)   checks {check_time * 1000:8.1f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
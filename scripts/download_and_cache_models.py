@@ -1,21 +1,44 @@
 import os
+import sys
 from pathlib import Path
 import joblib
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.datasets import make_classification
 
+import torch
 from transformers import (
     BertTokenizer,
     BertModel,
     VisionEncoderDecoderModel,
     ViTImageProcessor,
-    AutoTokenizer
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+    BlipForConditionalGeneration,
+    BlipProcessor
 )
 
-ROOT = Path("models")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from finaccai import model_registry
+from finaccai.ml_model import FEATURE_NAMES
+from finaccai.nlp_analysis import (
+    QUANTIZED_MODEL_DIR,
+    QUANTIZED_WEIGHTS,
+    SENTIMENT_MODEL,
+    SENTIMENT_MODEL_DIR,
+    quantize_sentiment_model
+)
+from finaccai.vision_analysis import CAPTION_MODEL
+
+# Everything is saved here and recorded in models/manifest.json, which is
+# the only place the runtime loads models from.
+ROOT = model_registry.MODELS_DIR
 ROOT.mkdir(exist_ok=True)
 
+
+def hub_revision(model):
+    return getattr(model.config, "_commit_hash", None)
+
 # -----------------------------
 # 1) Create ML classifier
 # -----------------------------
@@ -23,7 +46,7 @@ print("\n[FinAccAI] Creating ML classifier...")
 
 X, y = make_classification(
     n_samples=1200,
-    n_features=20,
+    n_features=len(FEATURE_NAMES),  # one column per ml_model feature
     n_informative=6,
     n_redundant=2,
     random_state=42
@@ -37,6 +60,8 @@ clf = RandomForestClassifier(
 clf.fit(X, y)
 
 joblib.dump(clf, ROOT / "ml_classifier.pkl")
+model_registry.record("ml_classifier", ROOT / "ml_classifier.pkl",
+                      source="sklearn.RandomForestClassifier", version="synthetic-42")
 
 print("[OK] Saved models/ml_classifier.pkl")
 
@@ -51,11 +76,47 @@ print("\n[FinAccAI] Downloading BERT NLP model (bert-base-uncased)...")
 bert_model = BertModel.from_pretrained("bert-base-uncased")
 bert_tokenizer = BertTokenizer.from_pretrained("bert-base-uncased")
 
-bert_model.save_pretrained(NLP_DIR)
+bert_model.save_pretrained(NLP_DIR, safe_serialization=True)
 bert_tokenizer.save_pretrained(NLP_DIR)
+model_registry.record("nlp_model", NLP_DIR, source="bert-base-uncased",
+                      version=hub_revision(bert_model))
 
 print("[OK] Saved NLP model to models/nlp_model/")
 
+# -----------------------------
+# 2a) Sentiment classifier used by nlp_analysis
+# -----------------------------
+print(f"\n[FinAccAI] Downloading sentiment model ({SENTIMENT_MODEL})...")
+
+sentiment_model = AutoModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL)
+sentiment_tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_MODEL)
+
+sentiment_model.save_pretrained(SENTIMENT_MODEL_DIR, safe_serialization=True)
+sentiment_tokenizer.save_pretrained(SENTIMENT_MODEL_DIR)
+model_registry.record("nlp_sentiment", SENTIMENT_MODEL_DIR, source=SENTIMENT_MODEL,
+                      version=hub_revision(sentiment_model))
+
+print(f"[OK] Saved sentiment model to {SENTIMENT_MODEL_DIR}/")
+
+# -----------------------------
+# 2b) Int8 sentiment classifier (FINACCAI_NLP_QUANTIZED=1)
+# -----------------------------
+QUANTIZED_MODEL_DIR.mkdir(parents=True, exist_ok=True)
+
+print(f"\n[FinAccAI] Quantizing {SENTIMENT_MODEL} to dynamic int8...")
+
+# Config + tokenizer describe the architecture; the int8 weights are saved
+# as a state dict because save_pretrained cannot round-trip packed params.
+sentiment_model.config.save_pretrained(QUANTIZED_MODEL_DIR)
+sentiment_tokenizer.save_pretrained(QUANTIZED_MODEL_DIR)
+quantized_model = quantize_sentiment_model(sentiment_model.eval())
+torch.save(quantized_model.state_dict(), QUANTIZED_MODEL_DIR / QUANTIZED_WEIGHTS)
+model_registry.record("nlp_sentiment_int8", QUANTIZED_MODEL_DIR, source=SENTIMENT_MODEL,
+                      version=f"{hub_revision(sentiment_model)}+int8")
+
+print(f"[OK] Saved int8 sentiment model to {QUANTIZED_MODEL_DIR}/")
+print("     Compare with fp32: python scripts/benchmark_nlp_quantization.py")
+
 # -----------------------------
 # 3) Cache Vision Caption Model
 # -----------------------------
@@ -76,10 +137,32 @@ vision_tokenizer = AutoTokenizer.from_pretrained(
     "nlpconnect/vit-gpt2-image-captioning"
 )
 
-vision_model.save_pretrained(VISION_DIR)
+vision_model.save_pretrained(VISION_DIR, safe_serialization=True)
 vision_processor.save_pretrained(VISION_DIR)
 vision_tokenizer.save_pretrained(VISION_DIR)
+model_registry.record("vision_caption_vit_gpt2", VISION_DIR,
+                      source="nlpconnect/vit-gpt2-image-captioning",
+                      version=hub_revision(vision_model))
 
 print("[OK] Saved Vision Caption Model to models/vision_caption_model/")
 
+# -----------------------------
+# 3b) BLIP captioner used by vision_analysis
+# -----------------------------
+BLIP_DIR = ROOT / "vision_caption_blip"
+BLIP_DIR.mkdir(exist_ok=True)
+
+print(f"\n[FinAccAI] Downloading BLIP Caption Model ({CAPTION_MODEL})...")
+
+blip_model = BlipForConditionalGeneration.from_pretrained(CAPTION_MODEL)
+blip_processor = BlipProcessor.from_pretrained(CAPTION_MODEL)
+
+blip_model.save_pretrained(BLIP_DIR, safe_serialization=True)
+blip_processor.save_pretrained(BLIP_DIR)
+model_registry.record("vision_caption", BLIP_DIR, source=CAPTION_MODEL,
+                      version=hub_revision(blip_model))
+
+print("[OK] Saved BLIP Caption Model to models/vision_caption_blip/")
+print(f"[OK] Manifest written to {model_registry.manifest_path()}")
+
 print("\n[FinAccAI] All models downloaded & cached successfully.")
@@ -34,4 +34,20 @@ try:
 except Exception as e:
     print("❌ Vision Caption Model failed:", e)
 
+# --------------------------
+# Verify the model registry (models/manifest.json) checksums
+# --------------------------
+try:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from finaccai import model_registry
+    for name in model_registry.load_manifest().get("models", {}):
+        try:
+            model_registry.verify(name, mode="sha256")
+            print(f"✓ {name}: checksums match manifest")
+        except model_registry.ModelNotAvailable as e:
+            print(f"❌ {name}: {e}")
+except Exception as e:
+    print("❌ Model registry check failed:", e)
+
 print("\n[FinAccAI] Model load validation complete.\n")
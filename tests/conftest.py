@@ -0,0 +1,15 @@
+import pytest
+
+from finaccai import inference_service
+
+
+@pytest.fixture(autouse=True)
+def inference_service_off():
+    """Run each test with the shared inference worker off.
+
+    Importing api_server (done at collection by the API tests) enables it
+    for the whole process; switch it back off around every test.
+    """
+    inference_service.enable(False)
+    yield
+    inference_service.enable(False)
@@ -0,0 +1,51 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'browser-extension'))
+
+api_server = pytest.importorskip('api_server')
+from finaccai.inference_service import MicroBatcher  # noqa: E402
+
+PAGE = '<html><body><label>Email</label><input id="email"></body></html>'
+
+
+@pytest.fixture
+def full_batcher():
+    """A batcher whose worker is busy and whose one-slot queue is taken."""
+    release = threading.Event()
+
+    def handler(items):
+        release.wait()
+        return items
+
+    batcher = MicroBatcher('test_nlp', handler, max_batch_size=1, max_wait=0, max_queue=1)
+    batcher.submit(['busy'])
+    for _ in range(100):
+        if batcher.stats()['queued'] == 0:
+            break
+        threading.Event().wait(0.01)
+    batcher.submit(['queued'])
+    yield batcher
+    release.set()
+
+
+@pytest.mark.skipif(not api_server.AI_ML_AVAILABLE, reason='AI/ML modules not importable')
+@pytest.mark.parametrize('endpoint, payload', [
+    ('/api/analyze', {'html': PAGE, 'url': 'https://example.com'}),
+    ('/api/mobile/analyze', {'html': PAGE, 'app_name': 'Bank'}),
+])
+def test_full_inference_queue_returns_503_with_retry_after(monkeypatch, full_batcher, endpoint, payload):
+    monkeypatch.setattr(api_server.nlp_analysis, 'analyze_text',
+                        lambda page: full_batcher.submit(['label'], timeout=0.05))
+
+    response = api_server.app.test_client().post(endpoint, json=payload)
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == str(api_server.RETRY_AFTER_SECONDS)
+    assert response.get_json() == {
+        'success': False, 'error': 'Inference queue for test_nlp is full, retry later'
+    }
+    assert full_batcher.stats()['rejected'] == 1
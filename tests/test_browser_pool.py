@@ -0,0 +1,149 @@
+import threading
+
+import pytest
+
+utils = pytest.importorskip('finaccai.utils')
+
+
+class FakeBrowser:
+    """Records the calls BrowserPool makes on a Chrome driver."""
+
+    def __init__(self, number, fail_reset=False):
+        self.number = number
+        self.fail_reset = fail_reset
+        self.current_url = 'https://bank.example/login'
+        self.cdp = []
+        self.visited = []
+        self.quit_called = False
+
+    def execute_script(self, script):
+        pass
+
+    def execute_cdp_cmd(self, command, params):
+        if self.fail_reset:
+            raise RuntimeError('chrome not reachable')
+        self.cdp.append((command, params))
+        if command == 'Page.getFrameTree':
+            return {'frameTree': {
+                'frame': {'url': self.current_url},
+                'childFrames': [
+                    {'frame': {'url': 'https://widgets.example/chat'},
+                     'childFrames': [{'frame': {'url': 'about:blank'}}]},
+                    {'frame': {'url': 'https://bank.example/iframe'}},
+                ],
+            }}
+        return {}
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Factory:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.created = []
+
+    def __call__(self):
+        browser = FakeBrowser(len(self.created), **self.kwargs)
+        self.created.append(browser)
+        return browser
+
+
+def test_browser_is_reused_then_recycled_after_max_pages():
+    factory = Factory()
+    pool = utils.BrowserPool(size=1, max_pages=2, factory=factory)
+
+    used = []
+    for _ in range(3):
+        with pool.browser() as browser:
+            used.append(browser.number)
+
+    assert used == [0, 0, 1]
+    assert factory.created[0].quit_called
+    assert not factory.created[1].quit_called
+
+
+def test_reset_clears_storage_for_page_and_frame_origins():
+    factory = Factory()
+    pool = utils.BrowserPool(size=1, factory=factory)
+
+    with pool.browser():
+        pass
+
+    browser = factory.created[0]
+    cleared = [params['origin'] for command, params in browser.cdp
+               if command == 'Storage.clearDataForOrigin']
+    assert cleared == ['https://bank.example', 'https://widgets.example']
+    assert ('Network.clearBrowserCookies', {}) in browser.cdp
+    assert browser.visited == ['about:blank']
+
+
+def test_browser_is_discarded_when_the_page_load_raises():
+    factory = Factory()
+    pool = utils.BrowserPool(size=1, factory=factory)
+
+    with pytest.raises(TimeoutError):
+        with pool.browser():
+            raise TimeoutError('page hung')
+    with pool.browser() as browser:
+        assert browser.number == 1
+
+    assert factory.created[0].quit_called
+
+
+def test_browser_is_discarded_when_reset_fails():
+    factory = Factory(fail_reset=True)
+    pool = utils.BrowserPool(size=1, factory=factory)
+
+    with pool.browser():
+        pass
+    with pool.browser():
+        pass
+
+    assert len(factory.created) == 2
+    assert factory.created[0].quit_called
+
+
+def test_no_more_than_size_browsers_are_checked_out():
+    factory = Factory()
+    pool = utils.BrowserPool(size=2, factory=factory)
+    release = threading.Event()
+    inside = threading.Semaphore(0)
+    peak, active, lock = [0], [0], threading.Lock()
+
+    def load():
+        with pool.browser():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            inside.release()
+            release.wait(5)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    assert inside.acquire(timeout=5) and inside.acquire(timeout=5)
+    assert not inside.acquire(timeout=0.1)  # the other two are waiting for a slot
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert peak[0] == 2
+    assert len(factory.created) == 2
+
+
+def test_close_quits_idle_browsers():
+    factory = Factory()
+    pool = utils.BrowserPool(size=2, factory=factory)
+    with pool.browser():
+        with pool.browser():
+            pass
+
+    pool.close()
+
+    assert [b.quit_called for b in factory.created] == [True, True]
@@ -0,0 +1,154 @@
+import hashlib
+import threading
+import time
+from io import BytesIO
+
+import pytest
+
+from finaccai import vision_analysis
+from finaccai.inference_cache import InferenceCache
+
+PIL = pytest.importorskip('PIL.Image')
+
+
+class StubCaptioner:
+    """Stands in for the BLIP batcher and records every image it captions."""
+
+    def __init__(self):
+        self.images = []
+
+    def __call__(self, images):
+        self.images.extend(images)
+        return [f'caption {len(self.images) - len(images) + i}' for i in range(len(images))]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = InferenceCache('vision_caption', 'test', lowercase=False)
+    monkeypatch.setattr(vision_analysis, 'get_caption_cache', lambda: cache)
+    monkeypatch.setattr(vision_analysis, 'get_caption_model', lambda: object())
+    return cache
+
+
+@pytest.fixture
+def captioner(monkeypatch, cache):
+    stub = StubCaptioner()
+    monkeypatch.setattr(vision_analysis.caption_batcher, 'map', stub)
+    return stub
+
+
+def _pattern(size=(64, 48)):
+    """A non-flat image, so its average hash is usable."""
+    image = PIL.new('RGB', size, (255, 255, 255))
+    image.paste((0, 0, 0), (0, 0, size[0] // 2, size[1] // 2))
+    image.paste((90, 90, 90), (size[0] // 2, size[1] // 2, size[0], size[1]))
+    return image
+
+
+def _write(path, image, fmt='PNG'):
+    buffer = BytesIO()
+    image.save(buffer, format=fmt)
+    path.write_bytes(buffer.getvalue())
+    return str(path)
+
+
+def test_identical_bytes_hit_the_sha256_key(tmp_path, cache, captioner):
+    first = _write(tmp_path / 'a.png', _pattern())
+    copy = _write(tmp_path / 'copy-on-other-site.png', _pattern())
+
+    assert vision_analysis.caption_images([first], budget=5) == {first: 'caption 0'}
+    digest = hashlib.sha256((tmp_path / 'a.png').read_bytes()).hexdigest()
+    assert cache.get('sha256:' + digest) == {'caption': 'caption 0'}
+    assert cache.get('url:' + first)['key'] == 'sha256:' + digest
+
+    assert vision_analysis.caption_images([copy], budget=5) == {copy: 'caption 0'}
+    assert len(captioner.images) == 1
+
+
+def test_reencoded_copy_hits_the_ahash_key(tmp_path, monkeypatch, cache, captioner):
+    monkeypatch.setattr(vision_analysis, 'PERCEPTUAL_HASH', True)
+    original = _write(tmp_path / 'a.png', _pattern())
+    resized = _write(tmp_path / 'a-small.jpg', _pattern((32, 24)), fmt='JPEG')
+
+    vision_analysis.caption_images([original], budget=5)
+    assert vision_analysis.caption_images([resized], budget=5) == {resized: 'caption 0'}
+
+    assert len(captioner.images) == 1
+    phash = vision_analysis.average_hash(_pattern())
+    assert cache.get('ahash:' + phash) == {'caption': 'caption 0'}
+    # The new exact bytes are remembered too
+    digest = hashlib.sha256((tmp_path / 'a-small.jpg').read_bytes()).hexdigest()
+    assert cache.get('sha256:' + digest) == {'caption': 'caption 0'}
+
+
+def test_flat_images_never_match_by_ahash(tmp_path, monkeypatch, cache, captioner):
+    monkeypatch.setattr(vision_analysis, 'PERCEPTUAL_HASH', True)
+    white = _write(tmp_path / 'white.png', PIL.new('RGB', (64, 48), (255, 255, 255)))
+    grey = _write(tmp_path / 'grey.png', PIL.new('RGB', (64, 48), (128, 128, 128)))
+
+    vision_analysis.caption_images([white], budget=5)
+    vision_analysis.caption_images([grey], budget=5)
+
+    assert len(captioner.images) == 2
+
+
+def test_screenshot_crops_use_the_pixels_key(cache, captioner, monkeypatch):
+    def no_download(src, deadline=None):
+        raise AssertionError(f'{src} should come from the crop')
+
+    monkeypatch.setattr(vision_analysis, 'read_image_checked', no_download)
+    crop = _pattern()
+
+    vision_analysis.caption_images(['https://bank.example/a.png'], budget=5, crops={'https://bank.example/a.png': crop})
+    captions = vision_analysis.caption_images(['https://other.example/b.png'], budget=5,
+                                              crops={'https://other.example/b.png': _pattern()})
+
+    assert captions == {'https://other.example/b.png': 'caption 0'}
+    assert len(captioner.images) == 1
+    key = 'pixels:' + hashlib.sha256(repr(crop.size).encode() + crop.tobytes()).hexdigest()
+    assert cache.get(key) == {'caption': 'caption 0'}
+
+
+def test_recent_url_skips_the_download_until_the_ttl_expires(tmp_path, monkeypatch, cache, captioner):
+    src = _write(tmp_path / 'a.png', _pattern())
+    reads = []
+    real_read = vision_analysis.read_image_checked
+    monkeypatch.setattr(vision_analysis, 'read_image_checked',
+                        lambda s, deadline=None: reads.append(s) or real_read(s, deadline))
+    clock = [1000.0]
+    monkeypatch.setattr(vision_analysis.time, 'time', lambda: clock[0])
+
+    vision_analysis.caption_images([src], budget=5)
+    clock[0] += vision_analysis.URL_TTL - 1
+    assert vision_analysis.caption_images([src], budget=5) == {src: 'caption 0'}
+    assert reads == [src]
+
+    clock[0] += 2
+    assert vision_analysis.caption_images([src], budget=5) == {src: 'caption 0'}
+    assert reads == [src, src]  # re-read after the TTL, but served by the sha256 key
+    assert len(captioner.images) == 1
+
+
+def test_running_downloads_stop_at_the_page_deadline(monkeypatch, cache, captioner):
+    stopped = threading.Event()
+    timeouts = []
+
+    def endless_chunks(url, timeout=None):
+        timeouts.append(timeout)
+        try:
+            while True:
+                time.sleep(0.01)
+                yield b'\0' * 64
+        finally:
+            stopped.set()
+
+    monkeypatch.setattr(vision_analysis, '_iter_image_chunks', endless_chunks)
+
+    started = time.monotonic()
+    assert vision_analysis.caption_images(['https://slow.example/a.png'], budget=0.1) == {}
+    assert time.monotonic() - started < 0.5
+
+    # The worker gives up by itself instead of holding a shared fetch thread
+    assert stopped.wait(1)
+    assert 0 < timeouts[0] <= 0.1
+    assert captioner.images == []
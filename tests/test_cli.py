@@ -0,0 +1,51 @@
+import threading
+import time
+
+import pytest
+
+from finaccai import cli
+
+URLS = [f'https://site{i}.example' for i in range(10)]
+
+
+class StubScan:
+    """Stands in for scan_site: later URLs finish first, one URL raises."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.started = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url, dynamic=False, max_wait=5):
+        with self.lock:
+            self.started += 1
+        time.sleep((len(URLS) - URLS.index(url)) * 0.003)
+        if url in self.failing:
+            raise RuntimeError('parser exploded')
+        return {'url': url, 'title': url, 'error': None, 'issues': {}, 'render_wait': None}
+
+
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_results_keep_input_order_and_a_failure_does_not_stop_the_rest(monkeypatch, concurrency):
+    stub = StubScan(failing={URLS[2]})
+    monkeypatch.setattr(cli, 'scan_site', stub)
+
+    results = list(cli.scan_sites(URLS, concurrency=concurrency))
+
+    assert [r['url'] for r in results] == URLS
+    assert results[2]['error'] == 'RuntimeError: parser exploded'
+    assert results[2]['issues'] == {}
+    assert all(r['error'] is None for i, r in enumerate(results) if i != 2)
+    assert stub.started == len(URLS)
+
+
+def test_at_most_twice_concurrency_urls_are_submitted_ahead(monkeypatch):
+    stub = StubScan()
+    monkeypatch.setattr(cli, 'scan_site', stub)
+    concurrency = 2
+
+    for consumed, result in enumerate(cli.scan_sites(URLS, concurrency=concurrency)):
+        time.sleep(0.02)  # a slow report writer lets every submitted scan start
+        with stub.lock:
+            assert stub.started <= consumed + 2 * concurrency
+    assert stub.started == len(URLS)
@@ -0,0 +1,103 @@
+import itertools
+import threading
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from finaccai import disk_cache, http_client
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing timestamps so LRU order never ties."""
+    ticks = itertools.count(1)
+    monkeypatch.setattr(disk_cache, "time", types.SimpleNamespace(time=lambda: float(next(ticks))))
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path, clock):
+    cache = disk_cache.DiskCache(tmp_path / "cache.sqlite", max_bytes=30)
+    cache.set("a", b"x" * 10)
+    cache.set("b", b"x" * 10)
+    cache.set("c", b"x" * 10)
+    assert cache.get("a") is not None  # "a" is now more recent than "b"
+
+    cache.set("d", b"x" * 10)
+    assert cache.get("b") is None
+    assert {k for k in "acd" if cache.get(k) is not None} == {"a", "c", "d"}
+    assert cache.total_bytes() == 30
+
+    cache.set("huge", b"x" * 31)  # larger than the whole cache: not stored
+    assert cache.get("huge") is None
+    cache.close()
+
+
+def test_hits_do_not_write_until_flushed(tmp_path, clock):
+    path = tmp_path / "cache.sqlite"
+    cache = disk_cache.DiskCache(path, max_bytes=100)
+    cache.set("a", b"1", {"etag": '"v1"'})
+    assert cache.get("a") == (b"1", {"etag": '"v1"'})
+    assert cache._conn.in_transaction is False
+    assert "a" in cache._touched
+    cache.close()
+
+    reopened = disk_cache.DiskCache(path, max_bytes=100)
+    # The recency recorded by the hit survived close()
+    assert reopened._conn.execute("SELECT last_access FROM entries").fetchone()[0] == 2.0
+    reopened.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send(b"<html>etag</html>", {"ETag": '"v1"'})
+        elif self.path == "/no-store":
+            self._send(b"<html>secret</html>", {"ETag": '"v1"', "Cache-Control": "no-store"})
+        else:
+            self._send(b"<html>plain</html>", {})
+
+    def _send(self, body, headers):
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "CACHE_PATH", str(tmp_path / "http_cache.sqlite"))
+    monkeypatch.setattr(http_client, "_cache", None)
+    _Handler.requests_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    http_client.get_cache().close()
+
+
+def test_get_text_revalidates_with_etag(server):
+    assert http_client.get_text(server + "/etag") == "<html>etag</html>"
+    assert http_client.get_text(server + "/etag") == "<html>etag</html>"
+    assert _Handler.requests_seen == [("/etag", None), ("/etag", '"v1"')]
+
+
+def test_get_text_skips_no_store_and_unvalidated_responses(server):
+    for path in ("/no-store", "/plain"):
+        http_client.get_text(server + path)
+        http_client.get_text(server + path)
+        assert http_client.get_cache().get(server + path) is None
+    # Nothing cached, so no conditional headers were sent
+    assert all(etag is None for _, etag in _Handler.requests_seen)
@@ -0,0 +1,83 @@
+from contextlib import contextmanager
+
+import pytest
+
+utils = pytest.importorskip('finaccai.utils')
+
+
+class FakeBrowser:
+    """Answers the readiness probe from a script of (readyState, inflight, idle_ms)."""
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.probes = 0
+        self.visited = []
+        self.screenshots = []
+        self.page_source = '<html><body>rendered</body></html>'
+
+    def execute_script(self, script):
+        assert script == utils._READINESS_PROBE
+        self.probes += 1
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        if isinstance(state, Exception):
+            raise state
+        return list(state)
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def save_screenshot(self, path):
+        self.screenshots.append(path)
+
+
+class FakePool:
+    def __init__(self, browser):
+        self._browser = browser
+
+    @contextmanager
+    def browser(self):
+        yield self._browser
+
+
+def test_probe_ignores_attribute_and_text_mutations():
+    assert 'childList: true' in utils._READINESS_PROBE
+    assert 'attributes' not in utils._READINESS_PROBE
+    assert 'characterData' not in utils._READINESS_PROBE
+
+
+def test_returns_once_the_page_settles():
+    browser = FakeBrowser([
+        RuntimeError('navigating'),
+        ('loading', 0, 0),
+        ('complete', 2, 900),   # requests still in flight
+        ('complete', 0, 100),   # DOM changed recently
+        ('complete', 0, 600),
+    ])
+
+    waited = utils.wait_for_render(browser, max_wait=5, quiet_period=0.5, poll=0.001)
+
+    assert browser.probes == 5
+    assert 0 <= waited < 1
+
+
+def test_gives_up_after_max_wait():
+    browser = FakeBrowser([('complete', 1, 0)])
+
+    waited = utils.wait_for_render(browser, max_wait=0.05, poll=0.005)
+
+    assert 0.05 <= waited < 0.5
+    assert browser.probes > 1
+
+
+def test_load_dynamic_page_returns_html_screenshot_and_wait(monkeypatch):
+    browser = FakeBrowser([('complete', 0, 1000)])
+    monkeypatch.setattr(utils, 'wait_for_render', lambda b, max_wait: 1.25 if b is browser else None)
+
+    html, screenshot_path, render_wait = utils.load_dynamic_page(
+        'https://bank.example', max_wait=3, pool=FakePool(browser))
+
+    assert browser.visited == ['https://bank.example']
+    assert html == browser.page_source
+    assert browser.screenshots == [str(screenshot_path)]
+    assert screenshot_path.parent == utils.SCREENSHOT_DIR
+    assert render_wait == 1.25
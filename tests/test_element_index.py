@@ -0,0 +1,82 @@
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from finaccai.page_context import ElementIndex, PageContext, page_index
+
+PAGE = """
+<html><head><title>Bank</title></head><body>
+  <nav role="navigation" aria-label="Main"><a href="/">Home</a><a href="/pay" id="pay">Pay</a></nav>
+  <main role="main">
+    <h1 id="top">Accounts</h1>
+    <form id="login" aria-describedby="help">
+      <label for="user">User</label><input id="user" name="user" aria-required="true">
+      <label for="pin">PIN</label><label for="pin">Secret PIN</label><input id="pin" type="password">
+      <input id="otp" aria-label="One-time code" aria-required="true">
+      <button type="submit" role="button">Sign in</button>
+      <div role="button" aria-pressed="false" tabindex="0">Remember me</div>
+    </form>
+    <img src="chart.png" id="top"><img src="logo.png" alt="Logo" aria-hidden="true">
+    <table><tr><td>1</td></tr></table>
+  </main>
+</body></html>
+"""
+
+
+@pytest.fixture
+def soup():
+    return BeautifulSoup(PAGE, 'html.parser')
+
+
+def test_by_tag_matches_find_all(soup):
+    index = ElementIndex(soup)
+
+    for name in ('a', 'img', 'input', 'label', 'button', 'table', 'title', 'select'):
+        assert index.tags(name) == soup.find_all(name)
+    assert index.tags('a', 'button', 'input') == soup.find_all(['a', 'button', 'input'])
+
+
+def test_by_id_returns_the_first_element_like_find(soup):
+    index = ElementIndex(soup)
+
+    for tag_id in ('pay', 'user', 'pin', 'top', 'missing'):
+        assert index.get_by_id(tag_id) is soup.find(id=tag_id)
+
+
+def test_labels_for_matches_a_label_scan(soup):
+    index = ElementIndex(soup)
+
+    for tag_id in ('user', 'pin', 'otp'):
+        assert index.labels_for.get(tag_id, []) == soup.find_all('label', attrs={'for': tag_id})
+        assert index.label_for(tag_id) is soup.find('label', attrs={'for': tag_id})
+
+
+def test_by_role_and_by_aria_match_attribute_scans(soup):
+    index = ElementIndex(soup)
+
+    for role in ('navigation', 'main', 'button', 'dialog'):
+        assert index.with_role(role) == soup.find_all(attrs={'role': role})
+    aria_names = {name for tag in soup.find_all(True) for name in tag.attrs if name.startswith('aria-')}
+    assert aria_names == set(index.by_aria)
+    for name in aria_names:
+        assert index.with_aria(name) == soup.find_all(attrs={name: re.compile('.*')})
+
+
+def test_bare_soup_index_is_built_once(soup, monkeypatch):
+    built = []
+    original = ElementIndex.__init__
+
+    def counting_init(self, tree):
+        built.append(tree)
+        original(self, tree)
+
+    monkeypatch.setattr(ElementIndex, '__init__', counting_init)
+
+    # What each rule_checks function does with a bare soup
+    first = page_index(soup)
+    assert page_index(soup) is first
+    assert PageContext(soup).index is first
+    assert page_index(BeautifulSoup(PAGE, 'html.parser')) is not first
+
+    assert len(built) == 2 and built[0] is soup
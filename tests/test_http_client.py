@@ -0,0 +1,46 @@
+import importlib.util
+
+from finaccai import http_client
+
+
+def test_session_pools_connections_per_host():
+    session = http_client.build_session(pool_hosts=5, per_host=3)
+
+    adapter = session.get_adapter('https://bank.example/')
+    assert session.get_adapter('http://bank.example/') is adapter
+    assert adapter._pool_connections == 5
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_block is True
+
+
+def test_session_retries_idempotent_requests_on_transient_statuses():
+    session = http_client.build_session(retries=4, backoff=0.25)
+
+    retry = session.get_adapter('https://bank.example/').max_retries
+    assert (retry.total, retry.connect, retry.read, retry.status) == (4, 4, 4, 4)
+    assert retry.backoff_factor == 0.25
+    assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+    assert retry.allowed_methods == frozenset(['GET', 'HEAD'])
+    assert retry.raise_on_status is False
+
+
+def test_accept_encoding_advertises_installed_decoders():
+    encodings = [e.strip() for e in http_client.build_session().headers['Accept-Encoding'].split(',')]
+
+    assert 'gzip' in encodings and 'deflate' in encodings
+    has_brotli = any(importlib.util.find_spec(m) for m in ('brotli', 'brotlicffi'))
+    assert ('br' in encodings) == has_brotli
+
+
+def test_configure_replaces_and_closes_the_shared_session(monkeypatch):
+    monkeypatch.setattr(http_client, '_session', None)
+    old = http_client.get_session()
+    closed = []
+    monkeypatch.setattr(old, 'close', lambda: closed.append(True))
+
+    new = http_client.configure(per_host=16, retries=0)
+
+    assert http_client.get_session() is new is not old
+    assert closed == [True]
+    assert new.get_adapter('https://x.example/')._pool_maxsize == 16
+    new.close()
@@ -0,0 +1,62 @@
+from io import BytesIO
+
+import pytest
+from bs4 import BeautifulSoup
+
+from finaccai import vision_analysis
+
+PIL = pytest.importorskip('PIL.Image')
+
+
+def _img(markup):
+    return BeautifulSoup(markup, 'html.parser').img
+
+
+@pytest.mark.parametrize('markup, reason', [
+    ('<img src="chart.png" role="presentation">', 'decorative'),
+    ('<img src="chart.png" role="none">', 'decorative'),
+    ('<img src="chart.png" aria-hidden="true">', 'hidden'),
+    ('<img src="https://www.facebook.com/tr?id=1">', 'tracking_pixel'),
+    ('<img src="/img/spacer.gif" width="300" height="20">', 'tracking_pixel'),
+    ('<img src="a.png" width="1" height="1">', 'tracking_pixel'),
+    ('<img src="a.png" width="0">', 'tracking_pixel'),
+    ('<img src="a.png" style="width: 16px; height:16px">', 'small_icon'),
+    ('<img src="a.png" width="24" height="24">', 'small_icon'),
+    ('<img src="a.png" width="24">', None),  # one small side alone is not an icon
+    ('<img src="a.png" width="25" height="24">', None),
+    ('<img src="a.png" width="50%" height="10">', None),
+    ('<img src="photo.jpg" alt="">', None),
+])
+def test_classify_image_from_markup(markup, reason):
+    assert vision_analysis.classify_image(_img(markup)) == reason
+
+
+def _png(width, height):
+    buffer = BytesIO()
+    PIL.new('RGB', (width, height), (200, 30, 30)).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def test_tiny_images_are_dropped_after_the_header(monkeypatch):
+    data = _png(1, 1) + b'\0' * 8192
+    consumed = []
+
+    def chunks(url, timeout=None):
+        for start in range(0, len(data), 64):
+            consumed.append(start)
+            yield data[start:start + 64]
+
+    monkeypatch.setattr(vision_analysis, '_iter_image_chunks', chunks)
+    assert vision_analysis.read_image_checked('pixel.png') == (None, 'tracking_pixel')
+    assert len(consumed) == 1  # stopped at the first chunk holding the header
+
+
+@pytest.mark.parametrize('size, reason', [((16, 16), 'small_icon'), ((200, 100), None)])
+def test_header_size_decides_from_the_file(tmp_path, size, reason):
+    path = tmp_path / 'image.png'
+    path.write_bytes(_png(*size))
+    data, skipped = vision_analysis.read_image_checked(str(path))
+    assert skipped == reason
+    assert (data is None) == (reason is not None)
+    if data is not None:
+        assert vision_analysis.decode_image(data).size == size
@@ -0,0 +1,36 @@
+from finaccai.inference_cache import InferenceCache
+
+
+def test_memory_lru_evicts_least_recently_used():
+    cache = InferenceCache('test', 'v1', memory_items=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1  # "b" is now the least recently used
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['memory_items'] == 2
+
+
+def test_counters_and_disk_fallback(tmp_path):
+    path = tmp_path / 'scores.sqlite'
+    cache = InferenceCache('test', 'v1', memory_items=1, disk_path=path)
+    assert cache.get('Sign in') is None
+    cache.set('Sign in', {'score': 0.9})
+    cache.set('Email', {'score': 0.8})  # pushes "Sign in" out of memory
+
+    assert cache.get('  sign IN ') == {'score': 0.9}  # normalized key, from disk
+    assert cache.get('sign in') == {'score': 0.9}  # now back in memory
+    assert cache.stats() == {
+        'model_version': 'v1',
+        'memory_hits': 1,
+        'disk_hits': 1,
+        'misses': 1,
+        'hit_rate': 0.667,
+        'memory_items': 1,
+    }
+
+    # A new model version never sees the old entries
+    assert InferenceCache('test', 'v2', disk_path=path).get('Sign in') is None
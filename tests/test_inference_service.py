@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from finaccai.inference_service import MicroBatcher, Overloaded
+
+
+def test_concurrent_requests_are_combined_into_batches():
+    batches = []
+
+    def handler(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher("double", handler, max_batch_size=64, max_wait=0.2)
+    results = {}
+
+    def client(n):
+        results[n] = batcher.run([n, n + 100])
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {n: [n * 2, (n + 100) * 2] for n in range(8)}
+    assert len(batches) < 8
+    assert sum(len(b) for b in batches) == 16
+
+
+def test_full_queue_raises_overloaded():
+    release = threading.Event()
+
+    def handler(items):
+        release.wait()
+        return items
+
+    batcher = MicroBatcher("slow", handler, max_batch_size=1, max_wait=0, max_queue=1)
+    first = batcher.submit([1])
+    # The worker holds the first request; give it a moment to dequeue it.
+    for _ in range(100):
+        if batcher.stats()['queued'] == 0:
+            break
+        threading.Event().wait(0.01)
+    second = batcher.submit([2])
+    with pytest.raises(Overloaded):
+        batcher.submit([3], timeout=0.05)
+    release.set()
+    assert first.result(timeout=5) == [1]
+    assert second.result(timeout=5) == [2]
+    assert batcher.stats()['rejected'] == 1
@@ -0,0 +1,29 @@
+import pytest
+
+from finaccai import ml_model
+
+pytestmark = pytest.mark.skipif(
+    not ml_model.SKLEARN_AVAILABLE or not ml_model.CLASSIFIER_PATH.exists(),
+    reason="scikit-learn or models/ml_classifier.pkl not available",
+)
+
+
+def test_predict_batch_matches_predict_proba():
+    np = ml_model.np
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 30, size=(50, len(ml_model.FEATURE_NAMES))).astype(float)
+
+    scores = ml_model.predict_batch(X)
+    model = ml_model.get_classifier()
+    expected = model.predict_proba(X.astype(np.float32))[:, list(model.classes_).index(1)]
+    assert scores.shape == (50,)
+    assert np.allclose(scores, expected)
+    assert np.allclose(ml_model.predict_batch(X[0]), expected[:1])
+
+
+def test_classifier_score_is_labelled_experimental():
+    result = ml_model.predict_issue_from_soup('<html><body><img src="a.png"><input></body></html>')
+
+    assert result['issue_probability'] is not None
+    assert result['model_info'].startswith('🧪 Experimental classifier')
+    assert 'Experimental ML score' in result['statistics']['items'][-1]
@@ -0,0 +1,57 @@
+import os
+import threading
+import time
+
+import pytest
+
+from finaccai import model_loader
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(model_loader, '_registry', {})
+
+
+def test_blocking_warm_up_loads_before_returning():
+    model = model_loader.register('test_model', lambda: 'weights')
+
+    assert model_loader.warm_up(background=False) is None
+    assert model.status == model_loader.READY
+    assert model.get() == 'weights'
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs os.fork')
+def test_child_forked_mid_load_loads_the_model_itself():
+    started, release = threading.Event(), threading.Event()
+
+    def slow_loader():
+        started.set()
+        release.wait()
+        return 'weights'
+
+    model = model_loader.register('test_model', slow_loader)
+    thread = model_loader.warm_up()
+    assert started.wait(5)
+    assert model.status == model_loader.LOADING
+
+    pid = os.fork()
+    if pid == 0:
+        # The warm-up thread (and the lock it holds) was not copied
+        release.set()
+        os._exit(0 if model.get() == 'weights' else 1)
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                break
+            if time.monotonic() > deadline:
+                os.kill(pid, 9)
+                os.waitpid(pid, 0)
+                pytest.fail('child deadlocked on the model lock')
+            time.sleep(0.01)
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    finally:
+        release.set()
+        thread.join(5)
+    assert model.get() == 'weights'
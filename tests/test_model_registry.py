@@ -0,0 +1,26 @@
+import pytest
+
+from finaccai import model_registry
+
+
+def test_record_and_verify(tmp_path):
+    model_dir = tmp_path / "tiny"
+    model_dir.mkdir()
+    (model_dir / "config.json").write_text('{"hidden": 4}')
+    (model_dir / "model.safetensors").write_bytes(b"\x00" * 64)
+
+    entry = model_registry.record("tiny", model_dir, source="org/tiny", version="abc",
+                                  models_dir=tmp_path)
+    assert entry["path"] == "tiny"
+    assert set(entry["files"]) == {"config.json", "model.safetensors"}
+    assert model_registry.verify("tiny", mode="sha256", models_dir=tmp_path) == model_dir
+
+    # A Git LFS pointer in place of the weights is caught by the size check
+    (model_dir / "model.safetensors").write_bytes(b"version https://git-lfs")
+    with pytest.raises(model_registry.ModelNotAvailable):
+        model_registry.verify("tiny", mode="size", models_dir=tmp_path)
+
+
+def test_unregistered_model_is_not_available(tmp_path):
+    with pytest.raises(model_registry.ModelNotAvailable):
+        model_registry.verify("missing", models_dir=tmp_path)
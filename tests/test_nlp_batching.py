@@ -0,0 +1,40 @@
+from finaccai import nlp_analysis
+from finaccai.inference_cache import InferenceCache
+
+
+class FakeSentiment:
+    """Stands in for the transformers pipeline and records every batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts, batch_size=None):
+        self.batches.append(list(texts))
+        return [{'label': 'POSITIVE', 'score': 0.5 + len(t) / 100} for t in texts]
+
+
+def test_batches_deduplicate_and_map_back_to_input_order(monkeypatch):
+    model = FakeSentiment()
+    monkeypatch.setattr(nlp_analysis, 'get_sentiment_analyzer', lambda: model)
+    monkeypatch.setattr(nlp_analysis, '_text_cache', InferenceCache('test', 'v1'))
+
+    texts = ['Transfer money now', 'Sign in', '', 'Email address', 'Sign in', 'sign  IN', 'Email address']
+    results = nlp_analysis.analyze_texts_with_bert(texts, batch_size=2)
+
+    # Each distinct (normalized) text is scored once, shortest first, two per batch
+    assert model.batches == [['Sign in', 'Email address'], ['Transfer money now']]
+    assert results[2] is None
+    assert [r['confidence'] for i, r in enumerate(results) if i != 2] == [
+        0.5 + len('Transfer money now') / 100,
+        0.5 + len('Sign in') / 100,
+        0.5 + len('Email address') / 100,
+        0.5 + len('Sign in') / 100,
+        0.5 + len('Sign in') / 100,
+        0.5 + len('Email address') / 100,
+    ]
+    # Descriptiveness is still computed from each input's own text
+    assert results[5]['descriptiveness'] == nlp_analysis._descriptiveness('sign  IN')
+
+    # A repeat call is served entirely from the text cache
+    assert nlp_analysis.analyze_texts_with_bert(texts, batch_size=2) == results
+    assert len(model.batches) == 2
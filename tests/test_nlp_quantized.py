@@ -0,0 +1,63 @@
+import sys
+import types
+
+import pytest
+
+from finaccai import model_registry, nlp_analysis
+
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+        self.evaluated = False
+
+    def eval(self):
+        self.evaluated = True
+        return self
+
+
+@pytest.fixture
+def fake_transformers(monkeypatch):
+    """Minimal `transformers` so the loader runs without torch."""
+    module = types.ModuleType('transformers')
+    module.AutoModelForSequenceClassification = object()
+    module.AutoTokenizer = object()
+    module.pipeline = lambda task, model, tokenizer, device: {'model': model, 'tokenizer': tokenizer}
+    monkeypatch.setitem(sys.modules, 'transformers', module)
+    monkeypatch.setattr(model_registry, 'load_processor', lambda cls, name: f'tokenizer:{name}')
+    monkeypatch.setattr(nlp_analysis, 'quantize_sentiment_model', lambda model: FakeModel(f'int8({model.name})'))
+    return module
+
+
+def test_prepared_int8_weights_are_used(fake_transformers, monkeypatch):
+    loaded = []
+
+    def load_with(name, load):
+        loaded.append(name)
+        return FakeModel('prepared-int8')
+
+    monkeypatch.setattr(model_registry, 'load_with', load_with)
+    analyzer = nlp_analysis.build_sentiment_pipeline(quantized=True)
+
+    assert loaded == ['nlp_sentiment_int8']
+    assert analyzer['model'].name == 'prepared-int8' and analyzer['model'].evaluated
+    assert analyzer['tokenizer'] == 'tokenizer:nlp_sentiment_int8'
+
+
+def test_missing_int8_weights_fall_back_to_quantizing_fp32(fake_transformers, monkeypatch):
+    def load_with(name, load):
+        raise model_registry.ModelNotAvailable(f'{name} is not in the manifest')
+
+    monkeypatch.setattr(model_registry, 'load_with', load_with)
+    monkeypatch.setattr(model_registry, 'load_model', lambda cls, name: FakeModel(name))
+    analyzer = nlp_analysis.build_sentiment_pipeline(quantized=True)
+
+    assert analyzer['model'].name == 'int8(nlp_sentiment)' and analyzer['model'].evaluated
+    assert analyzer['tokenizer'] == 'tokenizer:nlp_sentiment'
+
+
+def test_int8_scores_use_their_own_cache_version(monkeypatch):
+    monkeypatch.setattr(nlp_analysis, 'QUANTIZED', False)
+    fp32 = nlp_analysis.sentiment_model_version()
+    monkeypatch.setattr(nlp_analysis, 'QUANTIZED', True)
+    assert nlp_analysis.sentiment_model_version() == fp32 + '+int8'
@@ -0,0 +1,49 @@
+from finaccai import nlp_analysis
+from finaccai.inference_cache import InferenceCache
+
+PAGE = """
+<form>
+  <label>Электронная почта</label><input>
+  <label>電子郵件地址</label><input>
+  <label>Click here</label><input>
+  <button>Pay</button>
+</form>
+"""
+
+
+def test_non_latin_labels_escalate_instead_of_failing():
+    for text in ('Электронная почта', '電子郵件地址'):
+        assert nlp_analysis.lexical_score(text)['confidence'] < nlp_analysis.ESCALATE_BELOW
+    # No letters at all is still a confident lexical verdict
+    assert nlp_analysis.lexical_score('*** ???')['quality'] == 'needs_improvement'
+    assert nlp_analysis.lexical_score('Email address')['quality'] == 'good'
+
+
+def test_without_a_loaded_model_no_ai_findings(monkeypatch):
+    monkeypatch.setattr(nlp_analysis, 'ai_available', lambda: True)
+    monkeypatch.setattr(nlp_analysis, 'get_sentiment_analyzer', lambda: None)
+    monkeypatch.setattr(nlp_analysis, '_text_cache', InferenceCache('test', 'v1'))
+
+    findings = nlp_analysis.analyze_text(PAGE)
+    assert not any('Электронная' in f or '電子' in f for f in findings)
+    assert not any('could be clearer' in f for f in findings)
+    # "Click here" is still caught by the lexical tier and the plain check
+    assert findings[0] == 'Found 2 text clarity issues'
+
+
+def test_loaded_model_scores_escalated_labels(monkeypatch):
+    scored = []
+
+    def model(texts, batch_size=None):
+        scored.extend(texts)
+        return [{'label': 'POSITIVE', 'score': 0.99} for _ in texts]
+
+    monkeypatch.setattr(nlp_analysis, 'ai_available', lambda: True)
+    monkeypatch.setattr(nlp_analysis, 'get_sentiment_analyzer', lambda: model)
+    monkeypatch.setattr(nlp_analysis, '_text_cache', InferenceCache('test', 'v1'))
+
+    findings = nlp_analysis.analyze_text(PAGE)
+    assert sorted(scored) == sorted(['Электронная почта', '電子郵件地址'])
+    assert not any('Электронная' in f or '電子' in f for f in findings)
+    assert "⚠️ Button 'Pay' could be clearer - Explain the button's purpose more specifically" in findings
+    assert findings[0] == '🤖 AI found 3 text clarity issues that may confuse users'
@@ -0,0 +1,54 @@
+import pytest
+
+from finaccai import parsing, script
+
+# A well-formed document: conformance is only expected where the HTML is
+# unambiguous, since backends legitimately repair broken markup differently.
+PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Parser conformance</title></head>
+<body>
+<h1>Accounts</h1>
+<h3>Skipped level</h3>
+<img src="logo.png">
+<img src="chart.png" alt="">
+<img src="ok.png" alt="Bank logo">
+<form>
+<label for="acct">Account number</label>
+<input id="acct" type="text">
+<label>Amount <input id="amount" type="text"></label>
+<input id="memo" type="text">
+<input type="submit" value="Send">
+</form>
+<section id="rates"><p>Rates change daily.</p></section>
+<nav id="menu"><h2>Menu</h2><a href="/more">more</a><a href="/x">x</a></nav>
+<p style="color: #777777; background-color: #888888">Hard to read</p>
+<p>Download the PDF or call the API. <abbr>HTML</abbr></p>
+</body>
+</html>
+"""
+
+
+@pytest.mark.parametrize("backend", [b for b in parsing.BACKENDS if b != "html.parser"])
+def test_backends_report_identical_issues(backend):
+    if not parsing.backend_available(backend):
+        pytest.skip(f"{backend} not installed")
+
+    reference = script.run_checks(PAGE, parser="html.parser")
+    assert script.run_checks(PAGE, parser=backend) == reference
+    assert script.run_checks(PAGE, level="AA", parser=backend) == script.run_checks(
+        PAGE, level="AA", parser="html.parser"
+    )
+
+
+def test_reference_page_exercises_every_check():
+    issues = script.run_checks(PAGE, parser="html.parser")
+    for category in ("images_missing_alt", "inputs_missing_label", "low_contrast",
+                     "heading_issues", "language_attributes", "link_context",
+                     "section_headings", "abbreviations"):
+        assert issues[category], category
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        parsing.resolve_parser("not-a-parser")
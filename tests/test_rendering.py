@@ -0,0 +1,23 @@
+import re
+
+from finaccai import rendering, report_generator
+
+
+def test_templates_share_one_environment():
+    assert rendering.get_environment() is rendering.get_environment()
+    assert rendering.get_template("page_report.html") is rendering.get_template("page_report.html")
+
+
+def test_page_report_is_streamed_escaped_and_numbered(tmp_path):
+    issues = {
+        "images": [{"src": "a.png"}, {"src": "b.png"}],
+        "headings": [{"message": "h2 followed by <h4>"}],
+    }
+    path = report_generator.generate_html_report(
+        issues, output_path=tmp_path / "report.html", page_title="<Bank & Co>"
+    )
+    html = path.read_text(encoding="utf-8")
+    assert re.findall(r'class="issue-number">(\d+)<', html) == ["1", "2", "3"]
+    assert "&lt;Bank &amp; Co&gt;" in html
+    assert "h2 followed by &lt;h4&gt;" in html
+    assert "No accessibility issues detected" not in html
@@ -0,0 +1,43 @@
+from finaccai import script
+
+
+def _site(i, error=None, issues=None):
+    return {"url": f"https://example{i}.com", "title": f"Site {i}", "error": error,
+            "issues": issues or {}}
+
+
+def test_report_writer_streams_cards_then_summary(tmp_path):
+    path = tmp_path / "report.html"
+    with script.ReportWriter(path) as report:
+        report.add(_site(1, issues={"images_missing_alt": ["logo.png"], "low_contrast": []}))
+        # Cards are on disk before the report is finished
+        report._file.flush()
+        assert 'class="card"' in path.read_text(encoding="utf-8")
+        report.add(_site(2, error="timeout"))
+        report.add(_site(3, issues={"low_contrast": []}))
+
+    html = path.read_text(encoding="utf-8")
+    assert html.count('class="card"') == 3
+    assert "<strong>Total sites scanned:</strong> 3" in html
+    assert "<strong>Sites with issues:</strong> 1" in html
+    assert "<strong>Sites with errors:</strong> 1" in html
+    assert html.index("Site 3") < html.index('class="summary"')
+    assert html.rstrip().endswith("</html>")
+
+
+def test_sharded_report_writes_pages_and_index(tmp_path):
+    path = tmp_path / "report.html"
+    with script.ShardedReportWriter(str(path), shard_size=2, categories=["low_contrast"]) as report:
+        for i in range(5):
+            report.add(_site(i, issues={"low_contrast": ["#777 on #fff"] * i}))
+
+    pages = sorted(p.name for p in (tmp_path / "report").iterdir())
+    assert pages == ["page-0001.html", "page-0002.html", "page-0003.html"]
+    last = (tmp_path / "report" / "page-0003.html").read_text(encoding="utf-8")
+    assert 'id="site-5"' in last and "page-0002.html" in last and "page-0004.html" not in last
+
+    index = path.read_text(encoding="utf-8")
+    assert 'href="report/page-0002.html#site-3"' in index
+    assert "<td>Low color contrast</td><td>10</td><td>4</td>" in index
+    assert "<strong>Sites with issues:</strong> 4" in index
+    assert 'class="card" id=' not in index
@@ -0,0 +1,96 @@
+from bs4 import BeautifulSoup
+
+from finaccai import script
+
+PAGE = """
+<html><body>
+  <label for="email">Email</label><input id="email">
+  <label>Name <input id="name"><input id="second"></label>
+  <input id="orphan" type="text">
+  <img src="logo.png">
+  <section id="outer"><section id="inner"><h2>Inner</h2></section></section>
+  <aside id="empty"><p>No heading here</p></aside>
+  <h1>Title</h1><h3>Skipped</h3>
+  <p style="color: #777; background-color: #888">Low contrast</p>
+  <a href="/more">more</a>
+  <abbr>HTML</abbr> HTML and CSS
+</body></html>
+"""
+
+
+JARGON_PAGE = (
+    "<html lang='en'><body><h1>Rates</h1><p>" + "savings " * 520
+    + "Our algorithm and framework set the rate.</p></body></html>"
+)
+
+# Outputs of the pre-refactor (one traversal per check) implementation on PAGE,
+# frozen so the single-pass engine is checked against independent expectations.
+EXPECTED = {
+    'images_missing_alt': ['Image with missing/empty alt: <img src="logo.png"/>...'],
+    'inputs_missing_label': [
+        'Input without label/aria-label: <input id="second"/>...',
+        'Input without label/aria-label: <input id="orphan" type="text"/>...',
+    ],
+    'low_contrast': [
+        "Low contrast (AAA Level) (ratio 1.26, needs 7.0:1) for text: 'Low contrast'"
+        " | style='color: #777; background-color: #888'"
+    ],
+    'heading_issues': ["Skipped heading level: <h3> follows <h1> | text='Skipped'"],
+    'language_attributes': ["Missing 'lang' attribute on <html> tag - required for screen readers"],
+    'link_context': [
+        "AAA: Link text 'more' needs context. Link purpose should be clear from text alone"
+        " | href='/more'"
+    ],
+    'section_headings': [
+        "AAA: <aside> element (id='empty') should have a heading to identify its purpose"
+    ],
+    # The old check raised TypeError here; this is the fixed output
+    'abbreviations': [
+        "AAA: <abbr> tag 'HTML' missing title attribute to provide expansion",
+        "AAA: Found potential abbreviations that should use <abbr> tag: CSS",
+    ],
+    'unusual_words': [],
+}
+
+
+def test_run_checks_matches_frozen_outputs():
+    assert script.run_checks(PAGE) == EXPECTED
+
+
+def test_check_functions_match_frozen_outputs():
+    soup = BeautifulSoup(PAGE, 'html.parser')
+    assert script.check_images(soup) == EXPECTED['images_missing_alt']
+    assert script.check_inputs(soup) == EXPECTED['inputs_missing_label']
+    assert script.check_contrast(soup) == EXPECTED['low_contrast']
+    assert script.check_headings(soup) == EXPECTED['heading_issues']
+    assert script.check_link_context(soup) == EXPECTED['link_context']
+    assert script.check_section_headings(soup) == EXPECTED['section_headings']
+
+
+def test_unusual_words_need_a_glossary():
+    assert script.run_checks(JARGON_PAGE)['unusual_words'] == [
+        "AAA: Page contains technical terms (algorithm, framework...) but no glossary or"
+        " definitions. Consider adding a glossary for unusual words."
+    ]
+    with_glossary = JARGON_PAGE.replace("<h1>", "<dl class='glossary'><dt>APR</dt></dl><h1>")
+    assert script.run_checks(with_glossary)['unusual_words'] == []
+    assert script.run_checks(with_glossary)['language_attributes'] == []
+
+
+def test_single_pass_containment():
+    issues = script.run_checks(PAGE)
+
+    # Only the first input wrapped by a label counts as labelled
+    assert len(issues['inputs_missing_label']) == 2
+    assert 'id="second"' in issues['inputs_missing_label'][0]
+    # A heading in a nested section also satisfies the outer section
+    assert issues['section_headings'] == [
+        "AAA: <aside> element (id='empty') should have a heading to identify its purpose"
+    ]
+    assert issues['abbreviations'][-1].endswith('<abbr> tag: CSS')
+
+
+def test_aa_level_skips_aaa_rules():
+    assert set(script.run_checks(PAGE, level='AA')) == {
+        'images_missing_alt', 'inputs_missing_label', 'low_contrast', 'heading_issues'
+    }
@@ -0,0 +1,102 @@
+import base64
+from io import BytesIO
+
+import pytest
+from bs4 import BeautifulSoup
+
+from finaccai import vision_analysis
+
+PIL = pytest.importorskip('PIL.Image')
+
+RED, BLUE = (200, 30, 30), (30, 30, 200)
+
+
+def _images(*srcs):
+    markup = ''.join(f'<img src="{src}">' for src in srcs)
+    return BeautifulSoup(markup, 'html.parser').find_all('img')
+
+
+def _screenshot(size, *rects):
+    """Base64 PNG of a white page with (box, colour) rectangles painted on it."""
+    shot = PIL.new('RGB', size, (255, 255, 255))
+    for (x, y, w, h), colour in rects:
+        shot.paste(colour, (x, y, x + w, y + h))
+    buffer = BytesIO()
+    shot.save(buffer, format='PNG')
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+def _box(index, src, x, y, w, h):
+    return {'index': index, 'src': src, 'x': x, 'y': y, 'width': w, 'height': h}
+
+
+def _colours(crop):
+    return {colour for _, colour in crop.getcolors()}
+
+
+def test_boxes_match_images_by_index_then_src():
+    shot = _screenshot((300, 200), ((10, 10, 60, 40), RED), ((100, 50, 80, 60), BLUE))
+    images = _images('a.png', 'b.png', 'c.png')
+    boxes = [
+        _box(0, 'a.png', 10, 10, 60, 40),
+        # Index points at a different image (the DOM changed): matched by src
+        _box(0, 'b.png', 100, 50, 80, 60),
+    ]
+
+    crops = vision_analysis.crop_images_from_screenshot(shot, boxes, images)
+
+    assert set(crops) == {'a.png', 'b.png'}
+    assert crops['a.png'].size == (60, 40) and _colours(crops['a.png']) == {RED}
+    assert crops['b.png'].size == (80, 60) and _colours(crops['b.png']) == {BLUE}
+
+
+def test_only_limits_the_crops():
+    shot = _screenshot((300, 200))
+    boxes = [_box(0, 'a.png', 10, 10, 60, 40), _box(1, 'b.png', 100, 50, 80, 60)]
+
+    crops = vision_analysis.crop_images_from_screenshot(
+        shot, boxes, _images('a.png', 'b.png'), only={'b.png'})
+
+    assert set(crops) == {'b.png'}
+
+
+def test_images_mostly_outside_the_screenshot_are_not_cropped():
+    shot = _screenshot((300, 200))
+    boxes = [
+        _box(0, 'inside.png', 0, 105, 100, 100),   # 95% inside: clipped crop
+        _box(1, 'clipped.png', 0, 120, 100, 100),  # 80% inside
+        _box(2, 'below.png', 0, 400, 100, 100),    # below the fold
+    ]
+
+    crops = vision_analysis.crop_images_from_screenshot(
+        shot, boxes, _images('inside.png', 'clipped.png', 'below.png'))
+
+    assert set(crops) == {'inside.png'}
+    assert crops['inside.png'].size == (100, 95)
+
+
+def test_boxes_are_scaled_by_device_pixel_ratio():
+    shot = _screenshot((400, 200), ((20, 20, 80, 60), RED))
+    boxes = [_box(0, 'a.png', 10, 10, 40, 30)]
+
+    crops = vision_analysis.crop_images_from_screenshot(
+        shot, boxes, _images('a.png'), device_pixel_ratio=2)
+
+    assert crops['a.png'].size == (80, 60)
+    assert _colours(crops['a.png']) == {RED}
+
+
+def test_small_rendered_boxes_are_skipped_with_a_reason():
+    shot = _screenshot((300, 200))
+    boxes = [
+        _box(0, 'pixel.gif', 5, 5, 1, 1),
+        _box(1, 'icon.svg', 20, 20, 24, 24),
+        _box(2, 'photo.jpg', 60, 20, 100, 80),
+    ]
+    skipped = {}
+
+    crops = vision_analysis.crop_images_from_screenshot(
+        shot, boxes, _images('pixel.gif', 'icon.svg', 'photo.jpg'), skipped=skipped)
+
+    assert set(crops) == {'photo.jpg'}
+    assert skipped == {'pixel.gif': 'tracking_pixel', 'icon.svg': 'small_icon'}